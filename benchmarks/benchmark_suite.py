@@ -0,0 +1,190 @@
+"""
+Benchmark suite of the simulator, run headless, writing its results as JSON so they can be compared across versions.
+It measures:
+- the physics frames per second of config_small, config_large and the generated cosc343 tile world, with the robot
+  driving in arcs and its sensors only evaluated on request, as in lockstep mode;
+- the microseconds per query of each type of sensor of the large robot in config_large;
+- the microseconds to accept a motor command in the MessageProcessor;
+- the request/response round trips per second of a ClientSocket to a headless simulator running in real time.
+
+Run from the root of the repository with: python benchmarks/benchmark_suite.py -o results.json
+"""
+
+import argparse
+import contextlib
+import datetime
+import json
+import os
+import platform
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+# pylint: disable=wrong-import-position
+from ev3dev2simulator.config.config import load_config, get_world_config
+from ev3dev2simulator.connection.client_socket import ClientSocket, PORT_ENVIRONMENT_VARIABLE
+from ev3dev2simulator.connection.message.rotate_command import RotateCommand
+from ev3dev2simulator.connection.server_sockets import ServerSockets
+from ev3dev2simulator.simulator import expand_cosc343_tiles
+from ev3dev2simulator.state.headless_runner import HeadlessRunner
+from ev3dev2simulator.state.message_processor import MessageProcessor
+from ev3dev2simulator.state.sim_clock import SimClock
+from ev3dev2simulator.state.world_simulator import WorldSimulator
+from ev3dev2simulator.state.world_state import WorldState
+from ev3dev2simulator.version import __version__ as sim_version
+
+TILE_WORLD = 'cosc343_tiles'
+WORLDS = ['config_small', 'config_large', TILE_WORLD]
+SENSOR_TYPES = ['ColorSensor', 'UltrasonicSensor', 'TouchSensor', 'UltrasonicSensorBottom']
+
+
+def create_world(world: str) -> (WorldSimulator, HeadlessRunner):
+    """
+    Create a headless world in lockstep mode. The cosc343 tile world is generated from config_large with the robot
+    on the start tile.
+    """
+    load_config('config_large' if world == TILE_WORLD else world)
+    config = get_world_config()
+    if world == TILE_WORLD:
+        config = dict(config)
+        config['obstacles'] = list(config['obstacles']) + [{'type': 'tiles'}]
+        config['robots'] = [{**config['robots'][0], 'center_x': 1, 'center_y': 7}]
+    expand_cosc343_tiles(config)
+    world_simulator = WorldSimulator(WorldState(config), SimClock(lockstep=True))
+    return world_simulator, HeadlessRunner(world_simulator)
+
+
+def drive(world_simulator: WorldSimulator, left_speed: float, right_speed: float):
+    """
+    Let the wheels of the first robot rotate at the given speeds, in degrees per second, for ten seconds.
+    """
+    robot_sim = world_simulator.robot_simulators[0]
+    processor = MessageProcessor(robot_sim.robot.get_bricks()[0].brick, robot_sim)
+    for address, actuator in robot_sim.actuator_info.items():
+        if actuator.ev3type == 'motor' and address[0] == processor.brick_id:
+            speed = left_speed if actuator.x_offset < 0 else right_speed
+            processor.process_rotate_command(RotateCommand(address[1], speed, speed * 10, 'hold'))
+
+
+def measure_frames(world: str, frames: int) -> float:
+    """
+    Measure the frames per second of a world with the robot driving in arcs.
+    """
+    world_simulator, _ = create_world(world)
+    start = time.perf_counter()
+    for frame in range(frames):
+        if frame % 600 == 0:
+            drive(world_simulator, 400, 200)
+        elif frame % 600 == 300:
+            drive(world_simulator, 200, 400)
+        world_simulator.update()
+    return frames / (time.perf_counter() - start)
+
+
+def measure_sensors(queries: int) -> dict:
+    """
+    Measure the microseconds per query of each type of sensor of the robot of config_large.
+    """
+    world_simulator, _ = create_world('config_large')
+    world_simulator.update()
+    sensors = {}
+    for sensor in world_simulator.world_state.robots[0].get_sensors():
+        sensors.setdefault(type(sensor).__name__, sensor)
+
+    results = {}
+    for sensor_type in SENSOR_TYPES:
+        sensor = sensors[sensor_type]
+        start = time.perf_counter()
+        for _ in range(queries):
+            sensor.get_latest_value()
+        results[sensor_type] = (time.perf_counter() - start) / queries * 1e6
+    return results
+
+
+def measure_motor_commands(commands: int) -> float:
+    """
+    Measure the microseconds the MessageProcessor takes to accept a rotate command.
+    """
+    world_simulator, _ = create_world('config_small')
+    robot_sim = world_simulator.robot_simulators[0]
+    processor = MessageProcessor(robot_sim.robot.get_bricks()[0].brick, robot_sim)
+    command = RotateCommand('ev3-ports:outA', 500, 100, 'hold')
+    start = time.perf_counter()
+    for _ in range(commands):
+        processor.process_rotate_command(command)
+    return (time.perf_counter() - start) / commands * 1e6
+
+
+def measure_round_trips(duration: float) -> float:
+    """
+    Measure the round trips per second of rotate commands waiting for their response, sent by a ClientSocket
+    to a headless simulator running in real time.
+    """
+    load_config('config_small')
+    world_simulator = WorldSimulator(WorldState(get_world_config()))
+    runner = HeadlessRunner(world_simulator)
+    server = ServerSockets(world_simulator, 0)
+    server.setDaemon(True)
+    server.start()
+    server.listening.wait()
+    runner_thread = threading.Thread(target=runner.run, daemon=True)
+    runner_thread.start()
+
+    os.environ[PORT_ENVIRONMENT_VARIABLE] = str(server.port)
+    client = ClientSocket()
+    command = RotateCommand('ev3-ports:outA', 100, 10, 'hold')
+    count = 0
+    start = time.perf_counter()
+    end = start + duration
+    while time.perf_counter() < end:
+        client.send_command(command, True)
+        count += 1
+    round_trips = count / (time.perf_counter() - start)
+
+    client.client.close()
+    runner.stop()
+    runner_thread.join()
+    server.stop()
+    server.join()
+    return round_trips
+
+
+def run_suite(frames: int, queries: int, duration: float) -> dict:
+    """
+    Run all benchmarks.
+    :return: dictionary with the results and a description of the environment they were measured in.
+    """
+    return {
+        'version': sim_version,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+        'frames_per_second': {world: measure_frames(world, frames) for world in WORLDS},
+        'sensor_query_us': measure_sensors(queries),
+        'motor_command_us': measure_motor_commands(queries),
+        'round_trips_per_second': measure_round_trips(duration),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('-o', '--output', help='JSON file to write the results to, printed if not given')
+    parser.add_argument('-f', '--frames', type=int, default=3000, help='frames to simulate per world')
+    parser.add_argument('-q', '--queries', type=int, default=5000, help='queries per sensor type and motor commands')
+    parser.add_argument('-d', '--duration', type=float, default=3.0, help='seconds to measure round trips')
+    args = parser.parse_args()
+
+    # the simulator reports connections on stdout, which is reserved for the results
+    with contextlib.redirect_stdout(sys.stderr):
+        results = run_suite(args.frames, args.queries, args.duration)
+    if args.output:
+        with open(args.output, 'w') as stream:
+            json.dump(results, stream, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark of the steps per second of the Env, or of a VectorEnv with several worlds, on a world.
+The robot drives in alternating arcs with one frame per step, and the environment is reset whenever it falls.
+Each step evaluates all sensors of the robot, so the result is the throughput seen by a learning controller.
+With --envs the steps of all worlds of a VectorEnv are counted, optionally divided over --processes workers.
+
+Run from the root of the repository with: python benchmarks/env_benchmark.py
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+# pylint: disable=wrong-import-position
+from ev3dev2simulator.env.env import Env
+from ev3dev2simulator.env.vector_env import VectorEnv
+
+
+def measure(env: Env, steps: int) -> dict:
+    """
+    Step the environment the given number of times.
+    :return: dictionary with the measured values.
+    """
+    env.reset(0)
+    resets = 0
+    start = time.perf_counter()
+    for step in range(steps):
+        action = (300, 100) if step % 200 < 100 else (100, 300)
+        _, _, done, _ = env.step(action)
+        if done:
+            env.reset()
+            resets += 1
+    duration = time.perf_counter() - start
+    return {
+        'steps_per_second': steps / duration,
+        'resets': resets,
+    }
+
+
+def measure_vector(vector_env: VectorEnv, steps: int) -> dict:
+    """
+    Step all worlds of the vector environment together until the given number of steps of all worlds is reached.
+    :return: dictionary with the measured values.
+    """
+    vector_env.reset(0)
+    resets = 0
+    start = time.perf_counter()
+    for step in range(steps // vector_env.num_envs):
+        action = (300, 100) if step % 200 < 100 else (100, 300)
+        _, _, dones, _ = vector_env.step([action] * vector_env.num_envs)
+        resets += int(dones.sum())
+    duration = time.perf_counter() - start
+    return {
+        'steps_per_second': steps // vector_env.num_envs * vector_env.num_envs / duration,
+        'resets': resets,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('-w', '--world', default='config_small', help='world configuration to step')
+    parser.add_argument('-s', '--steps', type=int, default=20000, help='number of steps to measure')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='number of measurements')
+    parser.add_argument('-n', '--envs', type=int, default=0, help='number of worlds of a VectorEnv, 0 for an Env')
+    parser.add_argument('-p', '--processes', type=int, default=0, help='worker processes of the VectorEnv')
+    args = parser.parse_args()
+
+    if args.envs > 0:
+        env = VectorEnv(args.envs, args.world, processes=args.processes)
+    else:
+        env = Env(args.world)
+    print(f'{"run":>3} {"steps/s":>9} {"resets":>7}')
+    for run in range(args.repeat):
+        result = measure_vector(env, args.steps) if args.envs > 0 else measure(env, args.steps)
+        print(f'{run:>3} {result["steps_per_second"]:>9.0f} {result["resets"]:>7}')
+    if args.envs > 0:
+        env.close()
+
+
+if __name__ == '__main__':
+    main()
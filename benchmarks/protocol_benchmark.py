@@ -0,0 +1,100 @@
+"""
+Benchmark of the wire protocol between the ev3dev2 mock and the simulator, comparing the length prefixed binary
+protocol with the former protocol of JSON messages padded with '#' to 256 bytes.
+A client sends data requests and rotate commands over a local socket pair to a thread answering them,
+the number of round trips per second is printed per protocol.
+
+Run from the root of the repository with: python benchmarks/protocol_benchmark.py
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+# pylint: disable=wrong-import-position
+from ev3dev2simulator.connection import wire_protocol
+from ev3dev2simulator.connection.message.data_request import DataRequest
+from ev3dev2simulator.connection.message.rotate_command import RotateCommand
+
+LEGACY_MESSAGE_SIZE = 256
+LEGACY_RESPONSE_SIZE = 32
+
+MESSAGES = [DataRequest('ev3-ports:in4'), RotateCommand('ev3-ports:outA', 500.0, 100.0, 'hold')]
+
+
+def legacy_client(sock: socket.socket, message) -> object:
+    data = json.dumps(message.serialize()).ljust(LEGACY_MESSAGE_SIZE, '#')
+    sock.send(data.encode())
+    return json.loads(sock.recv(LEGACY_RESPONSE_SIZE).decode())['value']
+
+
+def legacy_server(sock: socket.socket):
+    while True:
+        data = sock.recv(LEGACY_MESSAGE_SIZE)
+        if not data:
+            return
+        obj_dict = json.loads(data.decode().replace('#', ''))
+        value = 2550 if obj_dict['type'] == 'DataRequest' else 0.2
+        sock.send(json.dumps({'value': value}).encode())
+
+
+def framed_client(sock: socket.socket, message) -> object:
+    sock.sendall(wire_protocol.encode_message(message.serialize()))
+    return wire_protocol.decode_response(wire_protocol.receive_frame(sock))
+
+
+def framed_server(sock: socket.socket):
+    while True:
+        data = wire_protocol.receive_frame(sock)
+        if data is None:
+            return
+        obj_dict = wire_protocol.decode_message(data)
+        value = 2550 if obj_dict['type'] == 'DataRequest' else 0.2
+        sock.sendall(wire_protocol.encode_response(value))
+
+
+def measure(client, server, count: int) -> float:
+    """
+    Measure the number of round trips per second of a protocol.
+    :param client: function sending a message and returning the response.
+    :param server: function answering messages until the socket is closed.
+    :param count: number of round trips.
+    :return: the number of round trips per second.
+    """
+    client_sock, server_sock = socket.socketpair()
+    thread = threading.Thread(target=server, args=(server_sock,), daemon=True)
+    thread.start()
+
+    start = time.perf_counter()
+    for i in range(count):
+        client(client_sock, MESSAGES[i % len(MESSAGES)])
+    elapsed = time.perf_counter() - start
+
+    client_sock.close()
+    thread.join()
+    server_sock.close()
+    return count / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('-n', '--count', type=int, default=20000, help='number of round trips per protocol')
+    args = parser.parse_args()
+
+    for name, client, server in [('padded json', legacy_client, legacy_server),
+                                 ('framed binary', framed_client, framed_server)]:
+        print(f'{name:>14}: {measure(client, server, args.count):10.0f} messages/s')
+
+    for message in MESSAGES:
+        size = len(wire_protocol.encode_message(message.serialize()))
+        print(f'{type(message).__name__}: {LEGACY_MESSAGE_SIZE} bytes padded json, {size} bytes framed binary')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+"""
+Scaling benchmark of the simulator server with 1 to 100 simulated bricks.
+A headless world with one small robot per brick runs in real time while a client per brick connects,
+subscribes to its color sensor and sends motor commands as fast as it can for a fixed time.
+Per number of bricks the time to connect all bricks, the commands per second over all bricks,
+the frames per second the world reached and the number of threads of the server are printed.
+The connect time includes loading the configuration in every client, which a brick process only does once.
+
+Run from the root of the repository with: python benchmarks/server_benchmark.py
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+# pylint: disable=wrong-import-position
+from ev3dev2simulator.config.config import load_config, get_world_config
+from ev3dev2simulator.connection.client_socket import ClientSocket, PORT_ENVIRONMENT_VARIABLE
+from ev3dev2simulator.connection.message.rotate_command import RotateCommand
+from ev3dev2simulator.connection.server_sockets import ServerSockets
+from ev3dev2simulator.state.headless_runner import HeadlessRunner
+from ev3dev2simulator.state.world_simulator import WorldSimulator
+from ev3dev2simulator.state.world_state import WorldState
+
+ROBOTS_PER_ROW = 10
+
+
+def create_world(bricks: int) -> WorldSimulator:
+    """
+    Create a world with the given number of small robots, each having a single brick.
+    """
+    load_config('config_small')
+    config = dict(get_world_config())
+    template = config['robots'][0]
+    config['robots'] = [{**template, 'name': f'robot{index}',
+                         'center_x': 100 + 100 * (index % ROBOTS_PER_ROW),
+                         'center_y': 100 + 70 * (index // ROBOTS_PER_ROW)} for index in range(bricks)]
+    config['obstacles'] = []
+    return WorldSimulator(WorldState(config))
+
+
+def run_client(client: ClientSocket, duration: float, counts: list, index: int):
+    """
+    Send motor commands until the duration has passed, reading the subscribed sensor in between.
+    """
+    command = RotateCommand('ev3-ports:outA', 100, 10, 'hold')
+    end = time.perf_counter() + duration
+    count = 0
+    while time.perf_counter() < end:
+        client.send_command(command, True)
+        client.sensor_cache.get('ev3-ports:in2')
+        count += 1
+    counts[index] = count
+
+
+def measure(bricks: int, duration: float) -> dict:
+    """
+    Measure the server with the given number of bricks.
+    :return: dictionary with the measured values.
+    """
+    world_simulator = create_world(bricks)
+    runner = HeadlessRunner(world_simulator)
+    server = ServerSockets(world_simulator, 0)
+    server.setDaemon(True)
+    server.start()
+    server.listening.wait()
+    runner_thread = threading.Thread(target=runner.run, daemon=True)
+    runner_thread.start()
+
+    os.environ[PORT_ENVIRONMENT_VARIABLE] = str(server.port)
+    start = time.perf_counter()
+    clients = [ClientSocket() for _ in range(bricks)]
+    for client in clients:
+        client.subscribe_sensor('ev3-ports:in2')
+    connect_time = time.perf_counter() - start
+
+    counts = [0] * bricks
+    threads = [threading.Thread(target=run_client, args=(client, duration, counts, index))
+               for index, client in enumerate(clients)]
+    frames = runner.frames
+    for thread in threads:
+        thread.start()
+    thread_count = threading.active_count()
+    for thread in threads:
+        thread.join()
+    frames = runner.frames - frames
+
+    for client in clients:
+        client.client.close()
+    runner.stop()
+    runner_thread.join()
+    server.stop()
+    server.join()
+
+    # the clients and their receiving threads live in this process too, they are not part of the server
+    return {
+        'connect_time': connect_time,
+        'commands_per_second': sum(counts) / duration,
+        'frames_per_second': frames / duration,
+        'threads': thread_count - 2 * bricks,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('-b', '--bricks', type=int, nargs='+', default=[1, 10, 25, 50, 100],
+                        help='numbers of bricks to measure')
+    parser.add_argument('-d', '--duration', type=float, default=3.0, help='seconds to send commands per measurement')
+    args = parser.parse_args()
+
+    print(f'{"bricks":>6} {"connect s":>10} {"commands/s":>11} {"frames/s":>9} {"server threads":>15}')
+    for bricks in args.bricks:
+        result = measure(bricks, args.duration)
+        print(f'{bricks:>6} {result["connect_time"]:>10.3f} {result["commands_per_second"]:>11.0f} '
+              f'{result["frames_per_second"]:>9.1f} {result["threads"]:>15}')
+
+
+if __name__ == '__main__':
+    main()
@@ -24,7 +24,7 @@
 # -----------------------------------------------------------------------------
 import _thread
 from collections import OrderedDict
-from time import sleep
+import time
 
 from ev3dev2 import Device
 from ev3dev2._platform.ev3 import LEDS, LED_GROUPS, LED_COLORS, LED_DEFAULT_COLOR
@@ -356,7 +356,7 @@ class Leds(object):
                     break
 
                 even = not even
-                sleep(sleeptime)
+                time.sleep(sleeptime)
 
             self.animate_thread_stop = False
             self.animate_thread_id = None
@@ -403,7 +403,7 @@ class Leds(object):
                     break
 
                 even = not even
-                sleep(sleeptime)
+                time.sleep(sleeptime)
 
             self.animate_thread_stop = False
             self.animate_thread_id = None
@@ -453,7 +453,7 @@ class Leds(object):
                 if self.animate_thread_stop or stopwatch.value_ms >= duration_ms:
                     break
 
-                sleep(sleeptime)
+                time.sleep(sleeptime)
 
             self.animate_thread_stop = False
             self.animate_thread_id = None
@@ -532,7 +532,7 @@ class Leds(object):
                 if self.animate_thread_stop or stopwatch.value_ms >= duration_ms:
                     break
 
-                sleep(sleeptime)
+                time.sleep(sleeptime)
 
             self.animate_thread_stop = False
             self.animate_thread_id = None
@@ -7,14 +7,14 @@ from ev3dev2 import is_micropython
 if is_micropython():
     import utime
 else:
-    import datetime as dt
+    import time
 
 
 def get_ticks_ms():
     if is_micropython():
         return utime.ticks_ms()
     else:
-        return int(dt.datetime.timestamp(dt.datetime.now()) * 1000)
+        return int(time.time() * 1000)
 
 
 class StopWatch(object):
@@ -0,0 +1,10 @@
+"""
+Main file of the batch runner, used when running python -m ev3dev2simulator.batch.
+"""
+
+import sys
+
+from ev3dev2simulator.batch.batch_runner import main
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
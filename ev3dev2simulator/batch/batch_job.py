@@ -0,0 +1,265 @@
+"""
+The batch_job module contains the class BatchJob, describing the evaluation of one robot program in one world,
+and the function run_job, which performs this evaluation in the calling process.
+"""
+
+import contextlib
+import os
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from typing import Optional, Tuple
+
+from ev3dev2simulator.batch.batch_recorder import BatchRecorder
+from ev3dev2simulator.batch.program import run_program, SEED_ENVIRONMENT_VARIABLE
+from ev3dev2simulator.config.config import load_config, get_world_config
+from ev3dev2simulator.connection.client_socket import PORT_ENVIRONMENT_VARIABLE, set_client_socket
+from ev3dev2simulator.connection.direct_client_socket import DirectClientSocket
+from ev3dev2simulator.connection.server_sockets import ServerSockets
+from ev3dev2simulator.simulator import expand_cosc343_tiles
+from ev3dev2simulator.state.command_log import CommandLog
+from ev3dev2simulator.state.headless_runner import HeadlessRunner
+from ev3dev2simulator.state.sim_clock import SimClock
+from ev3dev2simulator.state.telemetry_recorder import TelemetryRecorder
+from ev3dev2simulator.state.world_simulator import WorldSimulator
+from ev3dev2simulator.state.world_state import WorldState
+
+PROGRAM_MODULE = 'ev3dev2simulator.batch.program'
+
+# directory containing the ev3dev2 and ev3dev2simulator packages, needed by the program when not installed
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+# seconds to wait for an in-process program to notice the end of the simulation
+STOP_TIMEOUT = 1.0
+
+
+class BatchJob:  # pylint: disable=too-few-public-methods
+    """
+    Class describing a robot program to run in a world configuration, together with its limits.
+    The simulated timeout limits the simulated time, the wall timeout limits the time the job may take,
+    which stops programs that never sleep.
+    An in-process job runs the program on a thread of the simulator process instead of in a separate process,
+    so its messages are passed to the simulator without a socket.
+    The random generators of the program are seeded with the seed of the job, and the commands of the program are
+    written to the command log file, if given, from which the run can be replayed without the program.
+    Every simulated frame is recorded in the telemetry file, if given.
+    """
+
+    def __init__(self,  # pylint: disable=too-many-arguments
+                 name: str, program: str, world: str, sim_timeout: float, wall_timeout: float,
+                 trace_interval: float, orig_path: str = None, log_file: str = None, in_process: bool = False,
+                 seed: int = 0, command_log_file: str = None, telemetry_file: str = None):
+        self.name = name
+        self.program = program
+        self.world = world
+        self.sim_timeout = sim_timeout
+        self.wall_timeout = wall_timeout
+        self.trace_interval = trace_interval
+        self.orig_path = orig_path
+        self.log_file = log_file
+        self.in_process = in_process
+        self.seed = seed
+        self.command_log_file = command_log_file
+        self.telemetry_file = telemetry_file
+
+    def serialize(self) -> dict:
+        """
+        Serialize the description of the job.
+        """
+        return {
+            'name': self.name,
+            'program': self.program,
+            'world': self.world,
+            'sim_timeout': self.sim_timeout,
+            'wall_timeout': self.wall_timeout,
+            'seed': self.seed,
+        }
+
+
+def run_job(job: BatchJob) -> dict:
+    """
+    Run the program of the job against a headless simulator in lockstep mode, listening on a free port unless
+    the job runs in-process. The output of the simulator is suppressed, the output of the program is written to
+    the log file of the job.
+    :param job: to run.
+    :return: dictionary with the serialized job, its status and the results recorded per robot.
+    """
+    result = job.serialize()
+    start = time.monotonic()
+    try:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            result.update(_simulate(job))
+    except Exception as exception:  # pylint: disable=broad-except
+        result['status'] = 'error'
+        result['error'] = f'{type(exception).__name__}: {exception}'
+    result['wall_time'] = time.monotonic() - start
+    return result
+
+
+def create_world_simulator(world: str, orig_path: str = None) -> WorldSimulator:
+    """
+    Create the simulator of a world in lockstep mode, as used by batch jobs.
+    :param world: name or path of the world configuration.
+    :param orig_path: directory a relative path of the world is relative to.
+    """
+    load_config(world, orig_path)
+    config = get_world_config()
+    expand_cosc343_tiles(config)
+    return WorldSimulator(WorldState(config), SimClock(lockstep=True))
+
+
+def _simulate(job: BatchJob) -> dict:
+    world_simulator = create_world_simulator(job.world, job.orig_path)
+    runner = HeadlessRunner(world_simulator)
+    recorder = BatchRecorder(world_simulator, job.trace_interval)
+    command_log = CommandLog()
+    world_simulator.set_command_log(command_log)
+    telemetry_recorder = None
+    if job.telemetry_file:
+        telemetry_recorder = TelemetryRecorder(world_simulator, job.telemetry_file)
+        world_simulator.set_telemetry_recorder(telemetry_recorder)
+
+    try:
+        with open(job.log_file or os.devnull, 'w') as log:
+            if job.in_process:
+                wall_timeout, sim_timeout, return_code = _run_in_process(job, world_simulator, runner, recorder, log)
+            else:
+                wall_timeout, sim_timeout, return_code = _run_in_subprocess(job, world_simulator, runner, recorder,
+                                                                            log)
+    finally:
+        if telemetry_recorder is not None:
+            telemetry_recorder.close()
+
+    if wall_timeout:
+        status = 'wall_timeout'
+    elif sim_timeout:
+        status = 'sim_timeout'
+    elif return_code == 0:
+        status = 'finished'
+    else:
+        status = 'failed'
+
+    trajectory_hash = recorder.trajectory_hash.hexdigest()
+    if job.command_log_file:
+        command_log.save(job.command_log_file, {'world': job.world, 'orig_path': job.orig_path,
+                                                'frames': runner.frames, 'trajectory_hash': trajectory_hash})
+
+    return {
+        'status': status,
+        'return_code': return_code,
+        'sim_time': world_simulator.clock.time,
+        'frames': runner.frames,
+        'trajectory_hash': trajectory_hash,
+        'robots': recorder.serialize(),
+    }
+
+
+def _run_in_subprocess(job: BatchJob, world_simulator: WorldSimulator, runner: HeadlessRunner,
+                       recorder: BatchRecorder, log) -> Tuple[bool, bool, int]:
+    """
+    Run the program in a separate process connecting to a server on a free port.
+    :return: whether the wall timeout and the simulated timeout were reached, and the return code of the program.
+    """
+    server = ServerSockets(world_simulator, 0)
+    server.setDaemon(True)
+    server.start()
+    server.listening.wait()
+
+    program = subprocess.Popen([sys.executable, '-m', PROGRAM_MODULE, job.program],
+                               env=_program_environment(server.port, job.seed), stdout=log, stderr=subprocess.STDOUT)
+
+    wall_timeout = threading.Event()
+
+    def watch_program():
+        try:
+            program.wait(job.wall_timeout)
+        except subprocess.TimeoutExpired:
+            wall_timeout.set()
+        runner.stop()
+
+    watcher = threading.Thread(target=watch_program, daemon=True)
+    watcher.start()
+
+    runner.run(int(job.sim_timeout / world_simulator.clock.frame_time), recorder.record)
+
+    sim_timeout = program.poll() is None
+    if sim_timeout:
+        program.kill()
+    return_code = program.wait()
+    watcher.join()
+    server.stop()
+    return wall_timeout.is_set(), sim_timeout, return_code
+
+
+def _run_in_process(job: BatchJob, world_simulator: WorldSimulator, runner: HeadlessRunner,
+                    recorder: BatchRecorder, log) -> Tuple[bool, bool, Optional[int]]:
+    """
+    Run the program on a thread connected to the first brick of the world by a DirectClientSocket.
+    The output of the program and the simulator is written to the log. A program stopped by a timeout gets
+    a ConnectionError on its next sleep or device access; a program that does neither keeps running in the background.
+    :return: whether the wall timeout and the simulated timeout were reached, and the exit code of the program
+    or None if it did not finish.
+    """
+    return_codes = []
+
+    def run():
+        try:
+            run_program(job.program, [], job.seed)
+            return_codes.append(0)
+        except SystemExit as exit_:
+            return_codes.append(_exit_code(exit_))
+        except BaseException:  # pylint: disable=broad-except
+            traceback.print_exc()
+            return_codes.append(1)
+
+    argv, path = list(sys.argv), list(sys.path)
+    with contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+        client_socket = _connect_first_brick(world_simulator)
+        set_client_socket(client_socket)
+        program = threading.Thread(target=run, daemon=True)
+        wall_timeout = threading.Event()
+
+        def watch_program():
+            program.join(job.wall_timeout)
+            if program.is_alive():
+                wall_timeout.set()
+            runner.stop()
+
+        program.start()
+        threading.Thread(target=watch_program, daemon=True).start()
+
+        runner.run(int(job.sim_timeout / world_simulator.clock.frame_time), recorder.record)
+
+        sim_timeout = program.is_alive() and not wall_timeout.is_set()
+        client_socket.close()
+        world_simulator.clock.stop()
+        program.join(STOP_TIMEOUT)
+        set_client_socket(None)
+    sys.argv[:], sys.path[:] = argv, path
+    return wall_timeout.is_set(), sim_timeout, return_codes[0] if return_codes and not sim_timeout else None
+
+
+def _connect_first_brick(world_simulator: WorldSimulator) -> DirectClientSocket:
+    robot_sim = world_simulator.robot_simulators[0]
+    brick = robot_sim.robot.get_bricks()[0]
+    return DirectClientSocket(robot_sim, brick.brick, brick.name)
+
+
+def _exit_code(exit_: SystemExit) -> int:
+    if exit_.code is None:
+        return 0
+    if isinstance(exit_.code, int):
+        return exit_.code
+    print(exit_.code, file=sys.stderr)
+    return 1
+
+
+def _program_environment(port: int, seed: int) -> dict:
+    env = dict(os.environ)
+    env[PORT_ENVIRONMENT_VARIABLE] = str(port)
+    env[SEED_ENVIRONMENT_VARIABLE] = str(seed)
+    env['PYTHONHASHSEED'] = str(seed)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [PACKAGE_ROOT, env.get('PYTHONPATH')]))
+    return env
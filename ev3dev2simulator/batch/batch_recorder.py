@@ -0,0 +1,87 @@
+"""
+The batch_recorder module contains the class BatchRecorder, which collects the results of a batch job.
+"""
+
+from typing import Any
+
+from ev3dev2simulator.state.trajectory_hash import TrajectoryHash
+from ev3dev2simulator.state.world_simulator import WorldSimulator
+
+
+class BatchRecorder:
+    """
+    Class recording what happens to the robots of a world simulated for a batch job: the falls from the
+    playing field, the collisions with obstacles and other robots, the values of the sensors over time and
+    the hash of the trajectory of all bodies. The record function is called after every simulated frame.
+    """
+
+    def __init__(self, world_simulator: WorldSimulator, trace_interval: float):
+        self.clock = world_simulator.clock
+        self.world_state = world_simulator.world_state
+        self.robot_simulators = world_simulator.robot_simulators
+        self.robots = [robot_sim.robot for robot_sim in self.robot_simulators]
+        self.trace_frames = max(1, round(trace_interval / self.clock.frame_time))
+
+        self.falls = {robot.name: 0 for robot in self.robots}
+        self.falling = {robot.name: False for robot in self.robots}
+        self.collisions = {robot.name: 0 for robot in self.robots}
+        self.sensor_traces = {robot.name: {} for robot in self.robots}
+        self.trajectory_hash = TrajectoryHash(self.world_state)
+
+        handler = world_simulator.world_state.space.add_default_collision_handler()
+        handler.begin = self._on_collision
+
+    def record(self):
+        """
+        Record the falls of the robots and, once every trace interval, the values of their sensors.
+        Sensors are evaluated lazily, so the traced sensors are evaluated here.
+        """
+        self.trajectory_hash.update()
+        trace = self.clock.frame % self.trace_frames == 0
+        falling_robots = self.world_state.get_falling_robots()
+        for robot_sim in self.robot_simulators:
+            robot = robot_sim.robot
+            falling = robot in falling_robots
+            if falling and not self.falling[robot.name]:
+                self.falls[robot.name] += 1
+            self.falling[robot.name] = falling
+
+            if trace:
+                for (brick, address) in robot.sensors:
+                    value = robot_sim.evaluate_sensor((brick, address))
+                    trace_values = self.sensor_traces[robot.name].setdefault(f'{brick}:{address}', [])
+                    trace_values.append([self.clock.time, _to_json_value(value)])
+
+    def serialize(self) -> dict:
+        """
+        Serialize the recorded results per robot, including the final pose of the robot.
+        The position is in millimeters and the angle in degrees.
+        """
+        results = {}
+        for robot in self.robots:
+            pose = None
+            if robot.last_pos is not None:
+                pose = {'x': robot.last_pos.x, 'y': robot.last_pos.y, 'angle': robot.last_angle}
+            results[robot.name] = {
+                'final_pose': pose,
+                'falls': self.falls[robot.name],
+                'collisions': self.collisions[robot.name],
+                'sensor_traces': self.sensor_traces[robot.name],
+            }
+        return results
+
+    def _on_collision(self, arbiter, _space, _data) -> bool:
+        """
+        Count the start of every contact between a robot and another body.
+        """
+        bodies = [shape.body for shape in arbiter.shapes]
+        for robot in self.robots:
+            if robot.body in bodies:
+                self.collisions[robot.name] += 1
+        return True
+
+
+def _to_json_value(value: Any) -> Any:
+    if isinstance(value, tuple):
+        return list(value)
+    return value
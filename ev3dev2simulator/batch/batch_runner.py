@@ -0,0 +1,154 @@
+"""
+The batch_runner module evaluates many robot programs against many worlds without a window or human intervention.
+Every job runs a headless simulator in lockstep mode on its own port in a process of a process pool, so the jobs
+do not share any state and the number of jobs evaluated at the same time scales with the number of cores.
+The program of a job only runs while the simulator waits for it and the other way around, so a job uses one core.
+With --in-process the program runs on a thread of the job's process and calls the simulator directly.
+The commands of every job are logged, so a job can be replayed without its program by
+python -m ev3dev2simulator.batch.replay <output>/<name>.commands.jsonl, which checks the trajectory hash of the job.
+With --telemetry every simulated frame of a job is recorded in <output>/<name>.npy, see TelemetryRecorder.
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from ev3dev2simulator.batch.batch_job import BatchJob, run_job
+
+
+def parse_args(args):
+    """
+    Parses the arguments given to the batch runner.
+    :param args: list of parameters given to program
+    :return: list of parsed values based on parameters
+    """
+    parser = argparse.ArgumentParser(prog='python -m ev3dev2simulator.batch',
+                                     description='Evaluate robot programs against world configurations.')
+    parser.add_argument("jobs_file",
+                        nargs='?',
+                        help="JSON file with a list of jobs, each with a 'program' and a 'world' and optionally "
+                             "a 'name', 'sim_timeout' and 'wall_timeout'",
+                        type=str)
+    parser.add_argument("-p", "--program",
+                        action='append',
+                        default=[],
+                        help="Robot program to evaluate against every world, can be repeated",
+                        type=str)
+    parser.add_argument("-w", "--world",
+                        action='append',
+                        default=[],
+                        help="World configuration to evaluate every program against, can be repeated",
+                        type=str)
+    parser.add_argument("-o", "--output",
+                        default='batch_results',
+                        help="Directory to write a JSON result and a log per job to. Defaults to batch_results",
+                        type=str)
+    parser.add_argument("-j", "--workers",
+                        default=os.cpu_count(),
+                        help="Number of jobs to run at the same time. Defaults to the number of cores",
+                        type=int)
+    parser.add_argument("--sim-timeout",
+                        default=300.0,
+                        help="Simulated seconds after which a program is stopped. Defaults to 300",
+                        type=float)
+    parser.add_argument("--wall-timeout",
+                        default=600.0,
+                        help="Seconds after which a job is stopped, e.g. when the program never sleeps. "
+                             "Defaults to 600",
+                        type=float)
+    parser.add_argument("--trace-interval",
+                        default=0.1,
+                        help="Simulated seconds between two recorded sensor values. Defaults to 0.1",
+                        type=float)
+    parser.add_argument("--in-process",
+                        action='store_true',
+                        help="Run the programs on a thread of the simulator instead of in their own process, "
+                             "without sockets. Programs that loop without sleeping or using a device cannot be "
+                             "stopped by a timeout in this mode")
+    parser.add_argument("--seed",
+                        default=0,
+                        help="Non-negative seed of the random generators and hashes of the programs. Defaults to 0",
+                        type=int)
+    parser.add_argument("--telemetry",
+                        action='store_true',
+                        help="Record the poses, wheel speeds, sensor values and collisions of every simulated frame "
+                             "of a job in <output>/<name>.npy")
+    return parser.parse_args(args)
+
+
+def create_jobs(args, orig_path: str) -> [BatchJob]:
+    """
+    Create the jobs from the jobs file and from every combination of the programs and worlds given.
+    Every job gets a unique name, which is used for the names of its result, log, command log and telemetry files.
+    :param args: parsed arguments of the batch runner.
+    :param orig_path: directory the paths of the programs and worlds are relative to.
+    """
+    descriptions = []
+    if args.jobs_file:
+        with open(os.path.join(orig_path, args.jobs_file)) as stream:
+            descriptions.extend(json.load(stream))
+    descriptions.extend({'program': program, 'world': world} for program in args.program for world in args.world)
+
+    jobs = []
+    names = set()
+    for description in descriptions:
+        program = os.path.join(orig_path, description['program'])
+        world = description['world']
+
+        name = description.get('name', f'{_stem(program)}-{_stem(world)}')
+        unique_name = name
+        count = 1
+        while unique_name in names:
+            count += 1
+            unique_name = f'{name}-{count}'
+        names.add(unique_name)
+
+        jobs.append(BatchJob(unique_name, program, world,
+                             float(description.get('sim_timeout', args.sim_timeout)),
+                             float(description.get('wall_timeout', args.wall_timeout)),
+                             args.trace_interval, orig_path,
+                             os.path.join(orig_path, args.output, f'{unique_name}.log'), args.in_process, args.seed,
+                             os.path.join(orig_path, args.output, f'{unique_name}.commands.jsonl'),
+                             os.path.join(orig_path, args.output, f'{unique_name}.npy') if args.telemetry else None))
+    return jobs
+
+
+def run_batch(jobs: [BatchJob], output: str, workers: int) -> [dict]:
+    """
+    Run the jobs in a process pool and write the result of every job to <output>/<name>.json as soon as it is done.
+    :return: the results in the order the jobs finished.
+    """
+    os.makedirs(output, exist_ok=True)
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_job, job) for job in jobs]
+        for future in as_completed(futures):
+            result = future.result()
+            with open(os.path.join(output, f'{result["name"]}.json'), 'w') as stream:
+                json.dump(result, stream, indent=2)
+            print(f'{result["name"]}: {result["status"]} after {result.get("sim_time", 0):.1f} simulated seconds '
+                  f'({result["wall_time"]:.1f}s)')
+            results.append(result)
+    return results
+
+
+def main(args) -> int:
+    """
+    Run the batch described by the given command line arguments.
+    :return: exit code, 1 if a job could not be run.
+    """
+    orig_path = os.getcwd()
+    args = parse_args(args)
+    jobs = create_jobs(args, orig_path)
+    if not jobs:
+        print('No jobs given, provide a jobs file or at least one program and one world.', file=sys.stderr)
+        return 2
+
+    results = run_batch(jobs, os.path.join(orig_path, args.output), args.workers)
+    return 1 if any(result['status'] == 'error' for result in results) else 0
+
+
+def _stem(path: str) -> str:
+    return os.path.splitext(os.path.basename(path))[0]
@@ -0,0 +1,49 @@
+"""
+The program module runs a robot program for the batch runner: python -m ev3dev2simulator.batch.program <program>.
+The connection to the simulator is made before the program starts, so the program follows the simulated clock
+from its first line, also when it imports sleep or time directly from the time module.
+The random generators of the program are seeded with the environment variable EV3DEV2SIMULATOR_SEED, if set.
+"""
+
+import os
+import random
+import runpy
+import sys
+from typing import Optional
+
+import numpy as np
+
+from ev3dev2simulator.connection.client_socket import get_client_socket
+
+SEED_ENVIRONMENT_VARIABLE = 'EV3DEV2SIMULATOR_SEED'
+
+
+def main(args):
+    """
+    Connect to the simulator and run the program given as first argument as __main__.
+    :param args: path of the program followed by the arguments of the program.
+    """
+    get_client_socket()
+    seed = os.environ.get(SEED_ENVIRONMENT_VARIABLE)
+    run_program(args[0], args[1:], None if seed is None else int(seed))
+
+
+def run_program(path: str, args: list, seed: Optional[int] = None):
+    """
+    Run the program as __main__, as if it was started from the command line with the given arguments.
+    Also used to run programs on a thread of the simulator, after setting the client socket to a DirectClientSocket.
+    :param path: of the program.
+    :param args: arguments of the program.
+    :param seed: for the random module and the global NumPy generator, which are not seeded if None.
+    """
+    if seed is not None:
+        random.seed(seed)
+        np.random.seed(seed)
+    path = os.path.abspath(path)
+    sys.argv = [path] + args
+    sys.path[0] = os.path.dirname(path)
+    runpy.run_path(path, run_name='__main__')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
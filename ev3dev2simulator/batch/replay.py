@@ -0,0 +1,58 @@
+"""
+The replay module replays a batch job from its command log, without the robot program:
+python -m ev3dev2simulator.batch.replay <name>.commands.jsonl.
+The world is simulated as fast as possible for the number of frames of the job, applying every logged command in
+the frame it was processed in, and the trajectory hash of the replay is compared with the hash of the job.
+"""
+
+import argparse
+import sys
+
+from ev3dev2simulator.batch.batch_job import create_world_simulator
+from ev3dev2simulator.state.command_log import CommandLog
+from ev3dev2simulator.state.headless_runner import HeadlessRunner
+from ev3dev2simulator.state.trajectory_hash import TrajectoryHash
+
+
+def replay(path: str) -> dict:
+    """
+    Replay the job of the given command log.
+    :param path: of the command log written by the batch job.
+    :return: dictionary with the number of frames and the trajectory hashes of the job and of the replay.
+    """
+    header, command_log = CommandLog.load(path)
+    world_simulator = create_world_simulator(header['world'], header['orig_path'])
+    HeadlessRunner(world_simulator)
+    trajectory_hash = TrajectoryHash(world_simulator.world_state)
+
+    for _ in range(header['frames']):
+        command_log.apply(world_simulator)
+        world_simulator.update()
+        trajectory_hash.update()
+
+    return {
+        'frames': header['frames'],
+        'trajectory_hash': trajectory_hash.hexdigest(),
+        'recorded_trajectory_hash': header['trajectory_hash'],
+    }
+
+
+def main(args) -> int:
+    """
+    Replay the command log given on the command line and report whether the trajectories are the same.
+    :return: exit code, 1 if the trajectory of the replay differs from the recorded one.
+    """
+    parser = argparse.ArgumentParser(prog='python -m ev3dev2simulator.batch.replay',
+                                     description='Replay a batch job from its command log.')
+    parser.add_argument("command_log", help="Command log of the job, <name>.commands.jsonl", type=str)
+    args = parser.parse_args(args)
+
+    result = replay(args.command_log)
+    same = result['trajectory_hash'] == result['recorded_trajectory_hash']
+    print(f'{result["frames"]} frames, trajectory hash {result["trajectory_hash"]} '
+          f'{"matches" if same else "differs from " + result["recorded_trajectory_hash"]}')
+    return 0 if same else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
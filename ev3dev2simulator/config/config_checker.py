@@ -106,6 +106,7 @@ class ConfigChecker:
                 'screen_height': Int(),
                 'screen_width': Int(),
                 'side_bar_width': Int(),
+                'side_bar_refresh_rate': Int(),
                 'screen_title': Str(),
                 'falling_message': Str()
             }),
@@ -146,9 +147,15 @@ class ConfigChecker:
             }),
             'exec_settings': Map({
                 'frames_per_second': Int(),
+                'physics_substeps': Int(),
+                'max_catch_up_frames': Int(),
                 'socket_port': Int(),
-                'bluetooth_port': Int(),
-                'message_size': Int()
+                'bluetooth_port': Int()
+            }),
+            'sensing_settings': Map({
+                'raster_cell_size': Int(),
+                'max_raster_cells': Int(),
+                'grid_cell_size': Int()
             }),
             'motor_settings': Map({
                 'distance_coasting_subtraction': Float(),
@@ -2,36 +2,75 @@
 Singleton module client_sockets contains the class ClientSocket and the function get_client_socket to get the instance.
 """
 
-import json
+import os
 import socket
 import threading
-import time
 import sys
+from queue import Queue
 from typing import Any, Optional
 from ev3dev2simulator.config.config import get_simulation_settings, load_config
+from ev3dev2simulator.connection import virtual_time, wire_protocol
 from ev3dev2simulator.connection.message.command import Command
+from ev3dev2simulator.connection.message.hello_request import HelloRequest
+from ev3dev2simulator.connection.message.subscribe_request import SubscribeRequest
+from ev3dev2simulator.connection.message.time_request import TimeRequest
+from ev3dev2simulator.connection.sensor_cache import SensorCache
 
 THIS = sys.modules[__name__]
 
+# Overrides the configured socket port, used to run several simulators side by side.
+PORT_ENVIRONMENT_VARIABLE = 'EV3DEV2SIMULATOR_PORT'
+# Name the robot and brick to connect to, by default the first brick without a connection is used.
+ROBOT_ENVIRONMENT_VARIABLE = 'EV3DEV2SIMULATOR_ROBOT'
+BRICK_ENVIRONMENT_VARIABLE = 'EV3DEV2SIMULATOR_BRICK'
+
+# Seconds to wait for the simulator to accept the brick.
+HANDSHAKE_TIMEOUT = 5
+
 
 class ClientSocket:
     """
     Class responsible for the establishing and maintaining the socket connection with the simulator.
-    This connection is a TCP stream.
+    This connection is a TCP stream. Once a sensor is subscribed to, a thread receives the frames of the simulator,
+    storing the pushed sensor values in the sensor cache and handing the responses to the waiting commands.
     """
 
     def __init__(self):
         load_config(None)
-        port = int(get_simulation_settings()['exec_settings']['socket_port'])
+        port = int(os.environ.get(PORT_ENVIRONMENT_VARIABLE,
+                                  get_simulation_settings()['exec_settings']['socket_port']))
 
         self.client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
 
-        self.client.settimeout(0.1)
+        self.client.settimeout(HANDSHAKE_TIMEOUT)
 
         self.client.connect(('localhost', port))
         self.lock = threading.Lock()
+        self.sensor_cache = SensorCache()
+        self.responses = None
+
+        hello = HelloRequest(os.environ.get(ROBOT_ENVIRONMENT_VARIABLE), os.environ.get(BRICK_ENVIRONMENT_VARIABLE))
+        self.brick_name = self.send_command(hello, True)
+        if self.brick_name is None:
+            self.client.close()
+            raise ConnectionError('the simulator has no free brick' + (f' named {hello.brick}' if hello.brick else ''))
+        self.client.settimeout(0.1)
 
-        time.sleep(1)
+        sim_time = self._request_sim_time()
+        if sim_time is not None:
+            # responses to sleep requests take as long as the other clients need to go to sleep
+            self.client.settimeout(None)
+            virtual_time.install(self, sim_time)
+
+    def _request_sim_time(self) -> Optional[float]:
+        """
+        Ask the simulator for its simulated time, which it only provides when running in lockstep mode.
+        :return: the simulated time, or None when the wall clock should be used.
+        """
+        try:
+            return self.send_command(TimeRequest(), True)
+        except socket.timeout:
+            return None
 
     def send_command(self, command: Command, wait_for_response=False) -> Optional[object]:
         """
@@ -39,46 +78,80 @@ class ClientSocket:
         :param command: to send.
         :param wait_for_response: set to True if you expect a result and want to wait for it blocking.
         """
-        self.lock.acquire()
-        jsn = self.serialize(command)
+        data = self.serialize(command)
 
         des = None
-        try:
-            self.client.send(jsn)
+        with self.lock:
+            self.client.sendall(data)
             if wait_for_response:
-                data = self.client.recv(32)
-                des = self.deserialize(data)
-        finally:
-            self.lock.release()
+                des = self._receive_response()
         return des
 
+    def subscribe_sensor(self, address: str) -> bool:
+        """
+        Subscribe to the values of a sensor, which the simulator then pushes after every frame into the sensor cache.
+        :param address: of the sensor.
+        :return: True if subscribed, False if the simulator refuses, e.g. in lockstep mode.
+        """
+        with self.lock:
+            self.client.sendall(self.serialize(SubscribeRequest([address])))
+            subscribed = self._receive_response()
+            if subscribed and self.responses is None:
+                self.responses = Queue()
+                self.client.settimeout(None)
+                threading.Thread(target=self._receive_frames, daemon=True).start()
+        return subscribed
+
+    def _receive_response(self) -> Any:
+        """
+        Receive the response to the last message, storing the snapshots received before it.
+        """
+        if self.responses is not None:
+            response = self.responses.get()
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        while True:
+            data = wire_protocol.receive_frame(self.client)
+            if data is None or not wire_protocol.is_snapshot(data):
+                return self.deserialize(data)
+            self.sensor_cache.update(wire_protocol.decode_snapshot(data))
+
+    def _receive_frames(self):
+        """
+        Receive the frames of the simulator until the connection is closed.
+        """
+        try:
+            while True:
+                data = wire_protocol.receive_frame(self.client)
+                if data is not None and wire_protocol.is_snapshot(data):
+                    self.sensor_cache.update(wire_protocol.decode_snapshot(data))
+                else:
+                    self.responses.put(self.deserialize(data))
+        except OSError as error:
+            self.sensor_cache.close()
+            self.responses.put(error)
+
     @staticmethod
     def serialize(message: Any) -> bytes:
         """
-        Serialize the given message so it can be send via a stream channel.
+        Serialize the given message into a frame so it can be send via a stream channel.
         :param message: to be serialized.
         :return: bytes representing the message.
         """
-
-        obj_dict = message.serialize()
-
-        jsn = json.dumps(obj_dict)
-        jsn = jsn.ljust(int(get_simulation_settings()['exec_settings']['message_size']), '#')
-
-        return str.encode(jsn)
+        return wire_protocol.encode_message(message.serialize())
 
     @staticmethod
     def deserialize(data: bytes) -> Any:
         """
-        Deserialize the given data.
-        :param data: to be deserialized.
+        Deserialize the given response.
+        :param data: body of the response frame to be deserialized.
         :return: any type representing value inside the data.
         """
-
-        val = data.decode()
-        obj_dict = json.loads(val)
-
-        return obj_dict['value']
+        if data is None:
+            raise ConnectionError('simulator closed the connection')
+        return wire_protocol.decode_response(data)
 
 
 THIS.CLIENT_SOCKET = None
@@ -91,3 +164,11 @@ def get_client_socket() -> ClientSocket:
     if not THIS.CLIENT_SOCKET:
         THIS.CLIENT_SOCKET = ClientSocket()
     return THIS.CLIENT_SOCKET
+
+
+def set_client_socket(client_socket: Any):
+    """
+    Set the client returned by get_client_socket, e.g. a DirectClientSocket for a program running inside the simulator.
+    :param client_socket: to use, or None to connect a new ClientSocket on the next call of get_client_socket.
+    """
+    THIS.CLIENT_SOCKET = client_socket
@@ -2,51 +2,80 @@
 The client_socket_handler is used to communicate with a client opened by robot code.
 """
 
-import socket
-import threading
-from time import sleep
+import asyncio
+from concurrent.futures import Executor
 
-from ev3dev2simulator.config.config import get_simulation_settings
+from ev3dev2simulator.connection import wire_protocol
 from ev3dev2simulator.connection.message_handler import MessageHandler
 from ev3dev2simulator.state.message_processor import MessageProcessor
 from ev3dev2simulator.state import robot_simulator
 
+# messages that can wait for the simulation, which are processed outside of the event loop
+BLOCKING_MESSAGES = ('DataRequest', 'SleepRequest')
 
-class ClientSocketHandler(threading.Thread):
+
+class ClientSocketHandler:
     """
-    Class responsible for managing a socket connection from the ev3dev2 mock processes.
+    Class responsible for managing the socket connection of a brick from the ev3dev2 mock processes.
+    Besides answering the messages of the client, it pushes the values of the sensors the client subscribed to
+    after every frame. All methods are called from the event loop of the ServerSockets.
     """
 
     def __init__(self, robot_sim: robot_simulator, brick_id: int, brick_name: str):
-        threading.Thread.__init__(self)
         self.message_handler = MessageHandler(MessageProcessor(brick_id, robot_sim))
-        self.client = None
+        self.writer = None
         self.brick_id = brick_id
-        self.is_running = True
         self.is_connected = False
         self.brick_name = brick_name
         self.robot_sim = robot_sim
-        self.message_size = int(get_simulation_settings()['exec_settings']['message_size'])
 
-    def run(self):
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, executor: Executor):
+        """
+        Process the messages of the client until it disconnects. Messages are processed in the order they arrive.
+        :param reader: of the connection.
+        :param writer: of the connection.
+        :param executor: to process the messages that can block on.
+        """
+        self.writer = writer
+        self.is_connected = True
+        self.robot_sim.clock.connect()
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                data = await wire_protocol.read_frame(reader)
+                if data is None:
+                    break
+                if wire_protocol.message_type(data) in BLOCKING_MESSAGES:
+                    val = await loop.run_in_executor(executor, self.message_handler.process, data)
+                else:
+                    val = self.message_handler.process(data)
+                if val:
+                    writer.write(val)
+                    await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            self.robot_sim.clear_actuator_jobs_of_brick(self.brick_id)
+            print(f'Closing connection from \"{self.brick_name}\" (id: {self.brick_id}) from robot '
+                  f'\"{self.robot_sim.robot.name}\"')
+        finally:
+            self.is_connected = False
+            self.writer = None
+            self.robot_sim.clock.disconnect()
+            self.robot_sim.unsubscribe_sensors_of_brick(self.brick_id)
+            writer.close()
+
+    def push_sensor_values(self):
+        """
+        Send a snapshot of the subscribed sensors to the client.
+        """
+        if self.writer is None:
+            return
+        values = self.robot_sim.get_subscribed_values(self.brick_id)
+        if values:
+            self.writer.write(wire_protocol.encode_snapshot(values))
+
+    def close(self):
         """
-        Manage the socket connection.
+        Close the connection, if any.
         """
-        while self.is_running:
-            if not self.is_connected:
-                sleep(0.1)
-            else:
-                try:
-                    data = self.client.recv(self.message_size)
-                    if data:
-                        val = self.message_handler.process(data)
-                        if val:
-                            self.client.send(val)
-                    else:
-                        self.is_connected = False
-                except socket.error:
-                    self.is_connected = False
-                    self.robot_sim.reset_queues_of_brick(self.brick_id)
-                    print(f'Closing connection from \"{self.brick_name}\" (id: {self.brick_id}) from robot '
-                          f'\"{self.robot_sim.robot.name}\"')
-                    self.client.close()
+        if self.writer is not None:
+            self.writer.close()
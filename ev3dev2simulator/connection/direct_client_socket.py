@@ -0,0 +1,103 @@
+"""
+The direct_client_socket module contains the class DirectClientSocket, which connects a robot program running
+in the process of the simulator to a brick without a socket.
+"""
+
+from typing import Optional
+
+from ev3dev2simulator.connection import virtual_time
+from ev3dev2simulator.connection.message.command import Command
+from ev3dev2simulator.connection.message import config_request, data_request, led_command, rotate_command, \
+    sleep_request, sound_command, stop_command, subscribe_request, time_request
+from ev3dev2simulator.connection.sensor_cache import SensorCache
+from ev3dev2simulator.state.message_processor import MessageProcessor
+from ev3dev2simulator.state.robot_simulator import RobotSimulator
+
+# per message class the method of the MessageProcessor processing it
+PROCESSORS = {
+    rotate_command.RotateCommand: MessageProcessor.process_rotate_command,
+    stop_command.StopCommand: MessageProcessor.process_stop_command,
+    sound_command.SoundCommand: MessageProcessor.process_sound_command,
+    led_command.LedCommand: MessageProcessor.process_led_command,
+    data_request.DataRequest: MessageProcessor.process_data_request,
+    config_request.ConfigRequest: MessageProcessor.process_config_request,
+    time_request.TimeRequest: MessageProcessor.process_time_request,
+    sleep_request.SleepRequest: MessageProcessor.process_sleep_request,
+    subscribe_request.SubscribeRequest: MessageProcessor.process_subscribe_request,
+}
+
+
+class DirectClientSocket:
+    """
+    Replacement of the ClientSocket for a robot program running on a thread of the simulator process.
+    Messages are passed to the MessageProcessor of the brick as they are, without serializing them, and the values
+    of subscribed sensors are stored in the sensor cache by the simulation thread after every update.
+    Like a ClientSocket, it installs the simulated clock when the simulator runs in lockstep mode.
+    """
+
+    def __init__(self, robot_sim: RobotSimulator, brick_id: int, brick_name: str):
+        self.robot_sim = robot_sim
+        self.brick_id = brick_id
+        self.brick_name = brick_name
+        self.message_processor = MessageProcessor(brick_id, robot_sim)
+        self.sensor_cache = SensorCache()
+        self.closed = False
+        self.listening = False
+
+        robot_sim.clock.connect()
+        sim_time = self.send_command(time_request.TimeRequest(), True)
+        if sim_time is not None:
+            virtual_time.install(self, sim_time)
+
+    def send_command(self, command: Command, wait_for_response=False) -> Optional[object]:
+        """
+        Process the given Command by the MessageProcessor of the brick.
+        :param command: to process.
+        :param wait_for_response: set to True to return the result of the command.
+        """
+        if isinstance(command, config_request.ConfigRequest):
+            # the simulator may add to the arguments, which belong to the device of the program
+            command = config_request.ConfigRequest(dict(command.kwargs), command.class_name)
+        self._check_connection()
+        value = PROCESSORS[type(command)](self.message_processor, command)
+        # a sleep ends without the requested time passing when the simulation stops
+        self._check_connection()
+        return value if wait_for_response else None
+
+    def subscribe_sensor(self, address: str) -> bool:
+        """
+        Subscribe to the values of a sensor, which the simulator then stores after every frame in the sensor cache.
+        :param address: of the sensor.
+        :return: True if subscribed, False if the simulator refuses, e.g. in lockstep mode.
+        """
+        subscribed = self.send_command(subscribe_request.SubscribeRequest([address]), True)
+        if subscribed and not self.listening:
+            self.listening = True
+            self.robot_sim.update_listeners.append(self._store_sensor_values)
+        return subscribed
+
+    def close(self):
+        """
+        Disconnect from the brick: stop its actuators, remove its subscriptions and restore the wall clock.
+        Calls of the program after closing raise a ConnectionError, like a ClientSocket does once the simulator
+        has closed its connection.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        if self.listening:
+            self.robot_sim.update_listeners.remove(self._store_sensor_values)
+        self.robot_sim.clear_actuator_jobs_of_brick(self.brick_id)
+        self.robot_sim.unsubscribe_sensors_of_brick(self.brick_id)
+        self.robot_sim.clock.disconnect()
+        self.sensor_cache.close()
+        installed = virtual_time.get_virtual_time()
+        if installed is not None and installed.client_socket is self:
+            virtual_time.uninstall()
+
+    def _store_sensor_values(self):
+        self.sensor_cache.update(self.robot_sim.get_subscribed_values(self.brick_id))
+
+    def _check_connection(self):
+        if self.closed:
+            raise ConnectionError('simulator closed the connection')
@@ -0,0 +1,23 @@
+"""
+The module hello_request contains the dataclass HelloRequest.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from ev3dev2simulator.connection.message.command import Command
+
+
+@dataclass
+class HelloRequest(Command):
+    """
+    HelloRequest objects are the first message of a connection, naming the robot and brick the client controls.
+    Without names the simulator picks the first brick without a connection, in the order of the configuration.
+    The simulator answers with the name of the brick, or None if the brick is not available.
+    """
+    def __init__(self, robot: Optional[str], brick: Optional[str]):
+        self.robot = robot
+        self.brick = brick
+
+    def serialize(self) -> dict:
+        return {'type': 'HelloRequest', 'robot': self.robot, 'brick': self.brick}
@@ -0,0 +1,20 @@
+"""
+The module sleep_request contains the dataclass SleepRequest.
+"""
+
+from dataclasses import dataclass
+
+from ev3dev2simulator.connection.message.command import Command
+
+
+@dataclass
+class SleepRequest(Command):
+    """
+    SleepRequest objects are used in lockstep mode to wait for the given number of simulated seconds.
+    The simulator answers with the simulated time after sleeping.
+    """
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+
+    def serialize(self) -> dict:
+        return {'type': 'SleepRequest', 'seconds': self.seconds}
@@ -0,0 +1,21 @@
+"""
+The module subscribe_request contains the dataclass SubscribeRequest.
+"""
+
+from dataclasses import dataclass
+
+from ev3dev2simulator.connection.message.command import Command
+
+
+@dataclass
+class SubscribeRequest(Command):
+    """
+    SubscribeRequest objects are used to subscribe to the values of the sensors attached to the given addresses.
+    The simulator answers whether the subscription is accepted. When it is, the simulator pushes a snapshot with the
+    values of the subscribed sensors after every frame.
+    """
+    def __init__(self, addresses: list):
+        self.addresses = addresses
+
+    def serialize(self) -> dict:
+        return {'type': 'SubscribeRequest', 'addresses': self.addresses}
@@ -0,0 +1,18 @@
+"""
+The module time_request contains the dataclass TimeRequest.
+"""
+
+from dataclasses import dataclass
+
+from ev3dev2simulator.connection.message.command import Command
+
+
+@dataclass
+class TimeRequest(Command):
+    """
+    TimeRequest objects are used to request the simulated time of the simulator.
+    The simulator answers None when it is not running in lockstep mode, meaning the wall clock should be used.
+    """
+
+    def serialize(self) -> dict:
+        return {'type': 'TimeRequest'}
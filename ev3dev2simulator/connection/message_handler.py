@@ -2,17 +2,20 @@
 The message_handler module contains the MessageHandler class.
 """
 
-import json
 from logging import warning
 from typing import Any
 
+from ev3dev2simulator.connection import wire_protocol
 from ev3dev2simulator.connection.message.config_request import ConfigRequest
 from ev3dev2simulator.state.message_processor import MessageProcessor
 from ev3dev2simulator.connection.message.data_request import DataRequest
 from ev3dev2simulator.connection.message.led_command import LedCommand
 from ev3dev2simulator.connection.message.rotate_command import RotateCommand
+from ev3dev2simulator.connection.message.sleep_request import SleepRequest
 from ev3dev2simulator.connection.message.sound_command import SoundCommand
 from ev3dev2simulator.connection.message.stop_command import StopCommand
+from ev3dev2simulator.connection.message.subscribe_request import SubscribeRequest
+from ev3dev2simulator.connection.message.time_request import TimeRequest
 
 
 class MessageHandler:
@@ -25,14 +28,11 @@ class MessageHandler:
     def process(self, data: bytes) -> bytes:
         """
         Process incoming data by decoding it and sending it to the MessageProcessor.
-        :param data: to process.
-        :return: a possible response in bytes when the incoming message requires it.
+        :param data: body of the message frame to process.
+        :return: a possible response frame in bytes when the incoming message requires it.
         """
 
-        jsn = data.decode()
-        jsn = jsn.replace('#', '')
-
-        obj_dict = json.loads(jsn)
+        obj_dict = wire_protocol.decode_message(data)
 
         tpe = obj_dict['type']
         if tpe == 'RotateCommand':
@@ -57,6 +57,12 @@ class MessageHandler:
             return self._process_data_request(obj_dict)
         if tpe == 'ConfigRequest':
             return self._process_config_request(obj_dict)
+        if tpe == 'TimeRequest':
+            return self._process_time_request()
+        if tpe == 'SleepRequest':
+            return self._process_sleep_request(obj_dict)
+        if tpe == 'SubscribeRequest':
+            return self._process_subscribe_request(obj_dict)
         return warning(f'Unknown command type {tpe}')
 
     def _process_drive_command(self, command_dict: dict) -> Any:
@@ -123,15 +129,42 @@ class MessageHandler:
 
         return self.serialize_response(value)
 
+    def _process_time_request(self) -> bytes:
+        """
+        Create a TimeRequest and send it to the MessageProcessor.
+        :return: a bytes object representing the serialized response.
+        """
+        value = self.message_processor.process_time_request(TimeRequest())
+
+        return self.serialize_response(value)
+
+    def _process_sleep_request(self, command_dict: dict) -> bytes:
+        """
+        Deserialize the given dictionary into a SleepRequest and send it to the MessageProcessor.
+        Only responds after the requested simulated time has passed.
+        :param command_dict: to process.
+        :return: a bytes object representing the serialized response.
+        """
+        request = SleepRequest(command_dict['seconds'])
+        value = self.message_processor.process_sleep_request(request)
+
+        return self.serialize_response(value)
+
+    def _process_subscribe_request(self, command_dict: dict) -> bytes:
+        """
+        Deserialize the given dictionary into a SubscribeRequest and send it to the MessageProcessor.
+        :param command_dict: to process.
+        :return: a bytes object representing the serialized response.
+        """
+        request = SubscribeRequest(command_dict['addresses'])
+        value = self.message_processor.process_subscribe_request(request)
+
+        return self.serialize_response(value)
 
     @staticmethod
     def serialize_response(value) -> bytes:
         """
-        Serialize the given value into a bytes object containing a dictionary.
+        Serialize the given value into a response frame.
         :param value: to serialize.
         """
-
-        command_dict = {'value': value}
-
-        jsn = json.dumps(command_dict)
-        return str.encode(jsn)
+        return wire_protocol.encode_response(value)
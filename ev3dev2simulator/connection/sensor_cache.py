@@ -0,0 +1,47 @@
+"""
+The sensor_cache module contains the class SensorCache, holding the sensor values pushed by the simulator.
+"""
+
+import threading
+from typing import Any
+
+
+class SensorCache:
+    """
+    Thread safe cache of the latest values of the subscribed sensors. The values are updated by the thread receiving
+    the snapshots of the simulator and read by the sensor connectors, so reading a sensor does not need a message.
+    """
+
+    def __init__(self):
+        self.values = {}
+        self.closed = False
+        self.condition = threading.Condition()
+
+    def update(self, values: dict):
+        """
+        Store the values of a snapshot.
+        :param values: dictionary with the values of the sensors by address.
+        """
+        with self.condition:
+            self.values.update(values)
+            self.condition.notify_all()
+
+    def close(self):
+        """
+        Mark the cache as closed when the connection with the simulator is lost, so readers stop waiting.
+        """
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+    def get(self, address: str) -> Any:
+        """
+        Get the latest value of a sensor, waiting for the first snapshot containing it.
+        :param address: of the sensor.
+        :return: the value of the sensor.
+        """
+        with self.condition:
+            self.condition.wait_for(lambda: address in self.values or self.closed)
+            if address not in self.values:
+                raise ConnectionError('connection with the simulator is lost')
+            return self.values[address]
@@ -2,86 +2,164 @@
 The server_sockets module contains the class ServerSockets, responsible for handling all sockets of the simulator.
 """
 
-
-import socket
+import asyncio
 import threading
-import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
 from ev3dev2simulator.config.config import get_simulation_settings
+from ev3dev2simulator.connection import wire_protocol
 from ev3dev2simulator.connection.client_socket_handler import ClientSocketHandler
+from ev3dev2simulator.state.robot_simulator import RobotSimulator
 from ev3dev2simulator.state.world_simulator import WorldSimulator
 
 
 class ServerSockets(threading.Thread):
     """
     Class responsible for listening to incoming socket connections from ev3dev2 mock processes.
+    All connections are served by a single asyncio event loop running on this thread. A connection starts with
+    a handshake naming the brick it belongs to; connections that do not name a brick get the first brick without
+    a connection, in the order of the configuration.
     """
 
-    def __init__(self, world_simulator: WorldSimulator):
+    def __init__(self, world_simulator: WorldSimulator, port: int = None):
         threading.Thread.__init__(self)
-        self.word_simulator = world_simulator
-        self.brick_sockets = {}
+        self.world_simulator = world_simulator
+        self.handlers = {}
         self.first_connected = False
+        self.port = port if port is not None else int(get_simulation_settings()['exec_settings']['socket_port'])
+        self.listening = threading.Event()
+        self.is_running = True
+
+        self.loop = None
+        self.stopped = None
+        self.connections = set()
+        self.executor = None
 
     def run(self):
         """
-        Listen for incoming connections. When a connection is established spawn a ClientSocketHandler
-        to manage it. Multiple connections can be established at the same time.
+        Listen for incoming connections until stop is called.
+        When the port is 0, the operating system picks a free port, which is stored in port once listening.
         """
+        for robot_sim in self.world_simulator.robot_simulators:
+            for brick in robot_sim.robot.get_bricks():
+                self.handlers[(robot_sim.robot.name, brick.name)] = ClientSocketHandler(robot_sim, brick.brick,
+                                                                                        brick.name)
 
-        port = int(get_simulation_settings()['exec_settings']['socket_port'])
+        # requests that block, like sleeping in lockstep mode, are processed on this pool, one at a time per brick
+        self.executor = ThreadPoolExecutor(max(1, len(self.handlers)))
+        self.loop = asyncio.new_event_loop()
+        try:
+            self.loop.run_until_complete(self._serve())
+        finally:
+            self.loop.close()
+            self.executor.shutdown(wait=False)
+        print('Closing server')
 
-        for robot_sim in self.word_simulator.robot_simulators:
-            for brick in robot_sim.robot.get_bricks():
-                sock = ClientSocketHandler(robot_sim, brick.brick, brick.name)
-                sock.setDaemon(True)
-                sock.start()
-                self.brick_sockets[(robot_sim.robot.name, brick.name)] = sock
-
-        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        server.bind(('localhost', port))
-        server.listen(5)
-        server.setblocking(False)
-        server.settimeout(1)
+    def stop(self):
+        """
+        Stop listening for connections and close the open connections.
+        """
+        self.is_running = False
+        loop = self.loop
+        if loop is not None and self.stopped is not None:
+            loop.call_soon_threadsafe(self.stopped.set)
+
+    async def _serve(self):
+        self.stopped = asyncio.Event()
+        server = await asyncio.start_server(self._handle_connection, 'localhost', self.port)
+        self.port = server.sockets[0].getsockname()[1]
 
+        listeners = []
+        for robot_sim in self.world_simulator.robot_simulators:
+            listener = self._create_update_listener(robot_sim)
+            robot_sim.update_listeners.append(listener)
+            listeners.append((robot_sim, listener))
+
+        self.listening.set()
         print('Listening for connections...')
-        self.handle_sockets(server)
-        print('Closing server')
+        if self.is_running:
+            await self.stopped.wait()
 
-    def handle_sockets(self, server):
+        for robot_sim, listener in listeners:
+            robot_sim.update_listeners.remove(listener)
+        server.close()
+        await server.wait_closed()
+        for handler in self.handlers.values():
+            handler.close()
+        if self.connections:
+            await asyncio.wait(self.connections)
+
+    def _create_update_listener(self, robot_sim: RobotSimulator):
+        """
+        Create the function called by the simulation thread after every update of the robot, which schedules
+        pushing the values of the subscribed sensors on the event loop.
+        """
+        def on_update():
+            if robot_sim.subscribed_sensors:
+                self.loop.call_soon_threadsafe(self._push_sensor_values, robot_sim)
+        return on_update
+
+    def _push_sensor_values(self, robot_sim: RobotSimulator):
+        for handler in self.handlers.values():
+            if handler.robot_sim is robot_sim:
+                handler.push_sensor_values()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
         """
-        Checks if sockets are connected and find first socket that is not connected.
+        Perform the handshake of a new connection and let the handler of its brick process its messages.
         """
-        while True:
-            for (robot_name, brick_name), sock in self.brick_sockets.items():
-                if not sock.is_connected:
-                    if self.wait_for_brick_to_connect(robot_name, brick_name, sock, server):
-                        break
-            time.sleep(.1)
-
-    def wait_for_brick_to_connect(self, robot_name, brick_name, sock, server):
+        connection = asyncio.current_task()
+        self.connections.add(connection)
+        try:
+            await self._serve_connection(reader, writer)
+        finally:
+            self.connections.discard(connection)
+
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        handler = None
+        try:
+            data = await wire_protocol.read_frame(reader)
+            if data is not None and wire_protocol.message_type(data) == 'HelloRequest':
+                hello = wire_protocol.decode_message(data)
+                handler = self._find_brick(hello['robot'], hello['brick'])
+            if handler is not None:
+                handler.is_connected = True  # reserve the brick while answering
+            writer.write(wire_protocol.encode_response(None if handler is None else handler.brick_name))
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            if handler is not None:
+                handler.is_connected = False
+            handler = None
+
+        if handler is None:
+            writer.close()
+            return
+
+        print(f'Connection from \"{handler.brick_name}\" from robot \"{handler.robot_sim.robot.name}\" accepted')
+        self.first_connected = True
+        await handler.handle(reader, writer, self.executor)
+
+        if self.first_connected and self.all_sockets_are_disconnected(self.handlers.values()):
+            print('All bricks are disconnected. Resetting world.')
+            self.world_simulator.request_reset()
+            self.first_connected = False
+
+    def _find_brick(self, robot_name: Optional[str], brick_name: Optional[str]) -> Optional[ClientSocketHandler]:
         """
-        Wait for a specific brick to connect.
+        Find the handler of the brick to connect to.
+        :param robot_name: of the robot of the brick, any robot if None.
+        :param brick_name: of the brick, the first brick without a connection if None.
+        :return: the handler of the brick, or None if the brick does not exist or already has a connection.
         """
-        print(f'Please connect brick "{brick_name}" from robot "{robot_name}"')
-        while True:
-            try:
-                (client, _) = server.accept()
-                self.first_connected = True
-                print(
-                    f'Connection from \"{brick_name}\" from robot \"{robot_name}\" '
-                    'accepted\n')
-                sock.client = client
-                sock.is_connected = True
-                return False  # should not restart connection procedure
-            except socket.timeout:
-                pass
-            if self.all_sockets_are_disconnected(self.brick_sockets.values()) and self.first_connected:
-                print('All bricks are disconnected. Resetting world.')
-                self.word_simulator.request_reset()
-                self.first_connected = False
-                return True  # should restart connection procedure
+        for (robot, brick), handler in self.handlers.items():
+            if robot_name is not None and robot != robot_name:
+                continue
+            if brick_name is not None and brick != brick_name:
+                continue
+            if not handler.is_connected:
+                return handler
+        return None
 
     @staticmethod
     def all_sockets_are_disconnected(sockets):
@@ -0,0 +1,86 @@
+"""
+The virtual_time module lets a robot program follow the simulated clock of a simulator running in lockstep mode.
+Installing it replaces time.time, time.monotonic and time.sleep. Sleeping is forwarded to the simulator, which
+only advances the world once every connected program is sleeping. The time only changes while sleeping, so reading
+the time does not require any communication with the simulator.
+
+Modules that imported sleep or time directly from the time module before the installation keep the wall clock.
+"""
+
+import sys
+import time
+from typing import Optional
+
+from ev3dev2simulator.connection.message.sleep_request import SleepRequest
+
+THIS = sys.modules[__name__]
+
+WALL_TIME = time.time
+WALL_MONOTONIC = time.monotonic
+WALL_SLEEP = time.sleep
+
+
+class VirtualTime:
+    """
+    Clock of the robot program that follows the simulated time. The wall clock time at which the program connected
+    is used as the starting point, so the time does not jump backwards compared to the wall clock before connecting.
+    """
+
+    def __init__(self, client_socket, sim_time: float):
+        self.client_socket = client_socket
+        self.sim_time = sim_time
+        self.time_offset = WALL_TIME() - sim_time
+        self.monotonic_offset = WALL_MONOTONIC() - sim_time
+
+    def time(self) -> float:
+        """
+        Replacement of time.time.
+        """
+        return self.time_offset + self.sim_time
+
+    def monotonic(self) -> float:
+        """
+        Replacement of time.monotonic.
+        """
+        return self.monotonic_offset + self.sim_time
+
+    def sleep(self, seconds: float):
+        """
+        Replacement of time.sleep. Blocks until the simulator has simulated the given number of seconds.
+        """
+        if seconds < 0:
+            raise ValueError('sleep length must be non-negative')
+        self.sim_time = self.client_socket.send_command(SleepRequest(seconds), True)
+
+
+THIS.VIRTUAL_TIME = None
+
+
+def install(client_socket, sim_time: float) -> VirtualTime:
+    """
+    Replace the clock functions of the time module by the ones following the simulated time.
+    :param client_socket: connected to the simulator.
+    :param sim_time: the simulated time at the moment of connecting.
+    """
+    THIS.VIRTUAL_TIME = VirtualTime(client_socket, sim_time)
+    time.time = THIS.VIRTUAL_TIME.time
+    time.monotonic = THIS.VIRTUAL_TIME.monotonic
+    time.sleep = THIS.VIRTUAL_TIME.sleep
+    return THIS.VIRTUAL_TIME
+
+
+def get_virtual_time() -> Optional[VirtualTime]:
+    """
+    Get the installed virtual time, or None while the time module follows the wall clock.
+    """
+    return THIS.VIRTUAL_TIME
+
+
+def uninstall():
+    """
+    Restore the wall clock functions of the time module.
+    """
+    THIS.VIRTUAL_TIME = None
+    time.time = WALL_TIME
+    time.monotonic = WALL_MONOTONIC
+    time.sleep = WALL_SLEEP
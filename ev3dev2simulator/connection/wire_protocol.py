@@ -0,0 +1,239 @@
+"""
+The wire_protocol module contains the functions encoding and decoding the messages sent between the ev3dev2 mock and
+the simulator. Every message is a frame consisting of a 4 byte length header followed by a binary body.
+The body of a command starts with a byte identifying its type, followed by the fields of the type in a fixed layout.
+The body of a response is a tagged value, the body of a snapshot pushed to a client holds the values of its
+subscribed sensors.
+"""
+
+import asyncio
+import json
+import socket
+import struct
+from typing import Any, Optional
+
+FRAME_HEADER = struct.Struct('!I')
+TYPE_ID = struct.Struct('!B')
+STRING_LENGTH = struct.Struct('!I')
+DOUBLE = struct.Struct('!d')
+INTEGER = struct.Struct('!q')
+
+# string length marking a missing string, e.g. a motor command without stop action
+NULL_STRING = 2 ** 32 - 1
+
+# field formats
+STR = 'str'
+FLOAT = 'float'
+JSON = 'json'
+
+# per message type its identifier and the names and formats of its fields, in order
+MESSAGE_LAYOUTS = {
+    'RotateCommand': (1, (('address', STR), ('speed', FLOAT), ('distance', FLOAT), ('stop_action', STR))),
+    'StopCommand': (2, (('address', STR), ('speed', FLOAT), ('stop_action', STR))),
+    'SoundCommand': (3, (('message', STR), ('duration', FLOAT), ('soundType', STR))),
+    'LedCommand': (4, (('address', STR), ('brightness', FLOAT))),
+    'DataRequest': (5, (('address', STR),)),
+    'ConfigRequest': (6, (('kwargs', JSON), ('class_name', JSON))),
+    'TimeRequest': (7, ()),
+    'SleepRequest': (8, (('seconds', FLOAT),)),
+    'SubscribeRequest': (9, (('addresses', JSON),)),
+    'HelloRequest': (10, (('robot', STR), ('brick', STR))),
+}
+MESSAGE_TYPES = {type_id: (tpe, fields) for tpe, (type_id, fields) in MESSAGE_LAYOUTS.items()}
+
+# tags of the response values
+NONE_VALUE = 0
+BOOL_VALUE = 1
+INT_VALUE = 2
+FLOAT_VALUE = 3
+STR_VALUE = 4
+JSON_VALUE = 5
+# tag of a sensor snapshot, which is sent without a request
+SNAPSHOT = 6
+
+
+def encode_message(message_dict: dict) -> bytes:
+    """
+    Encode the serialized dictionary of a message into a frame.
+    :param message_dict: dictionary with the type and the fields of the message.
+    :return: bytes of the frame.
+    """
+    type_id, fields = MESSAGE_LAYOUTS[message_dict['type']]
+    parts = [TYPE_ID.pack(type_id)]
+    for name, field_format in fields:
+        value = message_dict[name]
+        if field_format == FLOAT:
+            parts.append(DOUBLE.pack(value))
+        else:
+            parts.append(_pack_string(value if field_format == STR else json.dumps(value)))
+    return frame(b''.join(parts))
+
+
+def decode_message(body: bytes) -> dict:
+    """
+    Decode the body of a message frame into the serialized dictionary of the message.
+    :param body: of the frame, without the header.
+    :return: dictionary with the type and the fields of the message.
+    """
+    tpe, fields = MESSAGE_TYPES[body[0]]
+    message_dict = {'type': tpe}
+    offset = TYPE_ID.size
+    for name, field_format in fields:
+        if field_format == FLOAT:
+            message_dict[name] = DOUBLE.unpack_from(body, offset)[0]
+            offset += DOUBLE.size
+        else:
+            value, offset = _unpack_string(body, offset)
+            message_dict[name] = value if field_format == STR else json.loads(value)
+    return message_dict
+
+
+def message_type(body: bytes) -> str:
+    """
+    Get the type of the message in the body of a frame, without decoding the message.
+    """
+    return MESSAGE_TYPES[body[0]][0]
+
+
+def encode_response(value: Any) -> bytes:
+    """
+    Encode the value of a response into a frame. Values other than None, booleans, numbers and strings,
+    such as the tuples of the color sensor, are encoded as JSON.
+    :param value: to encode.
+    :return: bytes of the frame.
+    """
+    return frame(_pack_value(value))
+
+
+def decode_response(body: bytes) -> Any:
+    """
+    Decode the body of a response frame into its value.
+    :param body: of the frame, without the header.
+    :return: the value of the response.
+    """
+    return _unpack_value(body, 0)[0]
+
+
+def encode_snapshot(values: dict) -> bytes:
+    """
+    Encode the values of sensors into a snapshot frame.
+    :param values: dictionary with the values of the sensors by address.
+    :return: bytes of the frame.
+    """
+    parts = [TYPE_ID.pack(SNAPSHOT), STRING_LENGTH.pack(len(values))]
+    for address, value in values.items():
+        parts.append(_pack_string(address))
+        parts.append(_pack_value(value))
+    return frame(b''.join(parts))
+
+
+def is_snapshot(body: bytes) -> bool:
+    """
+    Check whether the body of a frame received by a client is a snapshot instead of a response.
+    """
+    return body[0] == SNAPSHOT
+
+
+def decode_snapshot(body: bytes) -> dict:
+    """
+    Decode the body of a snapshot frame into the values of the sensors.
+    :param body: of the frame, without the header.
+    :return: dictionary with the values of the sensors by address.
+    """
+    count = STRING_LENGTH.unpack_from(body, TYPE_ID.size)[0]
+    offset = TYPE_ID.size + STRING_LENGTH.size
+    values = {}
+    for _ in range(count):
+        address, offset = _unpack_string(body, offset)
+        values[address], offset = _unpack_value(body, offset)
+    return values
+
+
+def frame(body: bytes) -> bytes:
+    """
+    Prefix the given body with its length.
+    """
+    return FRAME_HEADER.pack(len(body)) + body
+
+
+def receive_frame(sock: socket.socket) -> Optional[bytes]:
+    """
+    Receive the next frame from the socket, reading until the complete frame has arrived.
+    :param sock: to read from.
+    :return: the body of the frame, or None if the connection was closed before the frame started.
+    """
+    header = _receive_exactly(sock, FRAME_HEADER.size, True)
+    if header is None:
+        return None
+    return _receive_exactly(sock, FRAME_HEADER.unpack(header)[0], False)
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Optional[bytes]:
+    """
+    Read the next frame from an asyncio stream.
+    :param reader: to read from.
+    :return: the body of the frame, or None if the connection was closed before the frame started.
+    """
+    try:
+        header = await reader.readexactly(FRAME_HEADER.size)
+    except asyncio.IncompleteReadError as error:
+        if error.partial:
+            raise
+        return None
+    return await reader.readexactly(FRAME_HEADER.unpack(header)[0])
+
+
+def _receive_exactly(sock: socket.socket, size: int, allow_close: bool) -> Optional[bytes]:
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            if allow_close and not data:
+                return None
+            raise ConnectionError('connection closed in the middle of a message')
+        data += chunk
+    return bytes(data)
+
+
+def _pack_value(value: Any) -> bytes:
+    if value is None:
+        return TYPE_ID.pack(NONE_VALUE)
+    if isinstance(value, bool):
+        return TYPE_ID.pack(BOOL_VALUE) + TYPE_ID.pack(value)
+    if isinstance(value, int) and -2 ** 63 <= value < 2 ** 63:
+        return TYPE_ID.pack(INT_VALUE) + INTEGER.pack(value)
+    if isinstance(value, float):
+        return TYPE_ID.pack(FLOAT_VALUE) + DOUBLE.pack(value)
+    if isinstance(value, str):
+        return TYPE_ID.pack(STR_VALUE) + _pack_string(value)
+    return TYPE_ID.pack(JSON_VALUE) + _pack_string(json.dumps(value))
+
+
+def _unpack_value(body: bytes, offset: int) -> (Any, int):
+    tag = body[offset]
+    offset += TYPE_ID.size
+    if tag == NONE_VALUE:
+        return None, offset
+    if tag == BOOL_VALUE:
+        return bool(body[offset]), offset + TYPE_ID.size
+    if tag == INT_VALUE:
+        return INTEGER.unpack_from(body, offset)[0], offset + INTEGER.size
+    if tag == FLOAT_VALUE:
+        return DOUBLE.unpack_from(body, offset)[0], offset + DOUBLE.size
+    value, offset = _unpack_string(body, offset)
+    return (value if tag == STR_VALUE else json.loads(value)), offset
+
+
+def _pack_string(value: Optional[str]) -> bytes:
+    if value is None:
+        return STRING_LENGTH.pack(NULL_STRING)
+    encoded = value.encode()
+    return STRING_LENGTH.pack(len(encoded)) + encoded
+
+
+def _unpack_string(body: bytes, offset: int) -> (Optional[str], int):
+    length = STRING_LENGTH.unpack_from(body, offset)[0]
+    start = offset + STRING_LENGTH.size
+    if length == NULL_STRING:
+        return None, start
+    return body[start:start + length].decode(), start + length
@@ -14,7 +14,9 @@ class SensorConnector:
     """
     The SensorConnector class provides a translation layer between the ev3dev2 sensor classes
     and the sensors on the simulated robot. This includes sensor data.
-    This class is responsible for creating DataRequests to be send to simulator.
+    The connector subscribes to the sensor, so the simulator pushes its value after every frame and reading
+    the sensor is a lookup in the sensor cache of the client socket. When the simulator refuses the subscription,
+    as in lockstep mode, this class creates DataRequests to be send to simulator.
     """
 
     def __init__(self, address: str):
@@ -23,6 +25,7 @@ class SensorConnector:
             raise RuntimeError('created connector with None as address')
 
         self.client_socket = get_client_socket()
+        self.subscribed = self.client_socket.subscribe_sensor(address)
 
         self.wait_time = 0.008
         self.frame_time = 1 / int(get_simulation_settings()['exec_settings']['frames_per_second'])
@@ -37,6 +40,8 @@ class SensorConnector:
         would result in the same answer as the first, because they happened in such quick succession that the
         simulator data could not possibly have changed yet. :return: the value in any form of the sensor.
         """
+        if self.subscribed:
+            return int(self.client_socket.sensor_cache.get(self.address))
 
         now = time.time()
         delta = now - self.last_request_time
@@ -4,7 +4,7 @@ The module sound_connector contains the classes SimpleAudioError and SoundConnec
 
 
 import textwrap
-from time import sleep
+import time
 from typing import Any, Optional
 import threading
 import wave
@@ -67,7 +67,7 @@ class SoundConnector:
                     play_obj.wait_done()
                 except SimpleaudioError:
                     print("An error occurred when trying to play a file. Ignoring to keep simulation running")
-            sleep(delay / 1000.0)
+            time.sleep(delay / 1000.0)
 
     def beep(self, args, play_type: int) -> Optional[threading.Thread]:
         """
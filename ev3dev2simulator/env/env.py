@@ -0,0 +1,180 @@
+"""
+The env module contains the class Env, which lets a controller, e.g. one trained by reinforcement learning,
+drive a robot of a world directly, without sockets, robot program or visualisation.
+"""
+
+import math
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+from ev3dev2simulator.config.config import load_config, get_world_config, get_simulation_settings
+from ev3dev2simulator.simulator import expand_cosc343_tiles
+from ev3dev2simulator.state.motion_profile import MotionProfile
+from ev3dev2simulator.state.sim_clock import SimClock
+from ev3dev2simulator.state.world_simulator import WorldSimulator
+from ev3dev2simulator.state.world_state import WorldState, WORLD_SCALE
+
+
+class Env:
+    """
+    Environment with the step and reset interface of Gym around a world simulated without a window.
+    A step applies an action to one robot of the world, the first one unless a robot name is given, and advances
+    the world by frames_per_step frames as fast as possible. The action holds the speeds of the left motor,
+    the right motor and, when the robot has one, the arm, in degrees per second like the speeds of the ev3dev2 motors.
+
+    The observation is an array with the value of every sensor of the robot, in the order of the robot
+    configuration (color code, distance in millimeters or touch state), followed by the pose of the robot:
+    its x and y position in millimeters and its angle in degrees. The names of the values are in observation_names.
+    The episode is done when the robot falls off the board or into a hole. The reward is computed by the reward
+    function from the environment after every step, and is 0 without one. On reset, the start position and angle
+    of the robot can be varied by normal noise with the standard deviations of start_noise, in millimeters and degrees.
+    Environments of the same world can share the lookups of the colors and the ground with shared_sensing.
+
+    The target of 10k steps per second per core on config_small is not reached: benchmarks/env_benchmark.py
+    measures about 6.5-7.5k steps per second with one frame per step. The time is spread without a single
+    hotspot: about half goes to evaluating the sensors for the observation (pymunk segment and shape queries of the
+    ultrasonic and touch sensors, raster lookups of the color sensor) and most of the rest to the per-frame
+    bookkeeping of the robot (actuator jobs, the falling check of the wheels, moving the sprites), while
+    space.step itself takes less than a twentieth.
+    """
+
+    def __init__(self,  # pylint: disable=too-many-arguments
+                 world: str = 'config_small', robot: Optional[str] = None, frames_per_step: int = 1,
+                 reward_function: Callable[['Env'], float] = None, start_noise: Tuple[float, float] = (0, 0),
+                 orig_path: str = None, shared_sensing: Optional[WorldState] = None):
+        load_config(world, orig_path)
+        config = get_world_config()
+        expand_cosc343_tiles(config)
+
+        self.world_state = WorldState(config)
+        self.world_simulator = WorldSimulator(self.world_state, SimClock(lockstep=True))
+        self.world_state.setup_pymunk_shapes(WORLD_SCALE)
+        if shared_sensing is not None:
+            self.world_state.share_lookups(shared_sensing)
+        self.world_state.setup_sensing(WORLD_SCALE)
+
+        self.robot_sim = self.world_simulator.robot_simulators[0]
+        if robot is not None:
+            self.robot_sim = next(robot_sim for robot_sim in self.world_simulator.robot_simulators
+                                  if robot_sim.robot.name == robot)
+        self.robot = self.robot_sim.robot
+
+        settings = get_simulation_settings()
+        frames_per_second = int(settings['exec_settings']['frames_per_second'])
+        # degrees per second of a wheel motor to millimeters per frame, and of the arm motor to degrees per frame
+        self.wheel_factor = float(settings['wheel_settings']['circumference']) / 360 / frames_per_second
+        self.arm_factor = -1 / frames_per_second
+
+        self.left_motor = self.right_motor = self.arm = None
+        for address, actuator in self.robot_sim.actuator_info.items():
+            if actuator.ev3type == 'motor':
+                if actuator.x_offset < 0:
+                    self.left_motor = address
+                else:
+                    self.right_motor = address
+            elif actuator.ev3type == 'arm' and self.arm is None:
+                self.arm = address
+
+        self.frames_per_step = frames_per_step
+        self.reward_function = reward_function
+        self.start_noise = start_noise
+        self.random = np.random.default_rng()
+
+        self.sensor_addresses = list(self.robot.sensors)
+        self.observation_names = [f'{brick}:{address}' for brick, address in self.sensor_addresses] + \
+                                 ['x', 'y', 'angle']
+        self.observation = np.zeros(len(self.observation_names), dtype=np.float32)
+        self.steps = 0
+
+    def reset(self, seed: Optional[int] = None) -> np.ndarray:
+        """
+        Put the robots and obstacles back at their start positions and stop all motors.
+        :param seed: for the random generator drawing the start noise, keeps the current generator if None.
+        :return: the first observation of the episode.
+        """
+        if seed is not None:
+            self.random = np.random.default_rng(seed)
+
+        self.world_state.reset()
+        for robot_sim in self.world_simulator.robot_simulators:
+            robot_sim.reset()
+        self.world_simulator.should_reset = False
+        self.world_simulator.clock.frame = 0
+        self.steps = 0
+
+        position_noise, angle_noise = self.start_noise
+        if position_noise or angle_noise:
+            body = self.robot.body
+            offset = tuple(self.random.normal(0, position_noise, 2) * WORLD_SCALE)
+            body.angle += math.radians(self.random.normal(0, angle_noise))
+            body.position += offset
+        for robot_sim in self.world_simulator.robot_simulators:
+            robot_sim.robot.set_last_pos(robot_sim.robot.body.position)
+            robot_sim.robot.last_angle = math.degrees(robot_sim.robot.body.angle)
+        return self._observe()
+
+    def snapshot(self) -> tuple:
+        """
+        Get the state of the episode, e.g. to explore several actions from it.
+        :return: picklable state, which restore accepts.
+        """
+        return self.steps, self.world_simulator.snapshot()
+
+    def restore(self, state: tuple) -> np.ndarray:
+        """
+        Continue the episode from a state returned by snapshot.
+        :param state: to restore.
+        :return: the observation of the restored state.
+        """
+        self.steps, world_state = state
+        self.world_simulator.restore(world_state)
+        return self._observe()
+
+    def step(self, action) -> Tuple[np.ndarray, float, bool, dict]:
+        """
+        Apply the speeds of the action to the motors for the duration of the step and simulate the step.
+        :param action: speeds of the left motor, right motor and optionally the arm, in degrees per second.
+        :return: the observation, the reward, whether the episode is done and a dictionary with the simulated time.
+        """
+        self.simulate(action)
+        observation = self._observe()
+        return observation, self.get_reward(), self.robot.is_falling(), {'time': self.world_simulator.clock.time}
+
+    def simulate(self, action):
+        """
+        Apply the speeds of the action to the motors and advance the world by frames_per_step frames,
+        without observing the result.
+        :param action: speeds of the left motor, right motor and optionally the arm, in degrees per second.
+        """
+        self._set_speed(self.left_motor, action[0] * self.wheel_factor)
+        self._set_speed(self.right_motor, action[1] * self.wheel_factor)
+        if self.arm is not None and len(action) > 2:
+            self._set_speed(self.arm, action[2] * self.arm_factor)
+
+        for _ in range(self.frames_per_step):
+            self.world_simulator.update()
+        self.steps += 1
+
+    def get_reward(self) -> float:
+        """
+        Get the reward of the reward function for the current state, 0 without a reward function.
+        """
+        return self.reward_function(self) if self.reward_function is not None else 0.0
+
+    def _set_speed(self, address: (int, str), value_per_frame: float):
+        if address is not None:
+            self.robot_sim.set_actuator_profile(address, MotionProfile(value_per_frame, self.frames_per_step))
+
+    def _observe(self) -> np.ndarray:
+        """
+        Evaluate the sensors of the robot and store their values and the pose of the robot in a new observation.
+        """
+        observation = self.observation
+        for index, address in enumerate(self.sensor_addresses):
+            observation[index] = self.robot_sim.evaluate_sensor(address)
+        position = self.robot.body.position
+        observation[-3] = position.x / WORLD_SCALE
+        observation[-2] = position.y / WORLD_SCALE
+        observation[-1] = math.degrees(self.robot.body.angle)
+        return observation.copy()
@@ -0,0 +1,241 @@
+"""
+The vector_env module contains the class VectorEnv, which steps several independent worlds together and returns
+their observations, rewards and done flags as stacked arrays.
+"""
+
+import ctypes
+import multiprocessing
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+from pymunk import Vec2d
+
+from ev3dev2simulator.env.env import Env
+from ev3dev2simulator.robotpart.color_sensor import ColorSensor
+from ev3dev2simulator.state.world_state import WORLD_SCALE
+
+
+class VectorEnv:
+    """
+    Environment holding num_envs independent copies of a world, each with its own pymunk space, which are stepped
+    together. The arguments of the copies are those of Env. Row i of the stacked arrays belongs to world i.
+
+    The worlds share their lookups of the colors and the ground, so the color sensors and the wheels of all robots
+    are looked up in one array gather after each step instead of one by one. Worlds that are done are reset
+    automatically: their row holds the first observation of the next episode and their info the last observation
+    of the episode under 'terminal_observation'.
+
+    With processes > 0 the worlds are divided over that many worker processes, which write their rows directly
+    into observation, reward and done arrays in shared memory. The reward function must then be picklable on
+    platforms that do not fork.
+    """
+
+    def __init__(self,  # pylint: disable=too-many-arguments
+                 num_envs: int, world: str = 'config_small', robot: Optional[str] = None,
+                 frames_per_step: int = 1, reward_function: Callable[[Env], float] = None,
+                 start_noise: Tuple[float, float] = (0, 0), orig_path: str = None, processes: int = 0):
+        env_kwargs = {'world': world, 'robot': robot, 'frames_per_step': frames_per_step,
+                      'reward_function': reward_function, 'start_noise': start_noise, 'orig_path': orig_path}
+        self.num_envs = num_envs
+        self.envs = []
+        self.workers = []
+
+        if processes > 0:
+            self.observation_names = Env(**env_kwargs).observation_names
+            self._start_workers(min(processes, num_envs), env_kwargs)
+        else:
+            self.envs.append(Env(**env_kwargs))
+            shared_sensing = self.envs[0].world_state
+            self.envs.extend(Env(**env_kwargs, shared_sensing=shared_sensing) for _ in range(num_envs - 1))
+            self.observation_names = self.envs[0].observation_names
+            self.observations = np.zeros((num_envs, len(self.observation_names)), dtype=np.float32)
+            self.rewards = np.zeros(num_envs, dtype=np.float64)
+            self.dones = np.zeros(num_envs, dtype=np.bool_)
+            self._setup_lookups()
+
+    def _setup_lookups(self):
+        """
+        Collect the color sensors and wheels of all robots with their offsets from the body of the robot,
+        so their positions can be computed for all robots at once.
+        """
+        world_state = self.envs[0].world_state
+        self.color_lookup = world_state.color_lookup
+        # indexed by the obstacle indices of the lookup, NO_OBSTACLE (-1) selects the color of no obstacle
+        self.color_table = np.array([obstacle.color_code for obstacle in self.color_lookup.obstacles] + [0])
+        self.falling_lookup = world_state.falling_lookup
+        self.falling_table = world_state.falling_table
+
+        color_sensors = []
+        self.other_sensors = []
+        wheels = []
+        for env_index, env in enumerate(self.envs):
+            for column, address in enumerate(env.sensor_addresses):
+                sensor = env.robot.sensors[address]
+                if isinstance(sensor, ColorSensor):
+                    color_sensors.append((env_index, column, Vec2d(sensor.shape.center_of_gravity)))
+                else:
+                    self.other_sensors.append((env_index, column, address))
+            wheels.extend((env_index, 0, Vec2d(wheel.shape.center_of_gravity)) for wheel in env.robot.get_wheels())
+
+        self.color_parts = self._to_arrays(color_sensors)
+        self.wheel_parts = self._to_arrays(wheels)
+
+    @staticmethod
+    def _to_arrays(parts: list) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Convert (environment index, observation column, offset) tuples to arrays of the indices, columns and offsets.
+        """
+        env_indices = np.array([env_index for env_index, _, _ in parts], dtype=int)
+        columns = np.array([column for _, column, _ in parts], dtype=int)
+        offsets = np.array([tuple(offset) for _, _, offset in parts], dtype=float).reshape(-1, 2)
+        return env_indices, columns, offsets
+
+    def reset(self, seed: Optional[int] = None) -> np.ndarray:
+        """
+        Reset all worlds.
+        :param seed: world i draws its start noise from a generator seeded with seed + i, keeps the generators if None.
+        :return: the first observations of all worlds.
+        """
+        if self.workers:
+            for worker in self.workers:
+                worker['connection'].send(('reset', None if seed is None else seed + worker['start']))
+            for worker in self.workers:
+                worker['connection'].recv()
+        else:
+            for index, env in enumerate(self.envs):
+                self.observations[index] = env.reset(None if seed is None else seed + index)
+        return self.observations.copy()
+
+    def step(self, actions) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[dict]]:
+        """
+        Apply an action to every world and simulate the step in all of them.
+        :param actions: array with per world the speeds of the left motor, right motor and optionally the arm.
+        :return: the stacked observations, rewards and done flags, and a list with the info of every world.
+        """
+        if self.workers:
+            for worker in self.workers:
+                worker['connection'].send(('step', actions[worker['start']:worker['stop']]))
+            infos = []
+            for worker in self.workers:
+                infos.extend(worker['connection'].recv())
+        else:
+            infos = self.step_local(actions)
+        return self.observations.copy(), self.rewards.copy(), self.dones.copy(), infos
+
+    def step_local(self, actions) -> List[dict]:
+        """
+        Step all worlds of this process, storing their results in the arrays of this VectorEnv.
+        Used by step without workers and by the worker processes, which write to the shared arrays.
+        :param actions: array with per world of this process the speeds of the motors.
+        :return: the info of every world of this process.
+        """
+        for env, action in zip(self.envs, actions):
+            env.simulate(action)
+        self._observe()
+
+        infos = []
+        for index, env in enumerate(self.envs):
+            self.rewards[index] = env.get_reward()
+            info = {'time': env.world_simulator.clock.time}
+            if self.dones[index]:
+                info['terminal_observation'] = self.observations[index].copy()
+                self.observations[index] = env.reset()
+            infos.append(info)
+        return infos
+
+    def _observe(self):
+        """
+        Store the observations and done flags of all worlds. The color sensors and wheels of all robots are looked up
+        at once, the other sensors are evaluated per robot.
+        """
+        observations = self.observations
+        for env_index, column, address in self.other_sensors:
+            observations[env_index, column] = self.envs[env_index].robot_sim.evaluate_sensor(address)
+
+        poses = np.array([(body.position.x, body.position.y, body.angle)
+                          for body in (env.robot.body for env in self.envs)])
+        observations[:, -3:-1] = poses[:, :2] / WORLD_SCALE
+        observations[:, -1] = np.degrees(poses[:, 2])
+
+        env_indices, columns, offsets = self.color_parts
+        x_coords, y_coords = self._get_positions(poses, env_indices, offsets)
+        observations[env_indices, columns] = self.color_table[self.color_lookup.get_obstacle_indices(x_coords,
+                                                                                                      y_coords)]
+
+        env_indices, _, offsets = self.wheel_parts
+        x_coords, y_coords = self._get_positions(poses, env_indices, offsets)
+        falling = self.falling_table[self.falling_lookup.get_obstacle_indices(x_coords, y_coords)]
+        self.dones[:] = np.bincount(env_indices[falling], minlength=self.num_envs) > 0
+
+    @staticmethod
+    def _get_positions(poses: np.ndarray, env_indices: np.ndarray, offsets: np.ndarray) -> (np.ndarray, np.ndarray):
+        """
+        Get the positions of parts from their offsets to the bodies of the robots they are attached to.
+        """
+        x_coords, y_coords, angles = poses[env_indices].T
+        cos, sin = np.cos(angles), np.sin(angles)
+        return (x_coords + offsets[:, 0] * cos - offsets[:, 1] * sin,
+                y_coords + offsets[:, 0] * sin + offsets[:, 1] * cos)
+
+    def _start_workers(self, processes: int, env_kwargs: dict):
+        """
+        Divide the worlds over worker processes and create the arrays in shared memory that they write to.
+        """
+        columns = len(self.observation_names)
+        shared_observations = multiprocessing.RawArray(ctypes.c_float, self.num_envs * columns)
+        shared_rewards = multiprocessing.RawArray(ctypes.c_double, self.num_envs)
+        shared_dones = multiprocessing.RawArray(ctypes.c_bool, self.num_envs)
+        self.observations, self.rewards, self.dones = _as_arrays(shared_observations, shared_rewards, shared_dones,
+                                                                 columns)
+
+        bounds = np.linspace(0, self.num_envs, processes + 1).astype(int)
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            connection, worker_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=self._run_worker, daemon=True,
+                                              args=(worker_connection, start, stop, env_kwargs, shared_observations,
+                                                    shared_rewards, shared_dones))
+            process.start()
+            worker_connection.close()
+            self.workers.append({'process': process, 'connection': connection, 'start': start, 'stop': stop})
+
+    def close(self):
+        """
+        Stop the worker processes, if any.
+        """
+        for worker in self.workers:
+            worker['connection'].send(('close', None))
+        for worker in self.workers:
+            worker['process'].join()
+            worker['connection'].close()
+        self.workers = []
+
+    @staticmethod
+    def _run_worker(connection, start: int, stop: int, env_kwargs: dict, shared_observations, shared_rewards,
+                    shared_dones):
+        """
+        Step the worlds start to stop in a worker process as commanded through the connection,
+        storing their rows in the shared arrays.
+        """
+        vector_env = VectorEnv(stop - start, **env_kwargs)
+        observations, rewards, dones = _as_arrays(shared_observations, shared_rewards, shared_dones,
+                                                  len(vector_env.observation_names))
+        vector_env.observations = observations[start:stop]
+        vector_env.rewards = rewards[start:stop]
+        vector_env.dones = dones[start:stop]
+
+        while True:
+            command, data = connection.recv()
+            if command == 'step':
+                connection.send(vector_env.step_local(data))
+            elif command == 'reset':
+                vector_env.reset(data)
+                connection.send(None)
+            else:
+                break
+        connection.close()
+
+
+def _as_arrays(shared_observations, shared_rewards, shared_dones, columns: int) -> Tuple[np.ndarray, ...]:
+    return (np.frombuffer(shared_observations, dtype=np.float32).reshape(-1, columns),
+            np.frombuffer(shared_rewards, dtype=np.float64),
+            np.frombuffer(shared_dones, dtype=np.bool_))
@@ -2,8 +2,6 @@
 The arm_floor module contains the class ArmFloor. A class representing the ground of the sidebar arm.
 """
 
-from arcade import create_rectangle
-
 
 class ArmFloor:
     """
@@ -27,4 +25,6 @@ class ArmFloor:
         """
         Create the small and long rectangle shown below the sidebar arm.
         """
+        from arcade import create_rectangle  # pylint: disable=import-outside-toplevel
+
         self.shape = create_rectangle(x, y, width, height, self.color)
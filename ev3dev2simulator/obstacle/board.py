@@ -2,11 +2,11 @@
 The module board contains the class Board, the background of the playing field.
 """
 
-
-import arcade as _arcade
+import numpy as np
 
 from ev3dev2simulator.obstacle.color_obstacle import ColorObstacle
-from ev3dev2simulator.util.util import to_color_code
+from ev3dev2simulator.util.util import BoundingBox, Color, PointList, are_points_in_polygon, get_bounding_box, \
+    get_rectangle_points, is_point_in_polygon, to_color_code
 
 
 class Board(ColorObstacle):
@@ -19,7 +19,7 @@ class Board(ColorObstacle):
                  y: float,
                  width: int,
                  height: int,
-                 color: _arcade.Color):
+                 color: Color):
         super(Board, self).__init__(to_color_code(color))
         self.x = x
         self.y = y
@@ -38,29 +38,36 @@ class Board(ColorObstacle):
         """
         return [self.shape]
 
+    def create_points(self, scale):
+        """
+        Calculates the outline of the board, used for collision detection.
+        """
+        self.points = self._create_points(scale)
+
     def create_shape(self, scale):
         """
         Creates the shape of the border.
         """
-        self.points = self._create_points(scale)
+        self.create_points(scale)
         self.shape = self._create_shape()
 
-    def _create_points(self, scale) -> _arcade.PointList:
+    def _create_points(self, scale) -> PointList:
         """
         Create a list of points representing this rock in 2D space.
         :return: a PointList object.
         """
-        return _arcade.get_rectangle_points(self.x * scale,
-                                            self.y * scale,
-                                            self.width * scale,
-                                            self.height * scale,
-                                            self.angle)
+        return get_rectangle_points(self.x * scale,
+                                    self.y * scale,
+                                    self.width * scale,
+                                    self.height * scale,
+                                    self.angle)
 
-    def _create_shape(self) -> _arcade.Shape:
+    def _create_shape(self):
         """
         Create a shape representing the rectangle of this rock.
         :return: a Arcade shape object.
         """
+        import arcade as _arcade  # pylint: disable=import-outside-toplevel
 
         colors = []
 
@@ -77,4 +84,10 @@ class Board(ColorObstacle):
         :return: True if collision detected.
         """
 
-        return _arcade.is_point_in_polygon(x, y, self.points)
+        return is_point_in_polygon(x, y, self.points)
+
+    def collided_with_points(self, x_coords: np.ndarray, y_coords: np.ndarray) -> np.ndarray:
+        return are_points_in_polygon(x_coords, y_coords, self.points)
+
+    def get_bounding_box(self) -> BoundingBox:
+        return get_bounding_box(self.points)
@@ -3,9 +3,11 @@ The border_obstacle module contains the class BorderObstacle
 It is a class representing any obstacle acting as a square border.
 """
 
-import arcade as _arcade
+import numpy as np
 
 from ev3dev2simulator.obstacle.color_obstacle import ColorObstacle
+from ev3dev2simulator.util.util import BoundingBox, are_points_in_polygon, get_bounding_box, get_rectangle_points, \
+    is_point_in_polygon
 
 
 class BorderObstacle(ColorObstacle):
@@ -26,6 +28,12 @@ class BorderObstacle(ColorObstacle):
         self.bottom_points = None
         self.left_points = None
 
+    def create_points(self, scale):
+        """
+        Calculates the outline of the border, used for collision detection.
+        """
+        self._calc_points(scale)
+
     def _calc_points(self, scale):
         """
         Calculate the points of the polygon this BorderObstacle consist of.
@@ -44,28 +52,37 @@ class BorderObstacle(ColorObstacle):
         border_long_width = screen_width - screen_edge_spacing * 2
         border_long_height = screen_height - screen_edge_spacing * 2
 
-        self.top_points = _arcade.get_rectangle_points(screen_center_x,
-                                                       screen_height - screen_edge_spacing - (draw_depth / 2),
-                                                       border_long_width,
-                                                       draw_depth)
+        self.top_points = get_rectangle_points(screen_center_x,
+                                               screen_height - screen_edge_spacing - (draw_depth / 2),
+                                               border_long_width,
+                                               draw_depth)
 
-        self.right_points = _arcade.get_rectangle_points(screen_width - screen_edge_spacing - (draw_depth / 2),
-                                                         screen_center_y,
-                                                         draw_depth,
-                                                         border_long_height)
+        self.right_points = get_rectangle_points(screen_width - screen_edge_spacing - (draw_depth / 2),
+                                                 screen_center_y,
+                                                 draw_depth,
+                                                 border_long_height)
 
-        self.bottom_points = _arcade.get_rectangle_points(screen_center_x,
-                                                          screen_edge_spacing + (draw_depth / 2),
-                                                          border_long_width,
-                                                          draw_depth)
+        self.bottom_points = get_rectangle_points(screen_center_x,
+                                                  screen_edge_spacing + (draw_depth / 2),
+                                                  border_long_width,
+                                                  draw_depth)
 
-        self.left_points = _arcade.get_rectangle_points(screen_edge_spacing + (draw_depth / 2),
-                                                        screen_center_y,
-                                                        draw_depth,
-                                                        border_long_height)
+        self.left_points = get_rectangle_points(screen_edge_spacing + (draw_depth / 2),
+                                                screen_center_y,
+                                                draw_depth,
+                                                border_long_height)
 
     def collided_with(self, x: float, y: float) -> bool:
         for side in [self.top_points, self.right_points, self.bottom_points, self.left_points]:
-            if _arcade.is_point_in_polygon(x, y, side):
+            if is_point_in_polygon(x, y, side):
                 return True
         return False
+
+    def collided_with_points(self, x_coords: np.ndarray, y_coords: np.ndarray) -> np.ndarray:
+        collided = np.zeros(np.shape(x_coords), dtype=bool)
+        for side in [self.top_points, self.right_points, self.bottom_points, self.left_points]:
+            collided |= are_points_in_polygon(x_coords, y_coords, side)
+        return collided
+
+    def get_bounding_box(self) -> BoundingBox:
+        return get_bounding_box(self.top_points + self.right_points + self.bottom_points + self.left_points)
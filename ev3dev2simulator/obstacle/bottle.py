@@ -3,11 +3,10 @@ The module bottle contains the class Bottle, that represents a wine bottle.
 """
 
 import pymunk
-import arcade as _arcade
-from arcade import Sprite
 
 from ev3dev2simulator.obstacle.movable_object import MovableObject
 from ev3dev2simulator.util.point import Point
+from ev3dev2simulator.util.util import Color
 
 
 class Bottle(MovableObject):
@@ -17,7 +16,7 @@ class Bottle(MovableObject):
     def __init__(self,
                  pos: Point,
                  radius: float,
-                 color: _arcade.Color):
+                 color: Color):
         super().__init__(pos, 0, color)
 
         self.radius = radius
@@ -54,6 +53,8 @@ class Bottle(MovableObject):
         """
         Create the sprite, the visuals of the bottle.
         """
+        from arcade import Sprite  # pylint: disable=import-outside-toplevel
+
         pos_x, pos_y = self.get_pos()
         self.sprite = Sprite('assets/images/bottle.png', scale=scale * 2 * (self.radius / 948),
                              center_x=pos_x * scale, center_y=pos_y * scale)
@@ -2,6 +2,12 @@
 module color_obstacle containing the abstract class ColorObstacle.
 """
 
+from typing import Optional
+
+import numpy as np
+
+from ev3dev2simulator.util.util import BoundingBox
+
 
 class ColorObstacle:
     """
@@ -19,6 +25,21 @@ class ColorObstacle:
         :return: True if collision detected.
         """
 
+    def collided_with_points(self, x_coords: np.ndarray, y_coords: np.ndarray) -> np.ndarray:
+        """
+        Check for each of the given points if it is inside this obstacle, like collided_with does for a single point.
+        :param x_coords: array with the x coordinates of the points.
+        :param y_coords: array with the y coordinates of the points.
+        :return: boolean array, True where a collision is detected.
+        """
+        return np.vectorize(self.collided_with, otypes=[bool])(x_coords, y_coords)
+
+    def get_bounding_box(self) -> Optional[BoundingBox]:
+        """
+        Get the area outside of which no point collides with this obstacle.
+        :return: the minimal x, minimal y, maximal x and maximal y, or None if the area is unknown.
+        """
+
     def get_color_code(self):
         """
         Returns the saved color code
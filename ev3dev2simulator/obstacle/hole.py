@@ -2,11 +2,10 @@
 Module containing the class Hole, used to detect robots driving into lakes.
 """
 
+import numpy as np
 
-import arcade
-from arcade import PointList
-
-from ev3dev2simulator.util.util import get_circle_points
+from ev3dev2simulator.util.util import BoundingBox, PointList, are_points_in_polygon, get_bounding_box, \
+    get_circle_points, is_point_in_polygon
 
 
 class Hole:
@@ -27,9 +26,9 @@ class Hole:
         # visualisation
         self.points = None
 
-    def create_shape(self, scale):
+    def create_points(self, scale):
         """
-        Creates the shape of the hole.
+        Calculates the outline of the hole, used for collision detection.
         """
         self.points = self._create_points(scale)
 
@@ -51,4 +50,19 @@ class Hole:
         :return: True if collision detected.
         """
 
-        return arcade.is_point_in_polygon(x, y, self.points)
+        return is_point_in_polygon(x, y, self.points)
+
+    def collided_with_points(self, x_coords: np.ndarray, y_coords: np.ndarray) -> np.ndarray:
+        """
+        Check for each of the given points if it is inside this hole.
+        :param x_coords: array with the x coordinates of the points.
+        :param y_coords: array with the y coordinates of the points.
+        :return: boolean array, True where a collision is detected.
+        """
+        return are_points_in_polygon(x_coords, y_coords, self.points)
+
+    def get_bounding_box(self) -> BoundingBox:
+        """
+        Get the area outside of which no point is inside this hole.
+        """
+        return get_bounding_box(self.points)
@@ -2,13 +2,13 @@
 Module lake containing the class Lake, an obstacle on the playground.
 """
 
-import arcade
-from arcade import Shape, PointList, create_line_strip, create_ellipse_filled
+import numpy as np
 
 from ev3dev2simulator.obstacle.color_obstacle import ColorObstacle
 from ev3dev2simulator.obstacle.hole import Hole
 from ev3dev2simulator.util.point import Point
-from ev3dev2simulator.util.util import get_circle_points, distance_between_points, to_color_code
+from ev3dev2simulator.util.util import BoundingBox, Color, PointList, get_circle_points, distance_between_points, \
+    to_color_code
 
 
 class Lake(ColorObstacle):
@@ -21,7 +21,7 @@ class Lake(ColorObstacle):
                  pos: Point,
                  outer_radius: float,
                  inner_radius: float,
-                 color: arcade.Color,
+                 color: Color,
                  border_width: int,
                  hole_config: (bool, int)
                  ):
@@ -52,16 +52,22 @@ class Lake(ColorObstacle):
         """
         return [self.shape]
 
-    def create_shape(self, scale):
+    def create_points(self, scale):
         """
-        Creates the shape of lake.
+        Calculates the position of the lake and its hole, used for collision detection.
         """
         self.scale = scale
         self.center_x = self.x * scale
         self.center_y = self.y * scale
-        self.shape = self._create_shape(scale)
         if self.hole is not None:
-            self.hole.create_shape(scale)
+            self.hole.create_points(scale)
+
+    def create_shape(self, scale):
+        """
+        Creates the shape of lake.
+        """
+        self.create_points(scale)
+        self.shape = self._create_shape(scale)
 
     @classmethod
     def from_config(cls, config):
@@ -90,11 +96,14 @@ class Lake(ColorObstacle):
                                  self.center_y,
                                  self.outer_radius * scale)
 
-    def _create_shape(self, scale) -> Shape:
+    def _create_shape(self, scale):
         """
         Create a shape representing this lake.
         :return: a Arcade shape object.
         """
+        # pylint: disable=import-outside-toplevel
+        from arcade import create_line_strip, create_ellipse_filled
+
         if self.hole is not None:
             points = self._create_points(scale)
             return create_line_strip(points,
@@ -118,3 +127,17 @@ class Lake(ColorObstacle):
             return (self.inner_radius * self.scale) < distance <\
                    ((self.outer_radius + (self.border_width/2)) * self.scale)
         return distance < (self.outer_radius * self.scale)
+
+    def collided_with_points(self, x_coords: np.ndarray, y_coords: np.ndarray) -> np.ndarray:
+        distance = np.hypot(x_coords - self.center_x, y_coords - self.center_y)
+        if self.hole is not None:
+            return ((self.inner_radius * self.scale) < distance) & \
+                   (distance < ((self.outer_radius + (self.border_width / 2)) * self.scale))
+        return distance < (self.outer_radius * self.scale)
+
+    def get_bounding_box(self) -> BoundingBox:
+        if self.hole is not None:
+            radius = (self.outer_radius + (self.border_width / 2)) * self.scale
+        else:
+            radius = self.outer_radius * self.scale
+        return self.center_x - radius, self.center_y - radius, self.center_x + radius, self.center_y + radius
@@ -3,10 +3,10 @@ Module movable_object contains the class MovableObject.
 """
 import math
 
-import arcade as _arcade
 import pymunk
 
 from ev3dev2simulator.util.point import Point
+from ev3dev2simulator.util.util import Color
 
 
 class MovableObject:
@@ -16,7 +16,7 @@ class MovableObject:
     def __init__(self,
                  pos: Point,
                  angle: int,
-                 color: _arcade.Color):
+                 color: Color):
 
         self.x = pos.x
         self.y = pos.y
@@ -2,13 +2,12 @@
 Module lake containing the class Lake, an obstacle on the playground.
 """
 
-import arcade
-from arcade import Shape, PointList, create_rectangle_filled
+import numpy as np
 
 from ev3dev2simulator.obstacle.color_obstacle import ColorObstacle
 from ev3dev2simulator.util.point import Point
 from ev3dev2simulator.util.dimensions import Dimensions
-from ev3dev2simulator.util.util import get_rectangle_points, to_color_code
+from ev3dev2simulator.util.util import BoundingBox, Color, to_color_code
 
 
 class Tile(ColorObstacle):
@@ -20,7 +19,7 @@ class Tile(ColorObstacle):
     def __init__(self,
                  pos: Point,
                  dims: Dimensions,
-                 color: arcade.Color,
+                 color: Color,
                  ):
         super(Tile, self).__init__(to_color_code(color))
 
@@ -43,14 +42,20 @@ class Tile(ColorObstacle):
         """
         return [self.shape]
 
-    def create_shape(self, scale):
+    def create_points(self, scale):
         """
-        Creates the shape of lake.
+        Calculates the position of the tile, used for collision detection.
         """
         self.scale = scale
         self.center_x = self.x * scale
         self.center_y = self.y * scale
-        self.shape = self._create_shape(scale)
+
+    def create_shape(self, scale):
+        """
+        Creates the shape of the tile.
+        """
+        self.create_points(scale)
+        self.shape = self._create_shape()
 
     @classmethod
     def from_config(cls, config):
@@ -63,23 +68,15 @@ class Tile(ColorObstacle):
 
         return cls(pos, dims, color)
 
-    def _create_points(self, scale) -> PointList:
-        """
-        Create a list of points representing this Lake in 2D space.
-        :return: a PointList object.
-        """
-
-        return get_rectangle_points(self.center_x,
-                                 self.center_y,
-                                 self.width * scale,
-                                 self.height * scale)
-
-    def _create_shape(self, scale) -> Shape:
+    def _create_shape(self):
         """
-        Create a shape representing this lake.
+        Create a shape representing this tile at the scale of its points.
         :return: a Arcade shape object.
         """
-        return create_rectangle_filled(self.center_x, self.center_y, self.width * scale, self.height * scale, self.color)
+        from arcade import create_rectangle_filled  # pylint: disable=import-outside-toplevel
+
+        return create_rectangle_filled(self.center_x, self.center_y, self.width * self.scale, self.height * self.scale,
+                                       self.color)
 
 
     def collided_with(self, x: float, y: float) -> bool:
@@ -100,3 +97,13 @@ class Tile(ColorObstacle):
             return True
 
         return False
+
+    def collided_with_points(self, x_coords: np.ndarray, y_coords: np.ndarray) -> np.ndarray:
+        left_x, bottom_y, right_x, top_y = self.get_bounding_box()
+        return (x_coords >= left_x) & (x_coords <= right_x) & (y_coords >= bottom_y) & (y_coords <= top_y)
+
+    def get_bounding_box(self) -> BoundingBox:
+        half_width = self.width * self.scale / 2
+        half_height = self.height * self.scale / 2
+        return (self.center_x - half_width, self.center_y - half_height,
+                self.center_x + half_width, self.center_y + half_height)
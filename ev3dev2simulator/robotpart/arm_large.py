@@ -4,26 +4,24 @@ The arm_large module contains the class ArmLarge that simulated the arms as seen
 
 import math
 
-from arcade import Sprite
-import arcade
-
 from ev3dev2simulator.config.config import get_simulation_settings
 from ev3dev2simulator.obstacle.arm_floor import ArmFloor
 
 
-class ArmLarge(Sprite):
+class ArmLarge:
     """
     Class representing the arm as seen from above in the sidebar.
+    The orientation is kept here, the sprite is only created when the arm is visualised.
     """
 
     def __init__(self):
-        super(ArmLarge, self).__init__()
-
+        self.angle = 0
         self.x = None
         self.y = None
         self.rotate_x = None
         self.rotate_y = None
-        self.side_bar_ground = ArmFloor(300, 10, arcade.color.BLACK)
+        self.side_bar_ground = ArmFloor(300, 10, (0, 0, 0))
+        self.sprite = None
 
         self.sweep_length = 229 / 4
 
@@ -39,33 +37,24 @@ class ArmLarge(Sprite):
         Draws the ground of the arm and the arm itself.
         """
         self.side_bar_ground.shape.draw()
-        super(ArmLarge, self).draw()
+        self.sprite.draw()
 
     def setup_visuals(self, x, y, width, height):
         """
         Setup the visuals of the robot arm and add a bottom border to it.
         """
-        self.center_x = x
-        self.center_y = y
+        from arcade import Sprite  # pylint: disable=import-outside-toplevel
+
+        vis_conf = get_simulation_settings()
+        self.sprite = Sprite(vis_conf['image_paths']['arm_large'], center_x=x, center_y=y)
+        self.sprite.height = height
+        self.sprite.width = width
         self.rotate_x = x
         self.rotate_y = y + self.sweep_length
-        vis_conf = get_simulation_settings()
-        self.init_texture(vis_conf['image_paths']['arm_large'], width, height)
         self.side_bar_ground.create_shape(x, y - 70, width, 10)
         self.angle = 0
         self.rotate(20)
 
-    def init_texture(self, src, width, height):
-        """
-        Initialize the texture base on the give source and dimensions.
-        """
-        texture = arcade.load_texture(src)
-
-        self.textures.append(texture)
-        self.set_texture(0)
-        self.height = height
-        self.width = width
-
     def rotate(self, degrees: float):
         """
         Rotate this part by the given angle in radians. Make sure it
@@ -74,6 +63,10 @@ class ArmLarge(Sprite):
         """
         self.angle += degrees
 
+        if self.sprite is None:
+            return
+
+        self.sprite.angle = self.angle
         rad = math.radians(self.angle)
 
         self.x = self.sweep_length * math.sin(-rad) + self.rotate_x
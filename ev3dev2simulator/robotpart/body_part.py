@@ -2,11 +2,13 @@
 The body_part module contains the class BodyPart, the super class to a all body parts.
 """
 
+import math
+
 import pymunk
+from pymunk import Vec2d
 
 from ev3dev2simulator.util.dimensions import Dimensions
 from ev3dev2simulator.util.point import Point
-from ev3dev2simulator.visualisation.robot_part_sprite import RobotPartSprite
 
 # Default friction used for sprites, unless otherwise specified
 DEFAULT_FRICTION = 0.2
@@ -34,16 +36,37 @@ class BodyPart:
         self.y_offset = float(config['y_offset']) + offset.y
 
         self.sensible_obstacles = []
+        self.obstacle_lookup = None
 
         self.sprite = None
         self.shape = None
+        # center of the shape relative to the physics body, which does not change until the shape is replaced
+        self.local_center = None
+        self.local_center_shape = None
 
-    def set_sensible_obstacles(self, obstacles):
+    def set_sensible_obstacles(self, obstacles, obstacle_lookup=None):
         """
         Set the obstacles which can be detected via collision detection by this body part.
         :param obstacles: to be detected.
+        :param obstacle_lookup: optional precomputed lookup (raster or grid) of the same obstacles, used to find them
+        faster.
         """
         self.sensible_obstacles = obstacles
+        self.obstacle_lookup = obstacle_lookup
+
+    def get_sensed_obstacle(self, x: float, y: float):
+        """
+        Get the first of the sensible obstacles that collides with the given point.
+        :param x: coordinate of the point.
+        :param y: coordinate of the point.
+        :return: the obstacle, or None if there is no collision.
+        """
+        if self.obstacle_lookup is not None:
+            return self.obstacle_lookup.get_obstacle(x, y)
+        for obstacle in self.sensible_obstacles:
+            if obstacle.collided_with(x, y):
+                return obstacle
+        return None
 
     def get_default_value(self):
         """
@@ -70,10 +93,29 @@ class BodyPart:
         self.shape.friction = DEFAULT_FRICTION
         self.shape.mass = DEFAULT_MASS
 
+    def get_position(self) -> Vec2d:
+        """
+        Get the position of the center of this body part, derived from the physics body it is attached to.
+        """
+        shape = self.shape
+        if self.local_center_shape is not shape:
+            self.local_center = Vec2d(shape.center_of_gravity)
+            self.local_center_shape = shape
+        return shape.body.local_to_world(self.local_center)
+
+    def get_angle(self) -> float:
+        """
+        Get the orientation of this body part in degrees, derived from the physics body it is attached to.
+        """
+        return math.degrees(self.shape.body.angle)
+
     def init_sprite_with_list(self, src_list, scale, start_sprite=0):
         """
         Initializes the sprite with a list of textures and the start texture.
         """
+        # pylint: disable=import-outside-toplevel
+        from ev3dev2simulator.visualisation.robot_part_sprite import RobotPartSprite
+
         self.sprite = RobotPartSprite(src_list, start_sprite, self.width_mm, scale=scale)
 
     def init_sprite(self, src, scale):
@@ -51,9 +51,10 @@ class ColorSensor(BodyPart):
         :return: integer value representing the color.
         """
 
-        for obstacle in self.sensible_obstacles:
-            if obstacle.collided_with(self.sprite.center_x, self.sprite.center_y):
-                return obstacle.color_code
+        x, y = self.get_position()
+        obstacle = self.get_sensed_obstacle(x, y)
+        if obstacle is not None:
+            return obstacle.color_code
 
         return self.get_default_value()
 
@@ -69,6 +70,6 @@ class ColorSensor(BodyPart):
         Set the color texture of the center of the color sensor.
         """
         converted = COLORS[color]
-        if self.old_texture_index != converted:
+        if self.sprite is not None and self.old_texture_index != converted:
             self.old_texture_index = converted
             self.sprite.set_texture(converted)
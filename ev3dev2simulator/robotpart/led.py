@@ -34,6 +34,6 @@ class Led(BodyPart):
         """
         Sets the sprite corresponding to the given color.
         """
-        if self.old_texture_index != color:
+        if self.sprite is not None and self.old_texture_index != color:
             self.old_texture_index = color
             self.sprite.set_texture(color)
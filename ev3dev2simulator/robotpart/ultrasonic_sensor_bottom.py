@@ -36,13 +36,12 @@ class UltrasonicSensorBottom(BodyPart):
         Get the distance in pixels between this ultrasonic sensor and an the ground.
         :return: a floating point value representing the distance.
         """
-        for obstacle in self.sensible_obstacles:
-            if obstacle.collided_with(self.sprite.center_x, self.sprite.center_y):
-                if isinstance(obstacle, Hole):
-                    return obstacle.depth
-                if isinstance(obstacle, Board):
-                    return 20
-                return self.get_default_value()
+        x, y = self.get_position()
+        obstacle = self.get_sensed_obstacle(x, y)
+        if isinstance(obstacle, Hole):
+            return obstacle.depth
+        if isinstance(obstacle, Board):
+            return 20
         return self.get_default_value()
 
     def get_default_value(self):
@@ -7,14 +7,12 @@ It represents an ultrasonic sensor on top of a robot that aims in front of the r
 import math
 from typing import Optional
 
-from arcade import Point, create_line
-from arcade.color import RED
-from pymunk import Space
+from pymunk import Space, ShapeFilter
 
 from ev3dev2simulator.config.config import get_simulation_settings, DEBUG
 from ev3dev2simulator.robotpart.body_part import BodyPart
 from ev3dev2simulator.util.dimensions import Dimensions
-from ev3dev2simulator.util.util import distance_between_points
+from ev3dev2simulator.util.util import Point, distance_between_points
 
 
 class UltrasonicSensor(BodyPart):
@@ -46,65 +44,74 @@ class UltrasonicSensor(BodyPart):
         """
 
         distances = []
+        angle = self.get_angle()
+        center_x, center_y = self.get_position()
+        shape_filter = self.shape.filter
 
-        left_eye_x, left_eye_y = self._calc_eye_center(self.sprite.angle + 90)
-        distance = self._calc_view_distance(space, left_eye_x, left_eye_y)
-
-        if distance:
-            distances.append(distance * (1 / self.robot.scale))
-
-        right_eye_x, right_eye_y = self._calc_eye_center(self.sprite.angle - 90)
-        distance = self._calc_view_distance(space, right_eye_x, right_eye_y)
-
-        if distance:
-            distances.append(distance * (1 / self.robot.scale))
+        for eye_angle in (angle + 90, angle - 90):
+            eye_x, eye_y = self._calc_eye_center(eye_angle, center_x, center_y)
+            distance = self._calc_view_distance(space, eye_x, eye_y, angle, shape_filter)
+            if distance:
+                distances.append(distance * (1 / self.robot.scale))
 
         if len(distances) > 0:
             return min(distances)
 
         return self.get_default_value()
 
-    def _calc_view_distance(self, space: Space, base_x: float, base_y: float) -> Optional[float]:
+    def _calc_view_distance(self, space: Space, base_x: float, base_y: float, angle: float,
+                            shape_filter: ShapeFilter) -> Optional[float]:
         """
         Calculate the distance between the base point, represented by base_x and base_y, and the furthest
         viewable object. If no object is in sight, return None.
         :param space: which holds the visible objects.
         :param base_x: x coordinate of the base point.
         :param base_y: y coordinate of the base point.
+        :param angle: of this sensor in degrees.
+        :param shape_filter: of this sensor, so the ray does not hit the robot itself.
         :return: a floating point value representing the distance if object is viewable, else None.
         """
-        x, y = self._calc_ray_cast_point(base_x, base_y)
-        if DEBUG:
+        x, y = self._calc_ray_cast_point(base_x, base_y, angle)
+        if DEBUG and self.sprite is not None:
+            # pylint: disable=import-outside-toplevel
+            from arcade import create_line
+            from arcade.color import RED
+
             line = create_line(x, y, base_x, base_y, RED, 5)
             self.robot.debug_shapes.append(line)
-        query = space.segment_query_first((base_x, base_y), (x, y), 1, self.shape.filter)
+        query = space.segment_query_first((base_x, base_y), (x, y), 1, shape_filter)
         if query:
             return -self.sensor_half_height + distance_between_points(base_x, base_y, query.point.x, query.point.y)
         return None
 
-    def _calc_ray_cast_point(self, from_x: float, from_y: float) -> Point:
+    @staticmethod
+    def _calc_ray_cast_point(from_x: float, from_y: float, angle: float) -> Point:
         """
         Calculate the coordinates of the point to perform a ray-cast towards
         which covers the entire playing field of the simulator.
+        :param angle: of this sensor in degrees.
         :return: a Point object representing the coordinates of the ray-cast point.
         """
-        rad = math.radians(self.sprite.angle)
+        rad = math.radians(angle)
 
         x = 1000 * math.sin(-rad) + from_x
         y = 1000 * math.cos(-rad) + from_y
 
         return x, y
 
-    def _calc_eye_center(self, angle: float) -> Point:
+    @staticmethod
+    def _calc_eye_center(angle: float, center_x: float, center_y: float) -> Point:
         """
         Calculate the center point of a location at the given angle relative to this objects center.
         :param angle: at which the new point is relative to this objects center.
+        :param center_x: x coordinate of the center of this object.
+        :param center_y: y coordinate of the center of this object.
         :return: a Point object representing the coordinates of the new location.
         """
         rad = math.radians(angle)
         eye_offset = 18
-        x = eye_offset * math.sin(-rad) + self.sprite.center_x
-        y = eye_offset * math.cos(-rad) + self.sprite.center_y
+        x = eye_offset * math.sin(-rad) + center_x
+        y = eye_offset * math.cos(-rad) + center_y
 
         return x, y
 
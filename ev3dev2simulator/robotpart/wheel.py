@@ -27,13 +27,17 @@ class Wheel(BodyPart):
         Check if this Wheel is 'falling' of the playing field.
         :return: boolean value representing the outcome.
         """
-        for obstacle in self.sensible_obstacles:
-            if obstacle.collided_with(self.sprite.center_x, self.sprite.center_y):
-                if isinstance(obstacle, Board):
-                    return False
-                return True
+        x, y = self.get_position()
+        return self.is_falling_on(self.get_sensed_obstacle(x, y))
 
-        return self.get_default_value()
+    @staticmethod
+    def is_falling_on(obstacle) -> bool:
+        """
+        Check if a Wheel on the given falling obstacle is 'falling'. Only the board itself carries the wheel.
+        :param obstacle: the first falling obstacle below the wheel, or None if there is none.
+        :return: boolean value representing the outcome.
+        """
+        return obstacle is None or not isinstance(obstacle, Board)
 
     def get_default_value(self):
         return True
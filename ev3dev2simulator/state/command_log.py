@@ -0,0 +1,85 @@
+"""
+The command_log module contains the class CommandLog, which records the commands changing a world with the frame
+they were processed in, so a run in lockstep mode can be replayed without the robot program.
+"""
+
+import json
+import threading
+from typing import Tuple
+
+from ev3dev2simulator.connection import wire_protocol
+from ev3dev2simulator.connection.message.command import Command
+from ev3dev2simulator.connection.message_handler import MessageHandler
+from ev3dev2simulator.state.message_processor import MessageProcessor
+from ev3dev2simulator.state.world_simulator import WorldSimulator
+
+
+class CommandLog:
+    """
+    Log of the commands that change the world: motor, stop, sound and led commands. Every entry holds the frame of
+    the simulated clock in which the command was processed, the name of the robot, the brick and the serialized
+    command. Requests only read the world and are not logged.
+
+    In lockstep mode commands are only processed while the world waits, so applying the commands of each frame
+    before simulating that frame reproduces the run exactly. In real time mode commands arrive during updates,
+    so a replay can be a frame off.
+    """
+
+    def __init__(self, entries: list = None):
+        self.entries = list(entries) if entries is not None else []
+        self.lock = threading.Lock()
+        self.message_handlers = {}
+        self.next_entry = 0
+
+    def record(self, frame: int, robot: str, brick_id: int, command: Command):
+        """
+        Add a processed command to the log.
+        :param frame: of the simulated clock in which the command was processed.
+        :param robot: name of the robot the command was sent to.
+        :param brick_id: identifier of the brick the command was sent to.
+        :param command: the command.
+        """
+        with self.lock:
+            self.entries.append((frame, robot, brick_id, command.serialize()))
+
+    def apply(self, world_simulator: WorldSimulator):
+        """
+        Process the logged commands of the current frame of the world, in the order they were logged. Commands are
+        passed through the wire protocol and the MessageHandler, like the commands of a connected brick.
+        Call before every update of the world, starting with a new world.
+        :param world_simulator: to replay the commands in.
+        """
+        frame = world_simulator.clock.frame
+        while self.next_entry < len(self.entries) and self.entries[self.next_entry][0] <= frame:
+            _, robot, brick_id, command = self.entries[self.next_entry]
+            handler = self.message_handlers.get((robot, brick_id))
+            if handler is None:
+                robot_sim = next(robot_sim for robot_sim in world_simulator.robot_simulators
+                                 if robot_sim.robot.name == robot)
+                handler = MessageHandler(MessageProcessor(brick_id, robot_sim))
+                self.message_handlers[(robot, brick_id)] = handler
+            handler.process(wire_protocol.encode_message(command)[wire_protocol.FRAME_HEADER.size:])
+            self.next_entry += 1
+
+    def save(self, path: str, header: dict):
+        """
+        Write the log as JSON lines: the header followed by one line per command.
+        :param path: of the file to write.
+        :param header: describing the run, e.g. the world and the number of frames.
+        """
+        with self.lock, open(path, 'w') as stream:
+            stream.write(json.dumps(header) + '\n')
+            for entry in self.entries:
+                stream.write(json.dumps(entry) + '\n')
+
+    @classmethod
+    def load(cls, path: str) -> Tuple[dict, 'CommandLog']:
+        """
+        Read a log written by save.
+        :param path: of the file to read.
+        :return: the header and the log.
+        """
+        with open(path) as stream:
+            header = json.loads(stream.readline())
+            entries = [tuple(json.loads(line)) for line in stream if line.strip()]
+        return header, cls(entries)
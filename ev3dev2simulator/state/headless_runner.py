@@ -0,0 +1,80 @@
+"""
+The headless_runner module contains the class HeadlessRunner, which drives the simulation without a window.
+"""
+
+import time
+from typing import Callable
+
+from ev3dev2simulator.config.config import get_simulation_settings
+from ev3dev2simulator.state.world_simulator import WorldSimulator
+from ev3dev2simulator.state.world_state import WORLD_SCALE
+
+# Seconds between checks for a stop or reset request while no client is sleeping in lockstep mode.
+LOCKSTEP_POLL_TIME = 0.1
+
+
+class HeadlessRunner:
+    """
+    Replaces the Visualiser when no window is available. Sets up the physics and sensing of the world
+    and calls WorldSimulator.update from its own loop, either at the configured frame rate or,
+    when the clock of the world simulator is in lockstep mode, as fast as the clients allow.
+    """
+
+    def __init__(self, world_simulator: WorldSimulator):
+        self.world_simulator = world_simulator
+        self.frame_time = 1.0 / float(get_simulation_settings()['exec_settings']['frames_per_second'])
+        self.frames = 0
+        self.running = True
+
+        world_state = world_simulator.world_state
+        world_state.setup_pymunk_shapes(WORLD_SCALE)
+        world_state.setup_sensing(WORLD_SCALE)
+
+    def run(self, max_frames: int = None, on_frame: Callable[[], None] = None):
+        """
+        Update the world until stop is called or max_frames frames have been simulated.
+        In real time mode the world is updated at a fixed rate. When a frame takes longer than the frame time,
+        the loop continues without trying to catch up. In lockstep mode the world is updated as soon as all
+        connected clients are sleeping.
+        :param max_frames: number of frames after which to return, runs forever if None.
+        :param on_frame: called after every simulated frame, not after a reset of the world.
+        """
+        if self.world_simulator.clock.lockstep:
+            self._run_lockstep(max_frames, on_frame)
+        else:
+            self._run_real_time(max_frames, on_frame)
+        self.running = False
+
+    def _run_real_time(self, max_frames: int, on_frame: Callable[[], None]):
+        next_frame = time.monotonic()
+        while self.running and (max_frames is None or self.frames < max_frames):
+            resetting = self.world_simulator.should_reset
+            self.world_simulator.update()
+            self.frames += 1
+            if on_frame is not None and not resetting:
+                on_frame()
+
+            next_frame += self.frame_time
+            delay = next_frame - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_frame = time.monotonic()
+
+    def _run_lockstep(self, max_frames: int, on_frame: Callable[[], None]):
+        clock = self.world_simulator.clock
+        while self.running and (max_frames is None or self.frames < max_frames):
+            if clock.wait_for_clients(LOCKSTEP_POLL_TIME):
+                self.world_simulator.update()
+                self.frames += 1
+                if on_frame is not None:
+                    on_frame()
+            elif self.world_simulator.should_reset:
+                # all clients disconnected, reset before the next client connects
+                self.world_simulator.update()
+
+    def stop(self):
+        """
+        Stop the loop started by run after the current frame. When called before run, run returns immediately.
+        """
+        self.running = False
@@ -8,8 +8,12 @@ from typing import Any, Tuple
 from ev3dev2._platform.ev3 import LEDS
 from ev3dev2simulator.config.config import get_simulation_settings
 from ev3dev2simulator.connection.message.config_request import ConfigRequest
+from ev3dev2simulator.state.motion_profile import MotionProfile
 from ev3dev2simulator.state.motor_command_processor import MotorCommandProcessor
 from ev3dev2simulator.connection.message import rotate_command, stop_command, sound_command, data_request, led_command
+from ev3dev2simulator.connection.message.sleep_request import SleepRequest
+from ev3dev2simulator.connection.message.subscribe_request import SubscribeRequest
+from ev3dev2simulator.connection.message.time_request import TimeRequest
 from ev3dev2simulator.state import robot_simulator
 
 LED_COLORS = dict()
@@ -42,8 +46,8 @@ class MessageProcessor:
 
     def process_rotate_command(self, command: rotate_command) -> float:
         """
-        Process the given RotateCommand by creating the appropriate motor jobs in the RobotState.
-        The type of jobs created  depends on the motor called.
+        Process the given RotateCommand by replacing the jobs of the motor with a motion profile.
+        The type of profile created depends on the motor called.
         The command for the arm motor is processed for degrees, while the other motors are processed for distance.
         :param command: to process.
         :return: a floating point value representing the time in seconds the given command will take to execute.
@@ -53,12 +57,9 @@ class MessageProcessor:
         motor = self.robot_sim.robot.get_actuator(full_address)
         spf, frames, coast_frames, run_time = self._process_rotate_command_values(command, motor)
 
-        self.robot_sim.clear_actuator_jobs(full_address)
-
-        for _ in range(frames):
-            self.robot_sim.put_actuator_job(full_address, spf)
-
-        self._process_coast(coast_frames, spf, motor)
+        profile = MotionProfile(spf, frames, coast_frames, self._coasting_sub(motor))
+        self.robot_sim.set_actuator_profile(full_address, profile)
+        self.robot_sim.record_command(self.brick_id, command)
         return run_time
 
     def _process_rotate_command_values(self, command: rotate_command, motor: any) -> Tuple[float, int, int, float]:
@@ -76,8 +77,8 @@ class MessageProcessor:
 
     def process_stop_command(self, command: stop_command) -> float:
         """
-        Process the given stop command by clearing the current motor job queue
-        and creating motor coast jobs in the RobotState. The type of jobs created
+        Process the given stop command by replacing the jobs of the motor with
+        a coasting motion profile. The type of profile created
         depends on the motor called. The command for the center motor is processed for degrees, while the other motors
         are processed for distance.
         :param command: to process.
@@ -89,8 +90,9 @@ class MessageProcessor:
 
         spf, frames, run_time = self._process_stop_command_values(command, motor)
 
-        self.robot_sim.clear_actuator_jobs(full_address)
-        self._process_coast(frames, spf, motor)
+        profile = MotionProfile(spf, 0, frames, self._coasting_sub(motor))
+        self.robot_sim.set_actuator_profile(full_address, profile)
+        self.robot_sim.record_command(self.brick_id, command)
         return run_time
 
     def _process_stop_command_values(self, command: stop_command, motor: any) -> Tuple[float, int, float]:
@@ -106,23 +108,12 @@ class MessageProcessor:
             return -dpf, frames, run_time
         return self.command_processor.process_stop_command_distance(command)
 
-    def _process_coast(self, frames, ppf, motor):
+    def _coasting_sub(self, motor) -> float:
         """
-        Process coasting by creating move jobs decreasing in speed in the RobotState.
-        :param frames: to coast before coming to a halt.
-        :param ppf: speed of motor when the coasting starts.
+        Get the decrease in speed per frame of the given motor when coasting.
         :param motor: the motor in the RobotState.
         """
-
-        coasting_sub = self.degree_coasting_sub if motor.ev3type == 'arm' else self.distance_coasting_sub
-        og_ppf = ppf
-
-        for _ in range(frames):
-            if og_ppf > 0:
-                ppf = max(ppf - coasting_sub, 0)
-            else:
-                ppf = min(ppf + coasting_sub, 0)
-            self.robot_sim.put_actuator_job(self._to_full_address(motor.address), ppf)
+        return self.degree_coasting_sub if motor.ev3type == 'arm' else self.distance_coasting_sub
 
     def process_led_command(self, command: led_command):
         """
@@ -130,6 +121,7 @@ class MessageProcessor:
         :param command: to process.
         """
 
+        self.robot_sim.record_command(self.brick_id, command)
         self.led_cache[command.address] = command.brightness
         led_id = command.get_led_id()
 
@@ -159,14 +151,15 @@ class MessageProcessor:
 
     def process_sound_command(self, command: sound_command):
         """
-        Process the given sound command by creating a sound job with a message which can be put on the simulator screen.
+        Process the given sound command by adding a profile showing the message on the simulator screen
+        for the duration of the sound.
         :param command: to process.
         """
         frames = int(round(self.frames_per_second * command.duration))
         msg_len = len(command.message)
         message = '\n'.join(command.message[i:i + 10] for i in range(0, msg_len, 10))
-        for i in range(frames):
-            self.robot_sim.put_actuator_job(self._to_full_address('speaker'), message)
+        self.robot_sim.add_actuator_profile(self._to_full_address('speaker'), MotionProfile(message, frames))
+        self.robot_sim.record_command(self.brick_id, command)
 
     def process_data_request(self, request: data_request) -> Any:
         """
@@ -177,6 +170,15 @@ class MessageProcessor:
         full_address = self._to_full_address(request.address)
         return self.robot_sim.get_value(full_address)
 
+    def process_subscribe_request(self, request: SubscribeRequest) -> bool:
+        """
+        Process the given subscribe request by subscribing to the requested sensors in the RobotSimulator.
+        :param request: to process.
+        :return: True if the values of the sensors will be pushed after every frame, False if they must be requested.
+        """
+        addresses = [self._to_full_address(address) for address in request.addresses]
+        return self.robot_sim.subscribe_sensors(addresses)
+
     def process_config_request(self, request: ConfigRequest) -> Any:
         """
         Process the given data request by retrieving the port of the device from the RobotState and returning this.
@@ -185,5 +187,22 @@ class MessageProcessor:
         """
         return self.robot_sim.determine_port(self.brick_id, request.kwargs, request.class_name)
 
+    def process_time_request(self, _request: TimeRequest) -> Any:
+        """
+        Process the given time request by returning the simulated time when running in lockstep mode.
+        :param _request: to process, it carries no arguments.
+        :return: the simulated time in seconds, or None when the clients should use the wall clock.
+        """
+        clock = self.robot_sim.clock
+        return clock.time if clock.lockstep else None
+
+    def process_sleep_request(self, request: SleepRequest) -> float:
+        """
+        Process the given sleep request by blocking until the requested simulated time has passed.
+        :param request: to process.
+        :return: the simulated time in seconds after sleeping.
+        """
+        return self.robot_sim.clock.sleep(request.seconds)
+
     def _to_full_address(self, address: str):
         return self.brick_id, address
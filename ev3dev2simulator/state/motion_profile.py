@@ -0,0 +1,43 @@
+"""
+The motion_profile module contains the class MotionProfile, describing the jobs of an actuator over time.
+"""
+
+from typing import Any
+
+
+class MotionProfile:
+    """
+    Class describing the movement of an actuator as a segment of frames at a constant value per frame,
+    followed by a number of coasting frames in which the value decreases by coast_subtraction per frame until
+    it reaches zero. The job of every frame is computed when it is needed, instead of being stored.
+    Actuators without coasting, like the speaker, can use any value, for example the message to show.
+    """
+
+    def __init__(self, value: Any, frames: int, coast_frames: int = 0, coast_subtraction: float = 0):
+        self.value = value
+        self.frames = frames
+        self.coast_frames = coast_frames
+        self.coast_subtraction = coast_subtraction
+
+    @property
+    def duration(self) -> int:
+        """
+        The total number of frames of the profile, including the coasting frames.
+        """
+        return self.frames + self.coast_frames
+
+    def job_at(self, frame: int) -> Any:
+        """
+        Get the job of the actuator in the given frame of the profile.
+        :param frame: number of frames since the start of the profile.
+        :return: the distance or degrees to move in the frame, or None if the frame is outside of the profile.
+        """
+        if frame < 0 or frame >= self.duration:
+            return None
+        if frame < self.frames:
+            return self.value
+
+        subtraction = (frame - self.frames + 1) * self.coast_subtraction
+        if self.value > 0:
+            return max(self.value - subtraction, 0)
+        return min(self.value + subtraction, 0)
@@ -0,0 +1,76 @@
+"""
+The obstacle_grid module contains the class ObstacleGrid, a spatial index of the obstacles on the board.
+"""
+
+import math
+
+import numpy as np
+
+from ev3dev2simulator.state.obstacle_raster import NO_OBSTACLE
+
+
+class ObstacleGrid:
+    """
+    Uniform grid over the board storing, for every cell of cell_size millimeters, the indices of the obstacles
+    whose bounding box overlaps the cell in the order of the obstacle list. A point is only tested against the
+    obstacles of its cell, in that order, so it finds the same obstacle as testing all obstacles in order.
+    Unlike ObstacleRaster the lookup is exact and the cells can be much larger than a millimeter, which suits
+    large boards. The grid is in world millimeters, so it stays valid when the scale changes.
+    Points outside of the board are looked up by testing the obstacles in order.
+    """
+
+    def __init__(self, obstacles: list, width: float, height: float, scale: float, cell_size: float = 50):
+        self.obstacles = list(obstacles)
+        self.cell_size = cell_size
+        self.scale = scale
+        self.rows = math.ceil(height / cell_size)
+        self.columns = math.ceil(width / cell_size)
+
+        cells = [[] for _ in range(self.rows * self.columns)]
+        for index, obstacle in enumerate(self.obstacles):
+            min_column, min_row, max_column, max_row = self._get_window(obstacle.get_bounding_box())
+            for row in range(min_row, max_row):
+                for column in range(min_column, max_column):
+                    cells[row * self.columns + column].append(index)
+        self.cells = [tuple(cell) for cell in cells]
+
+    def _get_window(self, bounding_box) -> (int, int, int, int):
+        if bounding_box is None:
+            return 0, 0, self.columns, self.rows
+        cell = self.cell_size * self.scale
+        min_x, min_y, max_x, max_y = bounding_box
+        return (max(0, math.floor(min_x / cell)), max(0, math.floor(min_y / cell)),
+                min(self.columns, math.floor(max_x / cell) + 1), min(self.rows, math.floor(max_y / cell) + 1))
+
+    def get_obstacle(self, x: float, y: float):
+        """
+        Get the first obstacle covering the given point.
+        :param x: coordinate of the point.
+        :param y: coordinate of the point.
+        :return: the obstacle, or None if no obstacle covers the point.
+        """
+        index = self._find_index(x, y)
+        return None if index == NO_OBSTACLE else self.obstacles[index]
+
+    def get_obstacle_indices(self, x_coords: np.ndarray, y_coords: np.ndarray) -> np.ndarray:
+        """
+        Get the indices of the first obstacles covering the given points.
+        :param x_coords: one dimensional array with the x coordinates of the points.
+        :param y_coords: one dimensional array with the y coordinates of the points.
+        :return: array with per point the index in obstacles, or NO_OBSTACLE if no obstacle covers the point.
+        """
+        return np.array([self._find_index(x, y) for x, y in zip(x_coords, y_coords)], dtype=int)
+
+    def _find_index(self, x: float, y: float) -> int:
+        cell = self.cell_size * self.scale
+        row = math.floor(y / cell)
+        column = math.floor(x / cell)
+        if 0 <= row < self.rows and 0 <= column < self.columns:
+            candidates = self.cells[row * self.columns + column]
+        else:
+            candidates = range(len(self.obstacles))
+
+        for index in candidates:
+            if self.obstacles[index].collided_with(x, y):
+                return index
+        return NO_OBSTACLE
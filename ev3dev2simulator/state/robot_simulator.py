@@ -5,12 +5,12 @@ The robot_simulator module contains the RobotSimulator class which handles how t
 
 import math
 import threading
-from queue import Queue, Empty
+from collections import deque
 from typing import Any
-# noinspection PyProtectedMember
-from pymunk import Vec2d
 
+from ev3dev2simulator.state.motion_profile import MotionProfile
 from ev3dev2simulator.state.robot_state import RobotState
+from ev3dev2simulator.state.sim_clock import SimClock
 
 
 class RobotSimulator:
@@ -20,21 +20,40 @@ class RobotSimulator:
     of the simulated robot.
     """
 
-    def __init__(self, robot: RobotState):
+    def __init__(self, robot: RobotState, clock: SimClock = None):
         self.robot = robot
+        self.clock = clock if clock is not None else SimClock()
 
-        self.actuator_queues = {}
-        self.queue_info = {}
+        # per actuator the profiles to execute, each with the actuator frame it starts in
+        self.actuator_profiles = {}
+        self.actuator_info = {}
+        self.actuator_frame = 0
 
         for actuator in self.robot.get_actuators():
             if actuator.ev3type in ['arm', 'motor', 'speaker']:
-                self.queue_info[(actuator.brick, actuator.address)] = actuator
-                self.actuator_queues[(actuator.brick, actuator.address)] = Queue()
+                self.actuator_info[(actuator.brick, actuator.address)] = actuator
+                self.actuator_profiles[(actuator.brick, actuator.address)] = deque()
 
         self.should_reset = False
         self.locks = {}
 
+        # sensors are only evaluated when requested, at most once per update
+        self.step = 0
+        self.evaluated_steps = {}
+        self.requested_sensors = set()
+        self.request_lock = threading.Lock()
+        self.evaluate_all_sensors = False
+
+        # subscribed sensors are evaluated every update, after which the listeners push their values to the clients
+        self.subscribed_sensors = set()
+        self.update_listeners = []
+
         self.motor_lock = threading.Lock()
+        # distance in millimeters the left and right wheel moved in the last update
+        self.wheel_speeds = (0.0, 0.0)
+
+        # optional CommandLog recording the commands processed for this robot
+        self.command_log = None
 
         for sensor in self.robot.get_sensors():
             self.load_sensor(sensor)
@@ -42,52 +61,113 @@ class RobotSimulator:
     def update(self):
         """
         processes the actuators and sensors of the robot and syncs the sprites to the physics.
+        Only the locks of the sensors evaluated in this update are released.
         """
+        self.step += 1
+        evaluated = []
         if self.should_reset:
             self.reset()
 
         else:
             self._process_actuators()
             self._process_leds()
-            self._process_sensors()
+            evaluated = self._process_sensors()
             self._sync_physics_sprites()
 
-        self.release_locks()
+        self.release_locks(evaluated)
+        for listener in self.update_listeners:
+            listener()
 
-    def put_actuator_job(self, address: (int, str), job: float):
+    def subscribe_sensors(self, addresses: list) -> bool:
         """
-        Add a new move job to the queue for the center motor.
-        :param address: Address of the actuator
-        :param job: to add.
+        Subscribe to the sensors with the given addresses, which are then evaluated every update.
+        Subscriptions are refused in lockstep mode, where sensors are evaluated when requested.
+        :param addresses: of the sensors.
+        :return: True if the subscription is accepted.
         """
-        self.actuator_queues[address].put_nowait(job)
+        if self.clock.lockstep or any(address not in self.robot.sensors for address in addresses):
+            return False
+        with self.request_lock:
+            self.subscribed_sensors.update(addresses)
+        return True
 
-    def next_actuator_jobs(self) -> any:
+    def unsubscribe_sensors_of_brick(self, brick_id: int):
+        """
+        Remove the subscriptions to the sensors of a brick if the brick disconnects.
+        :param brick_id: identifier of the brick.
+        """
+        with self.request_lock:
+            self.subscribed_sensors = {address for address in self.subscribed_sensors if address[0] != brick_id}
+
+    def get_subscribed_values(self, brick_id: int) -> dict:
+        """
+        Get the latest values of the subscribed sensors of a brick.
+        :param brick_id: identifier of the brick.
+        :return: dictionary with the values by sensor address, without the brick.
         """
-        Get the next move jobs for the left and right motor from the queues.
-        :return: a floating point numbers representing the job move distances.
+        with self.request_lock:
+            addresses = [address for address in self.subscribed_sensors if address[0] == brick_id]
+        return {address: self.robot.values[(brick, address)] for brick, address in addresses}
+
+    def set_actuator_profile(self, address: (int, str), profile: MotionProfile):
+        """
+        Replace the jobs of an actuator by the given profile, starting in the next frame.
+        :param address: Address of the actuator
+        :param profile: to execute.
         """
+        with self.motor_lock:
+            profiles = self.actuator_profiles[address]
+            profiles.clear()
+            profiles.append((self.actuator_frame, profile))
 
-        self.motor_lock.acquire()
+    def add_actuator_profile(self, address: (int, str), profile: MotionProfile):
+        """
+        Add a profile to execute after the current jobs of an actuator.
+        :param address: Address of the actuator
+        :param profile: to execute.
+        """
+        with self.motor_lock:
+            profiles = self.actuator_profiles[address]
+            start = self.actuator_frame
+            if profiles:
+                last_start, last_profile = profiles[-1]
+                start = max(start, last_start + last_profile.duration)
+            profiles.append((start, profile))
 
-        motor_jobs = []
-        for actuator, jobs in self.actuator_queues.items():
-            try:
-                job = jobs.get_nowait()
-            except Empty:
+    def next_actuator_jobs(self) -> any:
+        """
+        Get the next jobs of all actuators from their profiles and advance to the next frame.
+        :return: list of tuples of the address and the job of each actuator, None for actuators without a job.
+        """
+        with self.motor_lock:
+            motor_jobs = []
+            for actuator, profiles in self.actuator_profiles.items():
+                while profiles and self.actuator_frame >= profiles[0][0] + profiles[0][1].duration:
+                    profiles.popleft()
                 job = None
-            motor_jobs.append((actuator, job))
+                if profiles:
+                    start, profile = profiles[0]
+                    job = profile.job_at(self.actuator_frame - start)
+                motor_jobs.append((actuator, job))
 
-        self.motor_lock.release()
+            self.actuator_frame += 1
         return motor_jobs
 
     def clear_actuator_jobs(self, address: (int, str)):
         """
-        Clears all current jobs of the robot
+        Clears all current jobs of the actuator
         """
-        self.motor_lock.acquire()
-        self.actuator_queues[address] = Queue()
-        self.motor_lock.release()
+        with self.motor_lock:
+            self.actuator_profiles[address].clear()
+
+    def record_command(self, brick_id: int, command):
+        """
+        Add a command changing the world to the command log, if any, with the current frame of the clock.
+        :param brick_id: identifier of the brick the command was sent to.
+        :param command: the processed command.
+        """
+        if self.command_log is not None:
+            self.command_log.record(self.clock.frame, self.robot.name, brick_id, command)
 
     def set_led_color(self, brick_id, led_id, color):
         """
@@ -95,12 +175,12 @@ class RobotSimulator:
         """
         self.robot.led_colors[(brick_id, led_id)] = color
 
-    def reset_queues_of_brick(self, brick_id: int):
+    def clear_actuator_jobs_of_brick(self, brick_id: int):
         """
-        Reset queues if bricks disconnect.
-        :param brick_id: identifier of brick you want to reset the queues of.
+        Clear the jobs of the actuators of a brick if the brick disconnects.
+        :param brick_id: identifier of brick you want to clear the jobs of.
         """
-        for key in self.actuator_queues:
+        for key in self.actuator_profiles:
             if key[0] == brick_id:
                 self.clear_actuator_jobs(key)
 
@@ -109,12 +189,38 @@ class RobotSimulator:
         Reset the data of this State
         :return:
         """
-        for key in self.actuator_queues:
+        for key in self.actuator_profiles:
             self.clear_actuator_jobs(key)
 
         self.robot.reset()
+        self.wheel_speeds = (0.0, 0.0)
+        self.evaluated_steps.clear()  # the values of the sensors are cleared by the reset of the robot
         self.should_reset = False
 
+    def snapshot(self) -> tuple:
+        """
+        Get the state of the execution of the actuator profiles and of the evaluation of the sensors.
+        The state of the robot itself is part of the snapshot of the WorldState.
+        :return: picklable state, which restore accepts.
+        """
+        with self.motor_lock:
+            profiles = {address: tuple(profiles) for address, profiles in self.actuator_profiles.items()}
+            return profiles, self.actuator_frame, self.step, dict(self.evaluated_steps)
+
+    def restore(self, state: tuple):
+        """
+        Restore the state returned by snapshot.
+        :param state: to restore.
+        """
+        profiles, actuator_frame, self.step, evaluated_steps = state
+        with self.motor_lock:
+            for address, actuator_profiles in profiles.items():
+                self.actuator_profiles[address].clear()
+                self.actuator_profiles[address].extend(actuator_profiles)
+            self.actuator_frame = actuator_frame
+        self.evaluated_steps.clear()
+        self.evaluated_steps.update(evaluated_steps)
+
     def load_sensor(self, sensor):
         """
         Load the given sensor adding its default value to this state.
@@ -124,26 +230,46 @@ class RobotSimulator:
         address = (sensor.brick, sensor.address)
         self.robot.values[address] = sensor.get_default_value()
         self.locks[address] = threading.Lock()
+        self.locks[address].acquire()  # no value has been evaluated yet
 
-    def release_locks(self):
+    def release_locks(self, addresses=None):
         """
-        Release all the locked sensor locks. This re-allows for reading
+        Release the locked sensor locks. This re-allows for reading
         the sensor values.
+        :param addresses: of the sensors to release the locks of, all sensors if None.
         """
-        for lock in self.locks.values():
+        locks = self.locks.values() if addresses is None else [self.locks[address] for address in addresses]
+        for lock in locks:
             if lock.locked():
                 lock.release()
 
     def get_value(self, address: (int, str)) -> Any:
         """
-        Get the value of a sensor by its address. Blocks if the lock of
-        the requested sensor is not available.
+        Get the value of a sensor by its address. The sensor is evaluated in the next update,
+        the call blocks until then. In lockstep mode the world does not advance while
+        the client waits for a value, so the sensor is evaluated right away.
         :param address: of the sensor to get the value from.
         :return: the value of the sensor.
         """
+        if self.clock.lockstep:
+            return self.evaluate_sensor(address)
+        with self.request_lock:
+            self.requested_sensors.add(address)
         self.locks[address].acquire()
         return self.robot.values[address]
 
+    def evaluate_sensor(self, address: (int, str)) -> Any:
+        """
+        Evaluate the sensor with the given address, unless it has already been evaluated since the last update.
+        Must not be called while the world is being updated.
+        :param address: of the sensor to evaluate.
+        :return: the value of the sensor.
+        """
+        if self.evaluated_steps.get(address) != self.step:
+            self.robot.values[address] = self.robot.sensors[address].get_latest_value()
+            self.evaluated_steps[address] = self.step
+        return self.robot.values[address]
+
     def determine_port(self, brick_id: int, kwargs: dict, class_name: str):
         """
         Determines the port of a device based on the kwargs given to the device.
@@ -185,7 +311,7 @@ class RobotSimulator:
         job_per_actuator = self.next_actuator_jobs()
         left_ppf = right_ppf = None
         for (address, job_of_actuator) in job_per_actuator:
-            actuator = self.queue_info[address]
+            actuator = self.actuator_info[address]
             if actuator.ev3type == 'arm':
                 if job_of_actuator is not None:
                     self.robot.execute_arm_movement(address, job_of_actuator)
@@ -197,6 +323,7 @@ class RobotSimulator:
             elif actuator.ev3type == 'speaker':
                 self.robot.sounds[address] = job_of_actuator
 
+        self.wheel_speeds = (left_ppf or 0.0, right_ppf or 0.0)
         if left_ppf is not None or right_ppf is not None:
             self.robot.execute_movement(left_ppf, right_ppf)
 
@@ -204,20 +331,30 @@ class RobotSimulator:
         for address, led_color in self.robot.led_colors.items():
             self.robot.set_led_color(address, led_color)
 
-    def _process_sensors(self):
+    def _process_sensors(self) -> list:
         """
-        Process the data of the robot sensors by retrieving the data and putting it
-        in the robot state.
+        Process the data of the requested and subscribed robot sensors by retrieving the data and putting it
+        in the robot state. All sensors are processed when evaluate_all_sensors is set, e.g. for the sidebar.
+        :return: the addresses of the processed sensors.
         """
-        for address, sensor in self.robot.sensors.items():
-            self.robot.values[address] = sensor.get_latest_value()
+        with self.request_lock:
+            requested = self.requested_sensors | self.subscribed_sensors
+            self.requested_sensors = set()
+
+        addresses = list(self.robot.sensors) if self.evaluate_all_sensors else list(requested)
+        for address in addresses:
+            self.evaluate_sensor(address)
+        return addresses
 
     def _sync_physics_sprites(self):
+        """
+        Store the current pose of the robot and move the sprites of its parts to where the physics body is.
+        Without visualisation the parts have no sprites, so only the pose is stored.
+        """
         self.robot.set_last_pos(self.robot.body.position)
         self.robot.last_angle = math.degrees(self.robot.body.angle)
+        if self.robot.sprite_list is None:
+            return
         for part in self.robot.parts:
-            rel = Vec2d(part.shape.center_of_gravity)
-            x, y = rel.rotated(self.robot.body.angle) + self.robot.body.position
-            part.sprite.center_x = x
-            part.sprite.center_y = y
-            part.sprite.angle = math.degrees(part.shape.body.angle)
+            part.sprite.center_x, part.sprite.center_y = part.get_position()
+            part.sprite.angle = part.get_angle()
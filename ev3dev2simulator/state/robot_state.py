@@ -5,7 +5,6 @@ This class can be seen as a snapshot of the robot at some point in time.
 
 import math
 
-import arcade as _arcade
 import pymunk
 from pymunk.vec2d import Vec2d
 
@@ -22,25 +21,26 @@ from ev3dev2simulator.robotpart.ultrasonic_sensor_top import UltrasonicSensor
 from ev3dev2simulator.robotpart.wheel import Wheel
 from ev3dev2simulator.util.point import Point
 
-from ev3dev2simulator.util.util import calc_differential_steering_angle_x_y
+from ev3dev2simulator.util.util import calc_differential_steering_angle_x_y, get_body_state, set_body_state
 from ev3dev2simulator.config.config import DEBUG, get_robot_config
 
 
-class RobotState:
+class RobotState:  # pylint: disable=too-many-public-methods
     """
     Class representing the simulated robot. This robot has a number
     of parts defined by BodyParts and ExtraBodyParts.
     """
 
     def __init__(self, config):
-        self.sprite_list = _arcade.SpriteList()
-        self.side_bar_sprites = _arcade.SpriteList()
+        self.sprite_list = None
+        self.side_bar_sprites = []
 
         self.sensors = {}
         self.actuators = {}
         self.values = {}
         self.led_colors = {}
         self.bricks = []
+        self.wheels = []
         self.sounds = {}
         self.config = config
 
@@ -115,6 +115,7 @@ class RobotState:
             else:
                 print("Unknown robot part in config")
 
+        self.wheels = [part for part in self.actuators.values() if part.get_ev3type() == 'motor']
         self.parts.extend(list(self.get_wheels()))
         self.parts.extend(list(self.sensors.values()))
         self.parts.extend(self.bricks)
@@ -146,14 +147,44 @@ class RobotState:
         Resets the robot to its original position, and resets the all measurements.
         """
         self.values.clear()
+        # the angle goes first, pymunk rotates the body around its center of gravity when setting it
+        self.body.angle = math.radians(self._get_orig_orientation())
         orig_pos = self._get_orig_position()
         self.body.position = pymunk.Vec2d(orig_pos.x * self.scale, orig_pos.y * self.scale)
-        self.body.angle = math.radians(self._get_orig_orientation())
         self.body.velocity = (0, 0)
         self.body.angular_velocity = 0
         for obj in self.side_bar_sprites:
             obj.reset()
 
+    def snapshot(self) -> tuple:
+        """
+        Get the state of the robot that changes while simulating: the motion of its body, the sensor values,
+        the led colors, the sounds, the angles of the arms and the last pose.
+        :return: picklable state, which restore accepts.
+        """
+        arm_angles = tuple(actuator.side_bar_arm.angle for actuator in self.actuators.values()
+                           if isinstance(actuator, Arm))
+        return (get_body_state(self.body), dict(self.values), dict(self.led_colors), dict(self.sounds), arm_angles,
+                self.last_pos, self.last_angle)
+
+    def restore(self, state: tuple):
+        """
+        Restore the state of the robot returned by snapshot.
+        :param state: to restore.
+        """
+        body_state, values, led_colors, sounds, arm_angles, self.last_pos, self.last_angle = state
+        set_body_state(self.body, body_state)
+        self.values.clear()
+        self.values.update(values)
+        self.led_colors.clear()
+        self.led_colors.update(led_colors)
+        self.sounds.clear()
+        self.sounds.update(sounds)
+        arms = (actuator for actuator in self.actuators.values() if isinstance(actuator, Arm))
+        for arm, angle in zip(arms, arm_angles):
+            arm.side_bar_arm.angle = angle
+            arm.side_bar_arm.rotate(0)
+
     def setup_pymunk_shapes(self, scale):
         """
         Creates the body of the robot and adds the shapes of all robot parts.
@@ -192,6 +223,9 @@ class RobotState:
         """
         Creates the sprite list based on all the parts of the robot.
         """
+        import arcade as _arcade  # pylint: disable=import-outside-toplevel
+
+        self.sprite_list = _arcade.SpriteList()
         for part in self.parts:
             part.setup_visuals(scale)
             self.sprite_list.append(part.sprite)
@@ -242,27 +276,29 @@ class RobotState:
         """
         self.actuators[address].set_color_texture(color)
 
-    def set_color_obstacles(self, obstacles: [color_obstacle]):
+    def set_color_obstacles(self, obstacles: [color_obstacle], obstacle_lookup=None):
         """
         Set the obstacles which can be detected by the color sensors of this robot.
         :param obstacles: to be detected.
+        :param obstacle_lookup: optional lookup of the obstacles, for looking up the colors faster.
         """
         for part in self.sensors.values():
             if part.get_ev3type() == 'color_sensor':
-                part.set_sensible_obstacles(obstacles)
+                part.set_sensible_obstacles(obstacles, obstacle_lookup)
 
-    def set_falling_obstacles(self, obstacles):
+    def set_falling_obstacles(self, obstacles, obstacle_lookup=None):
         """
         Set the obstacles which can be detected by the wheel of this robot. This simulates
         the entering of a wheel in a 'hole'. Meaning it is stuck or falling.
         :param obstacles: to be detected.
+        :param obstacle_lookup: optional lookup of the obstacles, for looking up the ground faster.
         """
         for part in self.actuators.values():
             if part.get_ev3type() == 'motor':
-                part.set_sensible_obstacles(obstacles)
+                part.set_sensible_obstacles(obstacles, obstacle_lookup)
         for part in self.sensors.values():
             if isinstance(part, UltrasonicSensorBottom):
-                part.set_sensible_obstacles(obstacles)
+                part.set_sensible_obstacles(obstacles, obstacle_lookup)
 
     def get_sensor(self, address):
         """
@@ -292,13 +328,9 @@ class RobotState:
         """
         Gets all wheels of the robot.
         """
-        wheels = []
-        for part in self.actuators.values():
-            if part.get_ev3type() == 'motor':
-                wheels.append(part)
-        return wheels
+        return self.wheels
 
-    def get_sprites(self) -> _arcade.SpriteList:
+    def get_sprites(self):
         """
         Gets the sprite list that has all robot part sprites in it.
         """
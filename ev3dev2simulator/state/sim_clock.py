@@ -0,0 +1,100 @@
+"""
+The sim_clock module contains the class SimClock, which keeps the simulated time of the world.
+"""
+
+import math
+import threading
+
+from ev3dev2simulator.config.config import get_simulation_settings
+
+
+class SimClock:
+    """
+    Class keeping track of the simulated time, which advances one frame time with every world update.
+    In lockstep mode the connected clients follow this clock instead of the wall clock. The world is then only
+    updated once every connected client is sleeping, so updates run as fast as the clients allow.
+    """
+
+    def __init__(self, lockstep: bool = False, frame_time: float = None):
+        if frame_time is None:
+            frame_time = 1.0 / float(get_simulation_settings()['exec_settings']['frames_per_second'])
+        self.frame_time = frame_time
+        self.lockstep = lockstep
+        self.frame = 0
+
+        self.connected = 0
+        self.stopped = False
+        self.wake_up_times = []
+        self.condition = threading.Condition()
+
+    @property
+    def time(self) -> float:
+        """
+        The simulated time in seconds.
+        """
+        return self.frame * self.frame_time
+
+    def advance(self):
+        """
+        Advance the clock by one frame and wake up the clients which have slept long enough.
+        """
+        with self.condition:
+            self.frame += 1
+            self.condition.notify_all()
+
+    def connect(self):
+        """
+        Register a connected client, the world does not advance in lockstep mode until it sleeps.
+        """
+        with self.condition:
+            self.connected += 1
+            self.condition.notify_all()
+
+    def disconnect(self):
+        """
+        Unregister a connected client.
+        """
+        with self.condition:
+            self.connected = max(self.connected - 1, 0)
+            self.condition.notify_all()
+
+    def stop(self):
+        """
+        Stop the clock when the simulation ends, waking up the sleeping clients without advancing the time.
+        Clients that sleep afterwards return immediately.
+        """
+        with self.condition:
+            self.stopped = True
+            self.condition.notify_all()
+
+    def sleep(self, seconds: float) -> float:
+        """
+        Block the calling client until the given number of simulated seconds have passed or the clock is stopped.
+        Sleeping less than a frame still takes a frame, since the world cannot change in between.
+        :param seconds: to sleep.
+        :return: the simulated time after sleeping.
+        """
+        with self.condition:
+            wake_up_frame = self.frame + max(self._to_frames(seconds), 1)
+            self.wake_up_times.append(wake_up_frame)
+            self.condition.notify_all()
+            self.condition.wait_for(lambda: self.frame >= wake_up_frame or self.stopped)
+            self.wake_up_times.remove(wake_up_frame)
+            return self.time
+
+    def wait_for_clients(self, timeout: float = None) -> bool:
+        """
+        Block until all connected clients are sleeping, which allows the world to advance in lockstep mode.
+        :param timeout: maximum number of seconds to wait.
+        :return: True if the world can advance, False on a timeout.
+        """
+        with self.condition:
+            return self.condition.wait_for(self._clients_are_sleeping, timeout)
+
+    def _clients_are_sleeping(self) -> bool:
+        sleeping = sum(1 for wake_up_frame in self.wake_up_times if wake_up_frame > self.frame)
+        return self.connected > 0 and sleeping >= self.connected
+
+    def _to_frames(self, seconds: float) -> int:
+        # the small margin prevents rounding errors from adding a frame to whole frame sleeps
+        return math.ceil(seconds / self.frame_time - 1e-6)
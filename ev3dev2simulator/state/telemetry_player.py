@@ -0,0 +1,126 @@
+"""
+The telemetry_player module contains the class TelemetryPlayer, which shows the frames recorded by a TelemetryRecorder
+in a world instead of simulating it.
+"""
+
+import math
+
+import numpy as np
+
+from ev3dev2simulator.state.world_state import WorldState
+
+MIN_SPEED = 1 / 16
+MAX_SPEED = 64
+
+
+class TelemetryPlayer:
+    """
+    Player moving the robots and movable obstacles of a world to their poses in the recorded frames and setting the
+    sensor values of the robots to the recorded values. The space of the world is never stepped: the bodies only hold
+    the recorded poses, from which the sprites of the parts are positioned. There are no robot programs or connections.
+    The player advances speed frames per update, so 1 plays at the recorded rate with the default update rate.
+    """
+
+    def __init__(self, world_state: WorldState, path: str):
+        self.world_state = world_state
+        self.records = np.load(path, mmap_mode='r')
+
+        recorded_robots = self.records.dtype['robots'].names
+        if sorted(recorded_robots) != sorted(robot.name for robot in world_state.robots) or \
+                self.records.dtype['obstacles'].shape[0] != len(world_state.obstacles):
+            raise ValueError(f'the recording {path} does not match the world configuration')
+
+        # per robot the addresses of its sensors with whether their values are booleans, like touch sensors
+        self.sensor_kinds = {}
+        for robot in world_state.robots:
+            self.sensor_kinds[robot.name] = [(address, isinstance(sensor.get_default_value(), bool))
+                                             for address, sensor in robot.sensors.items()]
+
+        self.position = 0.0
+        self.frame_index = 0
+        self.speed = 1.0
+        self.paused = False
+
+    @property
+    def frames(self) -> int:
+        """
+        Number of recorded frames.
+        """
+        return len(self.records)
+
+    def update(self):
+        """
+        Advance by speed frames unless paused, and show the frame. Pauses at the last frame.
+        """
+        if not self.paused:
+            self.position += self.speed
+            if self.position >= self.frames - 1:
+                self.position = self.frames - 1
+                self.paused = True
+        self.show(int(self.position))
+
+    def seek(self, frame_index: int):
+        """
+        Jump to the recorded frame with the given index, limited to the recorded frames.
+        """
+        self.position = float(min(max(frame_index, 0), self.frames - 1))
+        self.show(int(self.position))
+
+    def change_speed(self, factor: float):
+        """
+        Multiply the number of frames advanced per update by factor, between 1/16 and 64.
+        """
+        self.speed = min(max(self.speed * factor, MIN_SPEED), MAX_SPEED)
+
+    def toggle_pause(self):
+        """
+        Pause or continue, from the start when paused at the last frame.
+        """
+        if self.paused and self.frame_index == self.frames - 1:
+            self.seek(0)
+        self.paused = not self.paused
+
+    def show(self, frame_index: int):
+        """
+        Move the bodies and sprites of the world to the poses of a recorded frame and set the sensor values.
+        """
+        self.frame_index = frame_index
+        if self.frames == 0:
+            return
+        record = self.records[frame_index]
+
+        for robot in self.world_state.robots:
+            values = record['robots'][robot.name]
+            robot.body.angle = math.radians(values['angle'])
+            robot.body.position = (values['x'] * robot.scale, values['y'] * robot.scale)
+            for address, is_bool in self.sensor_kinds[robot.name]:
+                robot.values[address] = _to_value(float(values[f'{address[0]}:{address[1]}']), is_bool)
+            robot.set_last_pos(robot.body.position)
+            robot.last_angle = float(values['angle'])
+            if robot.sprite_list is not None:
+                for part in robot.parts:
+                    part.sprite.center_x, part.sprite.center_y = part.get_position()
+                    part.sprite.angle = part.get_angle()
+
+        for obstacle, (x_coord, y_coord, angle) in zip(self.world_state.obstacles, record['obstacles']):
+            obstacle.body.angle = math.radians(angle)
+            obstacle.body.position = (x_coord * obstacle.scale, y_coord * obstacle.scale)
+            obstacle.set_new_pos(obstacle.body.position)
+            obstacle.new_angle = float(angle)
+            if obstacle.sprite is not None:
+                obstacle.sprite.center_x, obstacle.sprite.center_y = obstacle.body.position
+                obstacle.sprite.angle = obstacle.new_angle
+
+    def get_status(self) -> str:
+        """
+        Get a line describing the shown frame, the speed and whether the player is paused.
+        """
+        time = float(self.records['time'][self.frame_index]) if self.frames else 0.0
+        status = f'frame {self.frame_index + 1}/{self.frames}  {time:.2f} s  {self.speed:g}x'
+        return status + '  paused' if self.paused else status
+
+
+def _to_value(value: float, is_bool: bool):
+    if is_bool:
+        return bool(value)
+    return int(value) if value.is_integer() else value
@@ -0,0 +1,146 @@
+"""
+The telemetry_recorder module contains the class TelemetryRecorder, which writes a binary record of every simulated
+frame to a NumPy file.
+"""
+
+import math
+import struct
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# reserved size of the header of the .npy file, below the largest header numpy.load accepts by default
+HEADER_SIZE = 8192
+NPY_MAGIC = b'\x93NUMPY\x01\x00'
+NPY_HEADER_LENGTH = struct.Struct('<H')
+
+
+def create_frame_dtype(world_state) -> np.dtype:
+    """
+    Create the structured dtype of a frame record of the given world. It has the frame number and the simulated time,
+    per robot (by name) its pose in millimeters and degrees, the speeds of its wheels in millimeters per second,
+    the value of every sensor (by brick:address), whether it touches another body and whether it is falling,
+    and the x, y and angle of every movable obstacle.
+    :param world_state: of which to record the frames.
+    """
+    robot_dtypes = []
+    for robot in world_state.robots:
+        fields = [('x', '<f8'), ('y', '<f8'), ('angle', '<f8'), ('left_speed', '<f8'), ('right_speed', '<f8')]
+        fields.extend((f'{brick}:{address}', '<f8') for brick, address in robot.sensors)
+        fields.extend([('collision', '?'), ('falling', '?')])
+        robot_dtypes.append((robot.name, fields))
+    return np.dtype([('frame', '<i8'), ('time', '<f8'), ('robots', robot_dtypes),
+                     ('obstacles', '<f8', (len(world_state.obstacles), 3))])
+
+
+class TelemetryRecorder:
+    """
+    Recorder appending a record of every simulated frame to a .npy file of structured records, which can be loaded
+    with numpy.load, also while memory mapped. The records are written to a memory mapped chunk of chunk_frames
+    records. A full chunk is flushed to disk on a background thread while the next chunk is mapped, so recording
+    costs a few array assignments per frame. close writes the final number of frames in the header of the file.
+    The WorldSimulator calls record after every frame once the recorder is set with set_telemetry_recorder.
+    """
+
+    def __init__(self, world_simulator, path: str, chunk_frames: int = 4096):
+        self.world_simulator = world_simulator
+        self.path = path
+        self.chunk_frames = chunk_frames
+        self.dtype = create_frame_dtype(world_simulator.world_state)
+        self.frames = 0
+        self.closed = False
+
+        self.robot_simulators = world_simulator.robot_simulators
+        self.obstacles = world_simulator.world_state.obstacles
+        self.frames_per_second = 1 / world_simulator.clock.frame_time
+
+        with open(path, 'wb') as stream:
+            self._write_header(stream, 0)
+        self.flusher = ThreadPoolExecutor(max_workers=1)
+        self.chunk = None
+        self.chunk_start = 0
+        self._map_chunk(0)
+
+    def _write_header(self, stream, frames: int):
+        """
+        Write the .npy header for the given number of frames, padded to HEADER_SIZE so the records never move.
+        """
+        header = repr({'descr': np.lib.format.dtype_to_descr(self.dtype), 'fortran_order': False,
+                       'shape': (frames,)})
+        header_length = HEADER_SIZE - len(NPY_MAGIC) - NPY_HEADER_LENGTH.size
+        if len(header) >= header_length:
+            raise ValueError('too many robots and sensors to record')
+        stream.write(NPY_MAGIC + NPY_HEADER_LENGTH.pack(header_length) +
+                     (header.ljust(header_length - 1) + '\n').encode('latin1'))
+
+    def _map_chunk(self, start: int):
+        """
+        Map the chunk of records starting at the given frame, which grows the file.
+        """
+        self.chunk = np.memmap(self.path, dtype=self.dtype, mode='r+', offset=HEADER_SIZE + start * self.dtype.itemsize,
+                               shape=(self.chunk_frames,))
+        self.chunk_start = start
+
+    def record(self):
+        """
+        Append the record of the current frame of the world.
+        """
+        index = self.frames - self.chunk_start
+        if index == self.chunk_frames:
+            self.flusher.submit(self.chunk.flush)
+            self._map_chunk(self.frames)
+            index = 0
+
+        record = self.chunk[index]
+        clock = self.world_simulator.clock
+        record['frame'] = clock.frame
+        record['time'] = clock.time
+
+        robots = record['robots']
+        for robot_sim in self.robot_simulators:
+            self._record_robot(robots[robot_sim.robot.name], robot_sim)
+
+        obstacles = record['obstacles']
+        for index, obstacle in enumerate(self.obstacles):
+            position = obstacle.body.position
+            obstacles[index] = (position.x / obstacle.scale, position.y / obstacle.scale,
+                                math.degrees(obstacle.body.angle))
+        self.frames += 1
+
+    def _record_robot(self, values, robot_sim):
+        """
+        Store the values of a robot in its part of a record.
+        """
+        robot = robot_sim.robot
+        body = robot.body
+        position = body.position
+        values['x'] = position.x / robot.scale
+        values['y'] = position.y / robot.scale
+        values['angle'] = math.degrees(body.angle)
+        left_speed, right_speed = robot_sim.wheel_speeds
+        values['left_speed'] = left_speed * self.frames_per_second
+        values['right_speed'] = right_speed * self.frames_per_second
+        for brick, address in robot.sensors:
+            values[f'{brick}:{address}'] = robot_sim.evaluate_sensor((brick, address))
+        values['collision'] = _is_touching(body)
+        values['falling'] = robot.is_falling()
+
+    def close(self):
+        """
+        Flush the records, write the number of recorded frames in the header and cut off the unused records.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        self.flusher.shutdown()
+        self.chunk.flush()
+        self.chunk = None
+        with open(self.path, 'r+b') as stream:
+            self._write_header(stream, self.frames)
+            stream.truncate(HEADER_SIZE + self.frames * self.dtype.itemsize)
+
+
+def _is_touching(body) -> bool:
+    touching = []
+    body.each_arbiter(lambda arbiter: touching.append(True))
+    return bool(touching)
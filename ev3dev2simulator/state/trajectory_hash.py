@@ -0,0 +1,40 @@
+"""
+The trajectory_hash module contains the class TrajectoryHash, a fingerprint of the motion of all bodies of a world.
+"""
+
+import hashlib
+import struct
+
+from ev3dev2simulator.state.world_state import WorldState
+
+
+class TrajectoryHash:
+    """
+    SHA-256 hash over the exact positions and angles of the robots and movable obstacles of a world in every
+    recorded frame. Two runs only have the same hash if every body followed the same trajectory bit for bit,
+    which makes it suitable to compare runs of the simulator in tests.
+    """
+
+    def __init__(self, world_state: WorldState):
+        self.bodies = [robot.body for robot in world_state.robots] + \
+                      [obstacle.body for obstacle in world_state.obstacles]
+        self.pose_format = struct.Struct(f'<{3 * len(self.bodies)}d')
+        self.hash = hashlib.sha256()
+        self.frames = 0
+
+    def update(self):
+        """
+        Add the current poses of the bodies to the hash.
+        """
+        poses = []
+        for body in self.bodies:
+            position = body.position
+            poses.extend((position.x, position.y, body.angle))
+        self.hash.update(self.pose_format.pack(*poses))
+        self.frames += 1
+
+    def hexdigest(self) -> str:
+        """
+        Get the hash of the frames added so far.
+        """
+        return self.hash.hexdigest()
@@ -4,6 +4,7 @@ The world simulator module contains the WoldSimulator class which simulates the
 import math
 
 from ev3dev2simulator.state.robot_simulator import RobotSimulator
+from ev3dev2simulator.state.sim_clock import SimClock
 from ev3dev2simulator.state.world_state import WorldState
 from ev3dev2simulator.config.config import get_simulation_settings
 
@@ -13,17 +14,53 @@ class WorldSimulator:
     The world simulator contains the robot simulators and also simulates all other objects.
     It handles the space, the physics of all objects in the world.
     """
-    def __init__(self, world_state: WorldState):
+    def __init__(self, world_state: WorldState, clock: SimClock = None):
         self.world_state = world_state
+        self.clock = clock if clock is not None else SimClock()
         self.robot_simulators = []
         self.should_reset = False
+        self.telemetry_recorder = None
         for robot in world_state.robots:
-            robot_sim = RobotSimulator(robot)
+            robot_sim = RobotSimulator(robot, self.clock)
             self.robot_simulators.append(robot_sim)
 
         self.world_state.space.add_default_collision_handler()
 
-        self.space_step_size = float(get_simulation_settings()['exec_settings']['frames_per_second'])
+        exec_settings = get_simulation_settings()['exec_settings']
+        self.space_substeps = int(exec_settings['physics_substeps'])
+        self.space_step_size = float(exec_settings['frames_per_second']) * self.space_substeps
+
+    def snapshot(self) -> tuple:
+        """
+        Get the full state of the simulation: the simulated time, the world and the actuator profiles of the robots.
+        Restoring it is much cheaper than creating a new world, e.g. to try alternative actions from the same state.
+        :return: picklable state, which restore accepts.
+        """
+        return (self.clock.frame, self.world_state.snapshot(),
+                tuple(robot_sim.snapshot() for robot_sim in self.robot_simulators))
+
+    def restore(self, state: tuple):
+        """
+        Restore the state of the simulation returned by snapshot. Must not be called while the world is updated.
+        :param state: to restore.
+        """
+        self.clock.frame, world_state, robot_sim_states = state
+        self.world_state.restore(world_state)
+        for robot_sim, robot_sim_state in zip(self.robot_simulators, robot_sim_states):
+            robot_sim.restore(robot_sim_state)
+
+    def set_command_log(self, command_log):
+        """
+        Record the commands processed for all robots in the given CommandLog, or stop recording with None.
+        """
+        for robot_sim in self.robot_simulators:
+            robot_sim.command_log = command_log
+
+    def set_telemetry_recorder(self, telemetry_recorder):
+        """
+        Record every simulated frame with the given TelemetryRecorder, or stop recording with None.
+        """
+        self.telemetry_recorder = telemetry_recorder
 
     def request_reset(self):
         """
@@ -42,15 +79,20 @@ class WorldSimulator:
             self.should_reset = False
         else:
             self.sync_physics_sprites()
-            self.world_state.space.step(1.0 / self.space_step_size)
+            for _ in range(self.space_substeps):
+                self.world_state.space.step(1.0 / self.space_step_size)
             for robot in self.robot_simulators:
                 robot.update()
+            self.clock.advance()
+            if self.telemetry_recorder is not None:
+                self.telemetry_recorder.record()
 
     def sync_physics_sprites(self):
         """ Move sprites to where physics objects are """
         for obstacle in self.world_state.obstacles:
-            obstacle.sprite.center_x = obstacle.body.position.x
-            obstacle.sprite.center_y = obstacle.body.position.y
-            obstacle.sprite.angle = math.degrees(obstacle.body.angle)
             obstacle.set_new_pos(obstacle.body.position)
-            obstacle.new_angle = obstacle.sprite.angle
+            obstacle.new_angle = math.degrees(obstacle.body.angle)
+            if obstacle.sprite is not None:
+                obstacle.sprite.center_x = obstacle.body.position.x
+                obstacle.sprite.center_y = obstacle.body.position.y
+                obstacle.sprite.angle = obstacle.new_angle
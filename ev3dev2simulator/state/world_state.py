@@ -2,13 +2,16 @@
 The world state module contains the state of the world, which includes the robot states.
 """
 
-from math import radians
+from math import ceil, radians
 
-import arcade as _arcade
+import numpy as np
 import pymunk
 from pymunk import Space
 
+from ev3dev2simulator.config.config import get_simulation_settings
 from ev3dev2simulator.obstacle.board import Board
+from ev3dev2simulator.state.obstacle_grid import ObstacleGrid
+from ev3dev2simulator.state.obstacle_raster import ObstacleRaster
 from ev3dev2simulator.state.robot_state import RobotState
 
 from ev3dev2simulator.obstacle.border import Border
@@ -17,6 +20,11 @@ from ev3dev2simulator.obstacle.edge import Edge
 from ev3dev2simulator.obstacle.lake import Lake
 from ev3dev2simulator.obstacle.rock import Rock
 from ev3dev2simulator.obstacle.tile import Tile
+from ev3dev2simulator.robotpart.wheel import Wheel
+from ev3dev2simulator.util.util import get_body_state, set_body_state
+
+# pixels per millimeter of the physics and sensing of the world, a window only scales the world when drawing it
+WORLD_SCALE = 1
 
 
 class WorldState:
@@ -24,11 +32,15 @@ class WorldState:
     Contains the objects, the robots and the surrounding space of the 'world'
     """
     def __init__(self, config):
-        self.sprite_list = _arcade.SpriteList()
+        self.sprite_list = None
+        self.static_shape_lists = []
         self.obstacles = []
         self.static_obstacles = []
         self.falling_obstacles = []
         self.color_obstacles = []
+        self.color_lookup = None
+        self.falling_lookup = None
+        self.falling_table = None
 
         self.robots = []
         self.space = Space()
@@ -84,6 +96,29 @@ class WorldState:
         for obstacle in self.obstacles:
             obstacle.reset()
 
+    def snapshot(self) -> tuple:
+        """
+        Get the state of the world that changes while simulating: the motion of the movable obstacles and the state
+        of the robots. The static obstacles never change. The cached contacts of the pymunk space are not included,
+        so the motion directly after restoring a snapshot taken during a collision may differ slightly.
+        :return: picklable state, which restore accepts.
+        """
+        return (tuple(get_body_state(obstacle.body) for obstacle in self.obstacles),
+                tuple(robot.snapshot() for robot in self.robots))
+
+    def restore(self, state: tuple):
+        """
+        Restore the state of the world returned by snapshot.
+        :param state: to restore.
+        """
+        obstacle_states, robot_states = state
+        for obstacle, body_state in zip(self.obstacles, obstacle_states):
+            set_body_state(obstacle.body, body_state)
+            self.space.reindex_shapes_for_body(obstacle.body)
+        for robot, robot_state in zip(self.robots, robot_states):
+            robot.restore(robot_state)
+            self.space.reindex_shapes_for_body(robot.body)
+
     def setup_pymunk_shapes(self, scale):
         """
         Setup the shapes that are added to the pymunk space.
@@ -101,44 +136,110 @@ class WorldState:
             self.space.add(obstacle.body)
             self.space.add(obstacle.shape)
 
-    def rescale(self, new_scale):
+    def setup_sensing(self, scale):
         """
-        On screen rescale, rescale all sprites.
+        Calculate the outlines of the static obstacles and hand them to the robots, so their
+        sensors and wheels can detect them. Does not require any visualisation.
+        The lookups of the colors and the ground of the board are built once, unless they are shared by another world.
         """
-        for robot in self.robots:
-            robot.shapes = []
-        for obstacle in self.obstacles:
-            obstacle.shape = None
-        self.space.remove(self.space.shapes)
-        self.space.remove(self.space.bodies)
+        for obstacle in self.static_obstacles:
+            obstacle.create_points(scale)
+
+        if self.color_lookup is None:
+            self.color_lookup = self._create_obstacle_lookup(self.color_obstacles, scale)
+            self.falling_lookup = self._create_obstacle_lookup(self.falling_obstacles, scale)
+            # indexed by the obstacle indices of the lookup, NO_OBSTACLE (-1) selects the last entry
+            self.falling_table = np.array([Wheel.is_falling_on(obstacle) for obstacle in self.falling_obstacles]
+                                          + [Wheel.is_falling_on(None)])
 
         for robot in self.robots:
-            robot.sprite_list = _arcade.SpriteList()
-        self.sprite_list = _arcade.SpriteList()
-        self.setup_pymunk_shapes(new_scale)
-        self.setup_visuals(new_scale)
+            robot.set_color_obstacles(self.color_obstacles, self.color_lookup)
+            robot.set_falling_obstacles(self.falling_obstacles, self.falling_lookup)
+
+    def share_lookups(self, other: 'WorldState'):
+        """
+        Use the lookups of the colors and the ground of another world of the same configuration instead of building
+        them in setup_sensing. The lookups only contain static obstacles, which are the same in both worlds.
+        :param other: world state of which setup_sensing has been called.
+        """
+        self.color_lookup = other.color_lookup
+        self.falling_lookup = other.falling_lookup
+        self.falling_table = other.falling_table
+
+    def _create_obstacle_lookup(self, obstacles, scale):
+        """
+        Create a raster of the obstacles, or a grid of obstacle lists when the raster of the board would be too large.
+        """
+        settings = get_simulation_settings()['sensing_settings']
+        cell_size = settings['raster_cell_size']
+        if ceil(self.board_width / cell_size) * ceil(self.board_height / cell_size) <= settings['max_raster_cells']:
+            return ObstacleRaster(obstacles, self.board_width, self.board_height, scale, cell_size)
+        return ObstacleGrid(obstacles, self.board_width, self.board_height, scale, settings['grid_cell_size'])
+
+    def get_falling_robots(self) -> [RobotState]:
+        """
+        Get the robots that have a wheel off the playing field or in a hole.
+        The wheels of all robots are looked up in the lookup of the falling obstacles at once.
+        """
+        if self.falling_lookup is None:
+            return [robot for robot in self.robots if robot.is_falling()]
+
+        wheels = [(robot, wheel) for robot in self.robots for wheel in robot.get_wheels()]
+        if not wheels:
+            return []
+        positions = np.array([tuple(wheel.get_position()) for _, wheel in wheels])
+        falling = self.falling_table[self.falling_lookup.get_obstacle_indices(positions[:, 0], positions[:, 1])]
+
+        falling_robots = []
+        for (robot, _), wheel_falling in zip(wheels, falling):
+            if wheel_falling and robot not in falling_robots:
+                falling_robots.append(robot)
+        return falling_robots
 
     def setup_visuals(self, scale):
         """
         Setup all sprites.
         """
+        import arcade as _arcade  # pylint: disable=import-outside-toplevel
+
         for obstacle in self.static_obstacles:
             obstacle.create_shape(scale)
+        self.static_shape_lists = self._batch_static_shapes()
 
+        self.sprite_list = _arcade.SpriteList()
         for obstacle in self.obstacles:
             obstacle.create_sprite(scale)
             self.sprite_list.append(obstacle.sprite)
 
         for robot in self.robots:
             robot.setup_visuals(scale)
-            robot.set_color_obstacles(self.color_obstacles)
-            robot.set_falling_obstacles(self.falling_obstacles)
+
+    def _batch_static_shapes(self) -> list:
+        """
+        Batch the shapes of the static obstacles, which never move, so they are drawn with a few draw calls per frame
+        instead of one per shape. A ShapeElementList draws its shapes grouped by their mode, so each list holds a run
+        of consecutive shapes with the same mode to keep the order in which the obstacles are drawn on each other.
+        """
+        import arcade as _arcade  # pylint: disable=import-outside-toplevel
+
+        shape_lists = []
+        mode = None
+        for obstacle in self.static_obstacles:
+            for shape in obstacle.get_shapes():
+                if shape.line_width != 1:
+                    continue  # arcade only draws shapes with a line width of 1
+                if shape.mode != mode:
+                    shape_lists.append(_arcade.ShapeElementList())
+                    mode = shape.mode
+                shape_lists[-1].append(shape)
+        return shape_lists
 
     def set_object_at_position_as_selected(self, pos):
         """
         Based on the position given, select the object that is closest (with a maximum of 15) and set as selected.
+        The position and the maximum distance are in millimeters, the window converts its mouse position.
         """
-        max_distance = 15
+        max_distance = 15 * WORLD_SCALE
         queried_object = self.space.point_query_nearest(pos, max_distance, pymunk.ShapeFilter())
         if queried_object is not None:
             poly = queried_object.shape
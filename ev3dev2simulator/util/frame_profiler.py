@@ -0,0 +1,129 @@
+"""
+The frame_profiler module contains the class FrameProfiler, which measures how long the stages of a simulated
+and drawn frame take.
+"""
+
+import csv
+import time
+from typing import Callable, List, Tuple, Union
+
+FRAME_STAGE = 'frame'
+
+
+class FrameProfiler:
+    """
+    Profiler accumulating the number of calls, the total and the maximum duration of the stages of a frame.
+    A stage is measured by replacing a method of an object by a timed wrapper with instrument, so objects that are
+    not instrumented run without any overhead. Updates of the world count as frames: the stage 'frame' holds the
+    duration of the whole update, the other stages are part of it or of drawing the frame.
+    """
+
+    def __init__(self):
+        # per stage a list with the number of calls, the total duration and the maximum duration in seconds
+        self.stages = {}
+        self.instrumented = []
+
+    def instrument(self, obj, method_name: str, stage: Union[str, Callable[..., str]] = None):
+        """
+        Measure the calls of a method of an object as a stage.
+        :param obj: of which the method is measured.
+        :param method_name: name of the method.
+        :param stage: name of the stage, the name of the method if None. A function is called with the arguments
+        of each call to get the name of the stage of that call, e.g. to measure each type of sensor separately.
+        """
+        method = getattr(obj, method_name)
+        if callable(stage):
+            stats, stage_of = None, stage
+        else:
+            stats = self._get_stats(stage or method_name)
+            stage_of = None
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                duration = time.perf_counter() - start
+                call_stats = stats if stage_of is None else self._get_stats(stage_of(*args, **kwargs))
+                call_stats[0] += 1
+                call_stats[1] += duration
+                if duration > call_stats[2]:
+                    call_stats[2] = duration
+
+        setattr(obj, method_name, timed)
+        self.instrumented.append((obj, method_name))
+
+    def instrument_world(self, world_simulator):
+        """
+        Measure the stages of the updates of a world and its robots: the whole update, moving the obstacle sprites,
+        stepping the space, and per robot getting the actuator jobs, moving the robot, evaluating each type of sensor
+        and moving the sprites of its parts. Must be called before the update method of the world is passed on.
+        :param world_simulator: to measure.
+        """
+        self.instrument(world_simulator, 'update', FRAME_STAGE)
+        self.instrument(world_simulator, 'sync_physics_sprites', 'obstacle sprites')
+        self.instrument(world_simulator.world_state.space, 'step', 'space.step')
+        for robot_sim in world_simulator.robot_simulators:
+            sensors = robot_sim.robot.sensors
+            self.instrument(robot_sim, 'next_actuator_jobs')
+            self.instrument(robot_sim.robot, 'execute_movement')
+            self.instrument(robot_sim, 'evaluate_sensor',
+                            lambda address, sensors=sensors: f'sensor {type(sensors[address]).__name__}')
+            self.instrument(robot_sim, '_sync_physics_sprites', 'robot sprites')
+
+    def remove(self):
+        """
+        Restore all instrumented methods.
+        """
+        for obj, method_name in reversed(self.instrumented):
+            delattr(obj, method_name)
+        self.instrumented = []
+
+    def _get_stats(self, stage: str) -> list:
+        stats = self.stages.get(stage)
+        if stats is None:
+            stats = self.stages[stage] = [0, 0.0, 0.0]
+        return stats
+
+    @property
+    def frames(self) -> int:
+        """
+        Number of measured updates of the world.
+        """
+        return self.stages[FRAME_STAGE][0] if FRAME_STAGE in self.stages else 0
+
+    def clear(self):
+        """
+        Forget all measurements.
+        """
+        for stats in self.stages.values():
+            stats[:] = [0, 0.0, 0.0]
+
+    def get_results(self) -> List[Tuple[str, int, float, float, float]]:
+        """
+        Get the measurements per stage, the frame first and the other stages by decreasing total duration.
+        :return: list of tuples of the stage, the number of calls, the total duration, the mean duration per frame
+        and the maximum duration of a call, all in milliseconds.
+        """
+        frames = max(self.frames, 1)
+        results = [(stage, calls, total * 1000, total * 1000 / frames, maximum * 1000)
+                   for stage, (calls, total, maximum) in self.stages.items()]
+        results.sort(key=lambda result: (result[0] != FRAME_STAGE, -result[2]))
+        return results
+
+    def get_lines(self) -> List[str]:
+        """
+        Get a line per stage with its mean and maximum duration, to show in the sidebar.
+        """
+        return [f'{stage}: {mean:.2f} ms (max {maximum:.2f})' for stage, _, _, mean, maximum in self.get_results()]
+
+    def write_csv(self, path: str):
+        """
+        Write the measurements per stage to a CSV file.
+        :param path: of the file to write.
+        """
+        with open(path, 'w', newline='') as stream:
+            writer = csv.writer(stream)
+            writer.writerow(['stage', 'calls', 'total_ms', 'mean_ms_per_frame', 'max_ms'])
+            for stage, calls, total, mean, maximum in self.get_results():
+                writer.writerow([stage, calls, f'{total:.3f}', f'{mean:.4f}', f'{maximum:.3f}'])
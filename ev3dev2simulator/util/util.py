@@ -3,10 +3,15 @@ Module containing various utility function, mostly concerning mathematical 2D ca
 """
 
 import math
-from typing import Tuple
+from typing import List, Optional, Sequence, Tuple, Union
 
-import arcade as _arcade
-from arcade import PointList
+import numpy as np
+
+Point = Tuple[float, float]
+PointList = Sequence[Point]
+Color = Union[Tuple[int, int, int], List[int]]
+BoundingBox = Tuple[float, float, float, float]
+BodyState = Tuple[float, float, float, float, float, float]
 
 
 def get_circle_points(center_x: float,
@@ -40,46 +45,116 @@ def get_circle_points(center_x: float,
     return points
 
 def get_rectangle_points(center_x: float,
-                        center_y: float,
-                        width: float,
-                        height: float,
-                        num_segments: int = 32) -> PointList:
+                         center_y: float,
+                         width: float,
+                         height: float,
+                         tilt_angle: float = 0) -> PointList:
+    """
+    Determine the four corner points of a rectangle of given position, dimensions and rotation.
+    The points are ordered the same way as arcade.get_rectangle_points orders them, so they can be used
+    to create arcade shapes as well as for collision detection without needing arcade.
+
+    :param center_x: the x coordinate of the created rectangle center.
+    :param center_y: the y coordinate of the created rectangle center.
+    :param width: the width of the created rectangle.
+    :param height: the height of the created rectangle.
+    :param tilt_angle: the rotation of the rectangle in degrees.
+    :return: a PointList object containing the coordinates of the rectangle corners.
     """
-    Determine all the coordinate points located on the outline of a circle of given position and radius.
-    The number of points, which correlates to the smoothness of the outline,
-    is specified by the number of segments.
 
-    :param center_x: the x coordinate of the created circle center.
-    :param center_y: the y coordinate of the created circle center.
-    :param radius: the radius of the created circle.
-    :param num_segments: the number of segments of the circle outline.
-    :return: a PointList object containing the coordinates of the circle points.
+    points = [(center_x - width / 2, center_y - height / 2),
+              (center_x - width / 2, center_y + height / 2),
+              (center_x + width / 2, center_y + height / 2),
+              (center_x + width / 2, center_y - height / 2)]
+
+    if tilt_angle:
+        rad = math.radians(tilt_angle)
+        cos, sin = math.cos(rad), math.sin(rad)
+        points = [(center_x + (x - center_x) * cos - (y - center_y) * sin,
+                   center_y + (x - center_x) * sin + (y - center_y) * cos) for x, y in points]
+
+    return points
+
+
+def is_point_in_polygon(x: float, y: float, points: PointList) -> bool:
     """
+    Check if the given point lies inside the polygon described by points, using ray casting.
+    Behaves the same as arcade.is_point_in_polygon, without requiring arcade.
 
-    points = []
+    :param x: coordinate of the point.
+    :param y: coordinate of the point.
+    :param points: the outline of the polygon.
+    :return: True if the point is inside the polygon.
+    """
 
-    x_left = center_x - width / 2
-    x_right = center_x + width * 2
-    y_bottom = center_y - height / 2
-    y_top = center_y + height / 2
+    num_points = len(points)
+    inside = False
+    if num_points == 0:
+        return False
 
-    segs_per_side = num_segments / 4
+    p1x, p1y = points[0]
+    for i in range(num_points + 1):
+        p2x, p2y = points[i % num_points]
+        if min(p1y, p2y) < y <= max(p1y, p2y) and x <= max(p1x, p2x):
+            if p1x == p2x or x <= (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x:
+                inside = not inside
+        p1x, p1y = p2x, p2y
 
-    for segment in range(segs_per_side):
-        points.append(x_left + segment * width / segs_per_side, y_bottom)
+    return inside
 
-    for segment in range(segs_per_side):
-        points.append(x_right, y_bottom + segment * height / segs_per_side)
 
-    for segment in range(segs_per_side):
-        points.append(x_right - segment * width / segs_per_side, y_top)
+def are_points_in_polygon(x_coords: np.ndarray, y_coords: np.ndarray, points: PointList) -> np.ndarray:
+    """
+    Check for each of the given points if it lies inside the polygon described by points.
+    Vectorised version of is_point_in_polygon giving the same outcome for every point.
 
-    for segment in range(segs_per_side):
-        points.append(x_left, y_top - segment * height / segs_per_side)
+    :param x_coords: array with the x coordinates of the points.
+    :param y_coords: array with the y coordinates of the points, of the same shape as x_coords.
+    :param points: the outline of the polygon.
+    :return: boolean array of the shape of x_coords, True where the point is inside the polygon.
+    """
 
-    points.append(points[0])
+    inside = np.zeros(np.shape(x_coords), dtype=bool)
+    num_points = len(points)
+    if num_points == 0:
+        return inside
 
-    return points
+    # only the points inside the bounding box can be inside the polygon
+    candidates = _are_points_in_bounding_box(x_coords, y_coords, get_bounding_box(points))
+    x_coords = np.asarray(x_coords)[candidates]
+    y_coords = np.asarray(y_coords)[candidates]
+    inside_candidates = np.zeros(np.shape(x_coords), dtype=bool)
+
+    p1x, p1y = points[0]
+    for i in range(num_points + 1):
+        p2x, p2y = points[i % num_points]
+        crossing = (min(p1y, p2y) < y_coords) & (y_coords <= max(p1y, p2y)) & (x_coords <= max(p1x, p2x))
+        if p1x != p2x and p1y != p2y:  # horizontal edges are never crossed
+            crossing &= x_coords <= (y_coords - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
+        inside_candidates ^= crossing
+        p1x, p1y = p2x, p2y
+
+    inside[candidates] = inside_candidates
+    return inside
+
+
+def _are_points_in_bounding_box(x_coords: np.ndarray, y_coords: np.ndarray, bounding_box: BoundingBox) -> np.ndarray:
+    min_x, min_y, max_x, max_y = bounding_box
+    return (x_coords >= min_x) & (x_coords <= max_x) & (y_coords >= min_y) & (y_coords <= max_y)
+
+
+def get_bounding_box(points: PointList) -> Optional[BoundingBox]:
+    """
+    Determine the axis aligned bounding box of the given points.
+    :param points: to enclose.
+    :return: the minimal x, minimal y, maximal x and maximal y, or None without points.
+    """
+
+    if not points:
+        return None
+    x_coords = [x for x, _ in points]
+    y_coords = [y for _, y in points]
+    return min(x_coords), min(y_coords), max(x_coords), max(y_coords)
 
 
 def distance_between_points(x_of_point1: float, y_of_point1: float, x_of_point2: float, y_of_point2: float) -> float:
@@ -117,6 +192,33 @@ def calc_differential_steering_angle_x_y(wheel_space: int, left_displacement: fl
     return diff_angle, diff_x, diff_y
 
 
+def get_body_state(body) -> BodyState:
+    """
+    Get the state of the motion of a pymunk body.
+    :param body: of which to get the state.
+    :return: the x and y position, the angle, the x and y velocity and the angular velocity.
+    """
+
+    position = body.position
+    velocity = body.velocity
+    return position.x, position.y, body.angle, velocity.x, velocity.y, body.angular_velocity
+
+
+def set_body_state(body, state: BodyState):
+    """
+    Set the state of the motion of a pymunk body, as returned by get_body_state.
+    The angle is set before the position, since pymunk rotates a body around its center of gravity.
+    :param body: of which to set the state.
+    :param state: to set.
+    """
+
+    pos_x, pos_y, angle, velocity_x, velocity_y, angular_velocity = state
+    body.angle = angle
+    body.position = pos_x, pos_y
+    body.velocity = velocity_x, velocity_y
+    body.angular_velocity = angular_velocity
+
+
 def get_cm_multiplier() -> float:
     """
     Get the multiplier needed for converting millimeters to centimeters.
@@ -135,7 +237,7 @@ def get_inch_multiplier() -> float:
     return 0.254
 
 
-def to_color_code(color: _arcade.Color) -> int:
+def to_color_code(color: Color) -> int:
     """
     Convert rgb tuple to ev3dev color
     """
@@ -0,0 +1,55 @@
+"""
+The replay_visualiser module contains the class ReplayVisualiser, which shows a recorded run in the simulator window.
+"""
+
+import arcade as _arcade
+
+from ev3dev2simulator.config.config import get_simulation_settings
+from ev3dev2simulator.state.telemetry_player import TelemetryPlayer
+from ev3dev2simulator.visualisation.visualiser import Visualiser
+
+# simulated seconds to seek with the left and right keys
+SEEK_SECONDS = 1
+
+
+class ReplayVisualiser(Visualiser):  # pylint: disable=too-many-ancestors
+    """
+    Visualiser showing the frames recorded by a TelemetryRecorder with a TelemetryPlayer instead of simulating them.
+    Space pauses and continues, left and right seek a second back and forward, or a frame when paused,
+    up and down double and halve the speed, and home and end jump to the first and last frame.
+    """
+
+    def __init__(self, world_state, path: str, show_fullscreen: bool, show_maximized: bool,
+                 use_second_screen_to_show_simulator: bool):
+        super().__init__(self._update_player, world_state, show_fullscreen, show_maximized,
+                         use_second_screen_to_show_simulator)
+        self.player = TelemetryPlayer(world_state, path)
+        self.player.seek(0)
+        self.seek_frames = SEEK_SECONDS * int(get_simulation_settings()['exec_settings']['frames_per_second'])
+
+    def _update_player(self):
+        self.player.update()
+
+    def on_draw(self):
+        super().on_draw()
+        _arcade.draw_text(self.player.get_status(), 10, 10, _arcade.color.BLACK, 12)
+
+    def on_key_press(self, symbol: int, modifiers: int):
+        player = self.player
+        seek_frames = 1 if player.paused else self.seek_frames
+        if symbol == _arcade.key.SPACE:
+            player.toggle_pause()
+        elif symbol == _arcade.key.LEFT:
+            player.seek(player.frame_index - seek_frames)
+        elif symbol == _arcade.key.RIGHT:
+            player.seek(player.frame_index + seek_frames)
+        elif symbol == _arcade.key.UP:
+            player.change_speed(2)
+        elif symbol == _arcade.key.DOWN:
+            player.change_speed(0.5)
+        elif symbol == _arcade.key.HOME:
+            player.seek(0)
+        elif symbol == _arcade.key.END:
+            player.seek(player.frames - 1)
+        else:
+            super().on_key_press(symbol, modifiers)
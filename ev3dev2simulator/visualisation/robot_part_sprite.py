@@ -4,11 +4,14 @@ Module containing the ``RobotPartSprite`` class.
 
 import arcade as _arcade
 
+from ev3dev2simulator.visualisation.texture_registry import get_texture
+
 
 class RobotPartSprite(_arcade.Sprite):
     """
     Class used to display all robot parts. Keeps the required textures and its scale.
     Only uses width, since height is scaled automatically based on the height found in the textures.
+    The textures come from the texture registry, so the parts of all robots share them.
     """
 
     def __init__(self,
@@ -17,9 +20,8 @@ class RobotPartSprite(_arcade.Sprite):
                  width_mm=0,
                  scale=1,):
         super().__init__()
-        for texture in src_list:
-            texture = _arcade.load_texture(texture)
-            self.append_texture(texture)
+        for src in src_list:
+            self.append_texture(get_texture(src))
         self.set_texture(start_sprite)
 
         px_mm_scale = scale
@@ -2,17 +2,27 @@
 This module contains the Sidebar class that is used to display information about the current playing field.
 It is displayed to the right of the playing field.
 """
+import time
 from collections import namedtuple
 
 import arcade as _arcade
 
+from ev3dev2simulator.config.config import get_simulation_settings
 from ev3dev2simulator.util.dimensions import Dimensions
 from ev3dev2simulator.util.point import Point
 
+# textures of texts that are no longer shown, kept in the atlas of the sprite list of the lines before it is rebuilt
+MAX_STALE_TEXTURES = 64
+
 
 class Sidebar:
     """
-    The Sidebar class is used to display information about the playing fields and its objects
+    The Sidebar class is used to display information about the playing fields and its objects.
+    Every line of text is a sprite of a single sprite list, of which the texture is only rendered again when the text
+    of the line changes. Floats, like the distances of ultrasonic sensors, and the durations of the profiler change
+    almost every frame, so their lines are only updated at the refresh rate of the sidebar.
+    A sprite list keeps every texture it has drawn in its atlas, also after a sprite shows another texture, so the
+    sprite list is rebuilt from the current lines once it holds more than MAX_STALE_TEXTURES old texts.
     """
     def __init__(self, start_point: Point, dimensions: Dimensions):
         self.start = start_point
@@ -25,7 +35,17 @@ class Sidebar:
 
         self.sprites_total_height = 0
 
-        self.sprites = _arcade.SpriteList()
+        self.sprites = []
+
+        self.profile_lines = []
+
+        self.refresh_time = 1.0 / float(get_simulation_settings()['screen_settings']['side_bar_refresh_rate'])
+        self.next_refresh = 0
+        # per line key the text, the sprite showing it and its position
+        self.text_lines = {}
+        self.text_sprites = _arcade.SpriteList()
+        # names of the textures in the atlas of text_sprites
+        self.text_textures = set()
 
     def init_robot(self, name, sensors, bricks, side_bar_sprites):
         """
@@ -54,22 +74,92 @@ class Sidebar:
         for address, sound in sounds.items():
             robot[address]['value'] = sound
 
+    def set_profile_lines(self, lines: [str]):
+        """
+        Sets the lines with the durations of the stages of a frame, which are drawn below the robots.
+        """
+        self.profile_lines = lines
+
     def draw(self):
         """
         draws the sidebar based on the information given by ``add_robot_info``
         """
+        now = time.monotonic()
+        refresh = now >= self.next_refresh
+        if refresh:
+            self.next_refresh = now + self.refresh_time
+
         height = self.sprites_total_height
         for sprite in self.sprites:
             sprite.draw()
+        shown = set()
         for robot_name, sensor_dict in self.robot_info.items():
-            _arcade.draw_text(robot_name, self.start.x + self.styling.left_text_padding, self.start.y - height,
-                              self.styling.text_color, self.styling.text_size + 2, bold=True)
+            self._set_line(robot_name, robot_name, self.start.x + self.styling.left_text_padding,
+                           self.start.y - height, self.styling.text_size + 2)
+            shown.add(robot_name)
             height += (self.styling.text_size + self.styling.text_spacing)
-            for _, sensor in sensor_dict.items():
-                value = f"{sensor['value']:.2f}" if isinstance(sensor['value'], float) else str(sensor['value'])
-                lines = value.count('\n')
+            for address, sensor in sensor_dict.items():
+                key = (robot_name, address)
+                text = self._get_sensor_text(key, sensor, refresh)
+                lines = text.count('\n')
                 height += (self.styling.text_size * lines)
-                _arcade.draw_text(f"{sensor['name']}: {value}", self.start.x + 2 * self.styling.left_text_padding,
-                                  self.start.y - height, self.styling.text_color, self.styling.text_size)
+                self._set_line(key, text, self.start.x + 2 * self.styling.left_text_padding,
+                               self.start.y - height, self.styling.text_size)
+                shown.add(key)
                 height += (self.styling.text_size + self.styling.text_spacing)
             height += (self.styling.text_size + self.styling.text_spacing)
+        for index, line in enumerate(self.profile_lines):
+            key = ('profile', index)
+            text = line if refresh or key not in self.text_lines else self.text_lines[key][0]
+            self._set_line(key, text, self.start.x + self.styling.left_text_padding, self.start.y - height,
+                           self.styling.text_size - 2)
+            shown.add(key)
+            height += (self.styling.text_size - 2 + self.styling.text_spacing // 2)
+
+        for key in [key for key in self.text_lines if key not in shown]:
+            self.text_sprites.remove(self.text_lines.pop(key)[1])
+        if len(self.text_textures) > len(self.text_lines) + MAX_STALE_TEXTURES:
+            self._rebuild_text_sprites()
+        self.text_sprites.draw()
+
+    def _rebuild_text_sprites(self):
+        """
+        Move the sprites of the lines to a new sprite list, of which the atlas only holds the current texts.
+        """
+        text_sprites = _arcade.SpriteList()
+        for _, sprite, _ in self.text_lines.values():
+            sprite.remove_from_sprite_lists()
+            text_sprites.append(sprite)
+        self.text_sprites = text_sprites
+        self.text_textures = {sprite.texture.name for _, sprite, _ in self.text_lines.values()}
+
+    def _get_sensor_text(self, key, sensor: dict, refresh: bool) -> str:
+        """
+        Get the line of a sensor, floats keep the text they were last shown with until the sidebar is refreshed.
+        """
+        value = sensor['value']
+        if isinstance(value, float):
+            if not refresh and key in self.text_lines:
+                return self.text_lines[key][0]
+            return f"{sensor['name']}: {value:.2f}"
+        return f"{sensor['name']}: {value}"
+
+    def _set_line(self, key, text: str, x: float, y: float, text_size: int):
+        """
+        Show a line of text with its lower left corner at the given position, rendering it only when its text changed.
+        """
+        line = self.text_lines.get(key)
+        if line is None:
+            sprite = _arcade.Sprite()
+            self.text_sprites.append(sprite)
+        else:
+            sprite = line[1]
+            if line[0] == text and line[2] == (x, y):
+                return
+        if line is None or line[0] != text:
+            image = _arcade.get_text_image(text, self.styling.text_color, text_size)
+            sprite.texture = _arcade.Texture(f'sidebar {text_size} {text}', image, hit_box_algorithm='None')
+            self.text_textures.add(sprite.texture.name)
+        sprite.center_x = x + sprite.width / 2
+        sprite.center_y = y + sprite.height / 2
+        self.text_lines[key] = (text, sprite, (x, y))
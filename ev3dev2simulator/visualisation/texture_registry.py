@@ -0,0 +1,31 @@
+"""
+The texture_registry module keeps the textures of the images of the simulator, so each image is decoded once
+per process and its texture is shared by all sprites showing it.
+"""
+
+import os
+
+_textures = {}
+
+
+def get_texture(path: str):
+    """
+    Get the texture of an image, loading it the first time it is requested.
+    :param path: of the image, relative to the working directory or absolute.
+    :return: arcade texture shared by all callers requesting the same file.
+    """
+    key = os.path.realpath(path)
+    texture = _textures.get(key)
+    if texture is None:
+        import arcade as _arcade  # pylint: disable=import-outside-toplevel
+
+        # the registry does the caching, keyed by the resolved path instead of by the spelling of the path
+        texture = _textures[key] = _arcade.load_texture(key, can_cache=False)
+    return texture
+
+
+def clear_textures():
+    """
+    Forget all loaded textures, so they are loaded again when requested.
+    """
+    _textures.clear()
@@ -5,14 +5,16 @@ Most of the module is contained in the class Visualiser. Creating the class crea
 
 import sys
 import platform
+import time
 
 import arcade as _arcade
 import pyglet
 
 from arcade.color import RED
 
-from ev3dev2simulator.state.world_state import WorldState
+from ev3dev2simulator.state.world_state import WorldState, WORLD_SCALE
 from ev3dev2simulator.util.dimensions import Dimensions
+from ev3dev2simulator.util.frame_profiler import FrameProfiler
 from ev3dev2simulator.util.instance_checker import InstanceChecker
 from ev3dev2simulator.util.point import Point
 from ev3dev2simulator.visualisation.sidebar import Sidebar
@@ -25,16 +27,20 @@ class Visualiser(_arcade.Window):
     """
     Main simulator class.
     This class extends from arcade.Window and manages the updates and rendering of the simulator window.
+    The world is updated at the fixed frame rate of the configuration, independent of how often the window is drawn:
+    every tick of the window simulates the frames that are due since the previous tick, and drawing shows the latest
+    one. A minimized window is not drawn, while the world keeps being updated.
     """
 
     def __init__(self, update_world_cb, world_state: WorldState, show_fullscreen: bool,
-                 show_maximized: bool, use_second_screen_to_show_simulator: bool):
+                 show_maximized: bool, use_second_screen_to_show_simulator: bool, profiler: FrameProfiler = None):
 
         instance_checker = InstanceChecker(self)
         instance_checker.check_for_unique_instance()
 
         self.update_callback = update_world_cb
         self.world_state = world_state
+        self.profiler = profiler
 
         self.current_screen_index = None
         self.set_screen_to_display_simulator_at_startup(use_second_screen_to_show_simulator)
@@ -42,27 +48,42 @@ class Visualiser(_arcade.Window):
         self.size = Dimensions(get_simulation_settings()['screen_settings']['screen_width'],
                                get_simulation_settings()['screen_settings']['screen_height'])
 
-        self.msg_counter = 0
+        self.msg_end_time = 0
+
+        exec_settings = get_simulation_settings()['exec_settings']
+        self.frame_time = 1.0 / float(exec_settings['frames_per_second'])
+        self.max_catch_up_frames = int(exec_settings['max_catch_up_frames'])
+        self.time_behind = 0.0
+        self.minimized = False
 
         screen_title = get_simulation_settings()['screen_settings']['screen_title']
         screen_info = screen_title + f'          version: {sim_version}      ev3dev2 api: {api_version}'
 
-        scale = self.determine_scale(self.size.width, self.size.height)
+        # pixels per millimeter, the world itself is in millimeters and is only scaled when drawn
+        self.view_scale = self.determine_scale(self.size.width, self.size.height)
         if DEBUG:
-            print('starting simulation with scaling', scale)
+            print('starting simulation with scaling', self.view_scale)
             print('arcade version: ', _arcade.version.VERSION)
 
-        super(Visualiser, self).__init__(self.size.width, self.size.height, screen_info, update_rate=1 / 30,
+        super(Visualiser, self).__init__(self.size.width, self.size.height, screen_info, update_rate=1 / 120,
                                          fullscreen=show_fullscreen,
                                          resizable=True, screen=_arcade.get_screens()[self.current_screen_index])
+        # the window is drawn after every tick, waiting for the display limits the ticks to its refresh rate
+        self.set_vsync(True)
 
         icon1 = pyglet.image.load(r'assets/images/body.png')
         self.set_icon(icon1)
         _arcade.set_background_color(get_simulation_settings()['screen_settings']['background_color'])
 
         self.sidebar = self._setup_sidebar()
-        self.world_state.setup_pymunk_shapes(scale)
-        self.world_state.setup_visuals(scale)
+        self.world_state.setup_pymunk_shapes(WORLD_SCALE)
+        self.world_state.setup_sensing(WORLD_SCALE)
+        self.world_state.setup_visuals(WORLD_SCALE)
+
+        if profiler is not None:
+            profiler.instrument(self, 'draw_static_obstacles', 'draw static obstacles')
+            profiler.instrument(self, 'draw_sprites', 'draw sprites')
+            profiler.instrument(self, 'draw_sidebar', 'draw sidebar')
 
         if show_maximized:
             self.maximize()
@@ -93,8 +114,7 @@ class Visualiser(_arcade.Window):
         return scale
 
     def _change_scale(self, new_screen_width, new_screen_height):
-        scale = self.determine_scale(new_screen_width, new_screen_height)
-        self.world_state.rescale(scale)
+        self.view_scale = self.determine_scale(new_screen_width, new_screen_height)
 
     def _setup_sidebar(self):
         sidebar_width = get_simulation_settings()['screen_settings']['side_bar_width']
@@ -114,19 +134,49 @@ class Visualiser(_arcade.Window):
         self.sidebar = self._setup_sidebar()
         super().on_resize(width, height)
 
+    def on_hide(self):
+        """ This method is automatically called when the window is minimized. """
+        self.minimized = True
+
+    def on_show(self):
+        """ This method is automatically called when the window is shown again. """
+        self.minimized = False
+
     def on_draw(self):
         """
-        Render the simulation.
+        Render the simulation, unless the window is minimized.
         """
+        if self.minimized:
+            return
 
         _arcade.start_render()
 
-        for obstacle_list in self.world_state.static_obstacles:
-            for shape in obstacle_list.get_shapes():
-                if shape.line_width == 1:
-                    shape.draw()
-                else:
-                    print(shape)
+        # the world is drawn in millimeters, the sidebar and messages in pixels
+        self.set_viewport(0, self.width / self.view_scale, 0, self.height / self.view_scale)
+        self.draw_static_obstacles()
+        self.draw_sprites()
+        self.set_viewport(0, self.width, 0, self.height)
+
+        now = time.monotonic()
+        if now >= self.msg_end_time and self.world_state.get_falling_robots():
+            self.msg_end_time = now + 3
+
+        self.draw_sidebar()
+        if now < self.msg_end_time:
+            _arcade.draw_text(get_simulation_settings()['screen_settings']['falling_message'], self._msg_x,
+                              self.size.height - 100, _arcade.color.RADICAL_RED, 14, anchor_x="center")
+
+    def draw_static_obstacles(self):
+        """
+        Draw the batched shapes of the static obstacles, like the board, lakes and tiles.
+        """
+        for shape_list in self.world_state.static_shape_lists:
+            shape_list.draw()
+
+    def draw_sprites(self):
+        """
+        Draw the sprites of the movable obstacles and the robots.
+        """
         self.world_state.sprite_list.draw()
 
         for robot in self.world_state.get_robots():
@@ -140,27 +190,36 @@ class Visualiser(_arcade.Window):
                             shape.draw()
                     robot.debug_shapes.clear()
 
-            if robot.is_falling() and self.msg_counter <= 0:
-                self.msg_counter = get_simulation_settings()['exec_settings']['frames_per_second'] * 3
-
+    def draw_sidebar(self):
+        """
+        Draw the sidebar with the values of the robots and, when profiling, the durations of the stages of a frame.
+        """
         for robot in self.world_state.get_robots():
             self.sidebar.add_robot_info(robot.name, robot.values, robot.sounds)
+        if self.profiler is not None:
+            self.sidebar.set_profile_lines(self.profiler.get_lines())
 
         self.sidebar.draw()
-        if self.msg_counter > 0:
-            self.msg_counter -= 1
-            _arcade.draw_text(get_simulation_settings()['screen_settings']['falling_message'], self._msg_x,
-                              self.size.height - 100, _arcade.color.RADICAL_RED, 14, anchor_x="center")
 
     def update(self, delta_time):
         """
         All the logic to move the robot. Collision detection is also performed.
-        Callback to WorldSimulator.update is called
+        Callback to WorldSimulator.update is called once for every frame that is due since the previous tick.
+        When the frames fall behind by more than max_catch_up_frames, e.g. after a slow draw, the frames beyond
+        it are dropped, so the simulation slows down instead of spending ever longer catching up.
         """
-        self.update_callback()
+        self.time_behind += delta_time
+        frames = int(self.time_behind / self.frame_time)
+        if frames > self.max_catch_up_frames:
+            frames = self.max_catch_up_frames
+            self.time_behind = frames * self.frame_time
+        self.time_behind -= frames * self.frame_time
+
+        for _ in range(frames):
+            self.update_callback()
 
     def on_mouse_press(self, x: float, y: float, button: int, modifiers: int):
-        self.world_state.set_object_at_position_as_selected((x, y))
+        self.world_state.set_object_at_position_as_selected((x / self.view_scale, y / self.view_scale))
 
     def on_mouse_release(self, x: float, y: float, button: int,
                          modifiers: int):
@@ -168,7 +227,7 @@ class Visualiser(_arcade.Window):
 
     def on_mouse_drag(self, x: float, y: float, dx: float, dy: float, buttons: int, modifiers: int):
         if buttons == _arcade.MOUSE_BUTTON_LEFT:
-            self.world_state.move_selected_object(dx, dy)
+            self.world_state.move_selected_object(dx / self.view_scale, dy / self.view_scale)
         if buttons == _arcade.MOUSE_BUTTON_RIGHT:
             self.world_state.rotate_selected_object(dy)
 
@@ -0,0 +1,52 @@
+import unittest
+from unittest.mock import MagicMock
+
+from ev3dev2simulator.batch.batch_recorder import BatchRecorder
+from ev3dev2simulator.config.config import load_config
+from ev3dev2simulator.state.headless_runner import HeadlessRunner
+from ev3dev2simulator.state.sim_clock import SimClock
+from ev3dev2simulator.state.world_simulator import WorldSimulator
+from ev3dev2simulator.state.world_state import WorldState
+from tests.ev3dev2.simulator.state.test_WorldState import TestWorldState
+
+load_config(None)
+
+
+class TestBatchRecorder(unittest.TestCase):
+    def create_recorder(self, trace_interval):
+        world_state = WorldState(TestWorldState().default_config())
+        world_simulator = WorldSimulator(world_state, SimClock(frame_time=0.1))
+        runner = HeadlessRunner(world_simulator)
+        runner.frame_time = 0
+        return runner, BatchRecorder(world_simulator, trace_interval)
+
+    def test_record(self):
+        runner, recorder = self.create_recorder(0.2)
+        robot = recorder.robots[0]
+        robot.sensors[(0, 'ev3-ports:in1')] = MagicMock()
+        robot.sensors[(0, 'ev3-ports:in1')].get_latest_value.return_value = (1, 2)
+
+        runner.run(4, recorder.record)
+
+        results = recorder.serialize()['test_bot']
+        self.assertEqual(results['falls'], 1)
+        self.assertEqual(results['collisions'], 0)
+        self.assertEqual(results['sensor_traces'], {'0:ev3-ports:in1': [[0.2, [1, 2]], [0.4, [1, 2]]]})
+        self.assertEqual(results['final_pose'], {'x': robot.last_pos.x, 'y': robot.last_pos.y,
+                                                 'angle': robot.last_angle})
+
+    def test_count_collisions_of_robot(self):
+        _, recorder = self.create_recorder(0.1)
+        robot = recorder.robots[0]
+
+        arbiter = MagicMock()
+        arbiter.shapes = [robot.parts[0].shape, MagicMock()]
+        self.assertTrue(recorder._on_collision(arbiter, None, None))
+        arbiter.shapes = [MagicMock(), MagicMock()]
+        self.assertTrue(recorder._on_collision(arbiter, None, None))
+
+        self.assertEqual(recorder.serialize()['test_bot']['collisions'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
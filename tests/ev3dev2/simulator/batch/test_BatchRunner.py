@@ -0,0 +1,120 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from ev3dev2simulator.batch.batch_job import BatchJob, run_job
+from ev3dev2simulator.batch.batch_runner import parse_args, create_jobs
+from ev3dev2simulator.batch.replay import replay
+from ev3dev2simulator.connection import virtual_time
+
+DRIVE_PROGRAM = '''
+from time import sleep
+from ev3dev2.motor import MoveTank, OUTPUT_A, OUTPUT_D
+
+tank = MoveTank(OUTPUT_A, OUTPUT_D)
+tank.on(30, 30)
+sleep(2)
+tank.off()
+'''
+
+
+class TestBatchRunner(unittest.TestCase):
+    def test_create_jobs(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, 'jobs.json'), 'w') as stream:
+                json.dump([{'program': 'a.py', 'world': 'config_small', 'sim_timeout': 10}], stream)
+
+            args = parse_args(['jobs.json', '-p', 'a.py', '-p', 'b.py', '-w', 'config_small', '--sim-timeout', '20'])
+            jobs = create_jobs(args, directory)
+            in_process_jobs = create_jobs(parse_args(['-p', 'a.py', '-w', 'config_small', '--in-process',
+                                                      '--seed', '3']), directory)
+
+        self.assertEqual([job.name for job in jobs], ['a-config_small', 'a-config_small-2', 'b-config_small'])
+        self.assertEqual([job.sim_timeout for job in jobs], [10, 20, 20])
+        self.assertEqual(jobs[0].program, os.path.join(directory, 'a.py'))
+        self.assertEqual(jobs[0].log_file, os.path.join(directory, 'batch_results', 'a-config_small.log'))
+        self.assertEqual(jobs[0].command_log_file,
+                         os.path.join(directory, 'batch_results', 'a-config_small.commands.jsonl'))
+        self.assertFalse(jobs[0].in_process)
+        self.assertEqual(jobs[0].seed, 0)
+        self.assertTrue(in_process_jobs[0].in_process)
+        self.assertEqual(in_process_jobs[0].seed, 3)
+
+    def test_run_job(self):
+        with tempfile.TemporaryDirectory() as directory:
+            program = os.path.join(directory, 'drive.py')
+            with open(program, 'w') as stream:
+                stream.write(DRIVE_PROGRAM)
+
+            result = run_job(BatchJob('drive', program, 'config_small', 10, 60, 1.0, directory))
+
+        self.assertEqual(result['status'], 'finished')
+        self.assertEqual(result['return_code'], 0)
+        self.assertAlmostEqual(result['sim_time'], 2.0)
+        robot = result['robots']['robot0']
+        self.assertAlmostEqual(robot['final_pose']['x'], 250)
+        self.assertGreater(robot['final_pose']['y'], 322.5 + 200)  # starts at center_y + 22.5 in config_small
+        self.assertEqual(len(robot['sensor_traces']['0:ev3-ports:in2']), 2)
+
+    def test_run_job_in_process(self):
+        with tempfile.TemporaryDirectory() as directory:
+            program = os.path.join(directory, 'drive.py')
+            with open(program, 'w') as stream:
+                stream.write(DRIVE_PROGRAM + 'print("done")\n')
+
+            job = BatchJob('drive', program, 'config_small', 10, 60, 1.0, directory,
+                           os.path.join(directory, 'drive.log'), True)
+            result = run_job(job)
+            with open(job.log_file) as stream:
+                log = stream.read()
+
+        self.assertEqual(result['status'], 'finished')
+        self.assertEqual(result['return_code'], 0)
+        self.assertAlmostEqual(result['sim_time'], 2.0)
+        robot = result['robots']['robot0']
+        self.assertAlmostEqual(robot['final_pose']['x'], 250)
+        self.assertGreater(robot['final_pose']['y'], 322.5 + 200)
+        self.assertIn('done', log)
+        self.assertIs(time.sleep, virtual_time.WALL_SLEEP)
+
+    def test_replay_job(self):
+        with tempfile.TemporaryDirectory() as directory:
+            program = os.path.join(directory, 'drive.py')
+            with open(program, 'w') as stream:
+                stream.write('import random\n' + DRIVE_PROGRAM.replace('tank.on(30, 30)',
+                                                                         'tank.on(random.randint(10, 50), 30)'))
+            command_log_file = os.path.join(directory, 'drive.commands.jsonl')
+
+            results = [run_job(BatchJob('drive', program, 'config_small', 10, 60, 1.0, directory, None, in_process,
+                                        seed, command_log_file)) for in_process, seed in [(False, 1), (True, 1)]]
+            replayed = replay(command_log_file)
+            other_seed = run_job(BatchJob('drive', program, 'config_small', 10, 60, 1.0, directory, None, True, 2))
+
+        self.assertEqual(results[0]['trajectory_hash'], results[1]['trajectory_hash'])
+        self.assertEqual(replayed['frames'], results[1]['frames'])
+        self.assertEqual(replayed['trajectory_hash'], results[1]['trajectory_hash'])
+        self.assertEqual(replayed['recorded_trajectory_hash'], results[1]['trajectory_hash'])
+        self.assertNotEqual(other_seed['trajectory_hash'], results[1]['trajectory_hash'])
+
+    def test_run_job_in_process_timeout(self):
+        with tempfile.TemporaryDirectory() as directory:
+            program = os.path.join(directory, 'wait.py')
+            with open(program, 'w') as stream:
+                stream.write('import time\nwhile True:\n    time.sleep(1)\n')
+
+            result = run_job(BatchJob('wait', program, 'config_small', 2, 60, 1.0, directory, None, True))
+
+        self.assertEqual(result['status'], 'sim_timeout')
+        self.assertIsNone(result['return_code'])
+        self.assertAlmostEqual(result['sim_time'], 2.0)
+
+    def test_run_job_with_unknown_world(self):
+        result = run_job(BatchJob('none', 'none.py', 'no_such_world', 10, 60, 1.0, os.getcwd()))
+        self.assertEqual(result['status'], 'error')
+        self.assertIn('FileNotFoundError', result['error'])
+
+
+if __name__ == '__main__':
+    unittest.main()
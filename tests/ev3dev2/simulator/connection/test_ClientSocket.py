@@ -1,10 +1,18 @@
+import os
 import socket
 import threading
 import unittest
+from unittest.mock import MagicMock, patch
 
 
 from ev3dev2simulator.config.config import get_simulation_settings, load_config
+from ev3dev2simulator.connection import wire_protocol
+from ev3dev2simulator.connection.client_socket import ClientSocket, PORT_ENVIRONMENT_VARIABLE
+from ev3dev2simulator.connection.server_sockets import ServerSockets
 from ev3dev2simulator.connection.message.rotate_command import RotateCommand
+from ev3dev2simulator.state.robot_simulator import RobotSimulator
+from ev3dev2simulator.state.robot_state import RobotState
+from tests.ev3dev2.simulator.state import test_RobotState
 
 
 class TestClientSocket(unittest.TestCase):
@@ -22,6 +30,8 @@ class TestClientSocket(unittest.TestCase):
             server_sock.bind(('localhost', port))
             server_sock.listen(5)
             (client, address) = server_sock.accept()
+            wire_protocol.receive_frame(client)  # handshake
+            client.sendall(wire_protocol.encode_response('brick-left'))
             while True:
                 data = client.recv(128)
                 if data:
@@ -37,7 +47,6 @@ class TestClientSocket(unittest.TestCase):
         server_thread = threading.Thread(target=self.run_fake_server)
         server_thread.start()
 
-        msg_length = get_simulation_settings()['exec_settings']['message_size']
         from ev3dev2simulator.connection.client_socket import get_client_socket
         sock = get_client_socket()
 
@@ -45,20 +54,42 @@ class TestClientSocket(unittest.TestCase):
         sock.send_command(command)
 
         ser = sock.serialize(command)
-        unpadded = (b'{"type": "RotateCommand", "address": "test_port", "speed": 500.0, "distance": 100.0, '
-                    b'"stop_action": "hold"}')
+        body = ser[wire_protocol.FRAME_HEADER.size:]
+        self.assertEqual(wire_protocol.FRAME_HEADER.unpack_from(ser)[0], len(body))
+        self.assertEqual(wire_protocol.decode_message(body), command.serialize())
 
-        expected = unpadded.ljust(msg_length, b'#')
-        self.assertEqual(ser, expected)
-
-        ser = b'{"value": 15}'
-        deser = sock.deserialize(ser)
+        ser = wire_protocol.encode_response(15)
+        deser = sock.deserialize(ser[wire_protocol.FRAME_HEADER.size:])
         self.assertEqual(deser, 15)
 
         sock.client.send(str.encode('close_test_server'))
         sock.client.close()
         server_thread.join()
 
+    def test_subscribe_sensor(self):
+        state = RobotState(test_RobotState.TestRobotState.default_config())
+        state.setup_pymunk_shapes(1)
+        robot_sim = RobotSimulator(state)
+        robot_sim._sync_physics_sprites = MagicMock()
+        robot_sim.robot.sensors[(0, 'ev3-ports:in4')].get_latest_value = MagicMock(return_value=42)
+
+        server = ServerSockets(MagicMock(robot_simulators=[robot_sim], clock=robot_sim.clock), 0)
+        server.setDaemon(True)
+        server.start()
+        server.listening.wait()
+
+        with patch.dict(os.environ, {PORT_ENVIRONMENT_VARIABLE: str(server.port)}):
+            sock = ClientSocket()
+
+        self.assertTrue(sock.subscribe_sensor('ev3-ports:in4'))
+        self.assertFalse(sock.subscribe_sensor('ev3-ports:in9'))  # responses still arrive after subscribing
+        robot_sim.update()
+        self.assertEqual(sock.sensor_cache.get('ev3-ports:in4'), 42)
+
+        sock.client.close()
+        server.stop()
+        server.join(1)
+        self.assertFalse(server.is_alive())
 
 
 if __name__ == '__main__':
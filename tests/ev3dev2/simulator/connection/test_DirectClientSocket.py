@@ -0,0 +1,70 @@
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from ev3dev2simulator.config.config import load_config
+from ev3dev2simulator.connection import virtual_time
+from ev3dev2simulator.connection.direct_client_socket import DirectClientSocket
+from ev3dev2simulator.connection.message.config_request import ConfigRequest
+from ev3dev2simulator.connection.message.rotate_command import RotateCommand
+from ev3dev2simulator.connection.message.time_request import TimeRequest
+from ev3dev2simulator.state.robot_simulator import RobotSimulator
+from ev3dev2simulator.state.robot_state import RobotState
+from ev3dev2simulator.state.sim_clock import SimClock
+from tests.ev3dev2.simulator.state import test_RobotState
+
+
+class TestDirectClientSocket(unittest.TestCase):
+    def setUp(self):
+        load_config(None)
+        state = RobotState(test_RobotState.TestRobotState.default_config())
+        state.setup_pymunk_shapes(1)
+        self.robot_sim = RobotSimulator(state)
+        self.robot_sim._sync_physics_sprites = MagicMock()
+
+    def test_send_command(self):
+        client = DirectClientSocket(self.robot_sim, 0, 'brick-left')
+        self.assertEqual(self.robot_sim.clock.connected, 1)
+
+        run_time = client.send_command(RotateCommand('ev3-ports:outA', 100, 50, 'hold'), True)
+        self.assertGreater(run_time, 0)
+        self.assertEqual(len(self.robot_sim.actuator_profiles[(0, 'ev3-ports:outA')]), 1)
+        self.assertIsNone(client.send_command(RotateCommand('ev3-ports:outA', 100, 50, 'hold')))
+
+        kwargs = {'address': 'ev3-ports:outB'}
+        self.assertEqual(client.send_command(ConfigRequest(kwargs, 'tacho-motor'), True), 'ev3-ports:outB')
+        self.assertEqual(kwargs, {'address': 'ev3-ports:outB'})
+
+        client.close()
+        self.assertEqual(self.robot_sim.clock.connected, 0)
+        self.assertEqual(len(self.robot_sim.actuator_profiles[(0, 'ev3-ports:outA')]), 0)
+        with self.assertRaises(ConnectionError):
+            client.send_command(TimeRequest(), True)
+
+    def test_subscribe_sensor(self):
+        sensor = self.robot_sim.robot.sensors[(0, 'ev3-ports:in4')]
+        sensor.get_latest_value = MagicMock(return_value=7)
+
+        client = DirectClientSocket(self.robot_sim, 0, 'brick-left')
+        self.assertTrue(client.subscribe_sensor('ev3-ports:in4'))
+        self.robot_sim.update()
+        self.assertEqual(client.sensor_cache.get('ev3-ports:in4'), 7)
+
+        client.close()
+        self.assertEqual(self.robot_sim.update_listeners, [])
+        self.assertEqual(self.robot_sim.subscribed_sensors, set())
+
+    def test_lockstep(self):
+        self.robot_sim.clock = SimClock(lockstep=True, frame_time=0.5)
+        client = DirectClientSocket(self.robot_sim, 0, 'brick-left')
+        try:
+            self.assertIs(virtual_time.get_virtual_time().client_socket, client)
+            self.assertFalse(client.subscribe_sensor('ev3-ports:in4'))
+        finally:
+            client.close()
+        self.assertIsNone(virtual_time.get_virtual_time())
+        self.assertIs(time.sleep, virtual_time.WALL_SLEEP)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,7 +6,10 @@ from ev3dev2simulator.state.message_processor import MessageProcessor
 from ev3dev2simulator.connection.message.data_request import DataRequest
 from ev3dev2simulator.connection.message.led_command import LedCommand
 from ev3dev2simulator.connection.message.rotate_command import RotateCommand
+from ev3dev2simulator.connection.message.sleep_request import SleepRequest
 from ev3dev2simulator.connection.message.sound_command import SoundCommand
+from ev3dev2simulator.connection.message.time_request import TimeRequest
+from ev3dev2simulator.state.sim_clock import SimClock
 
 from tests.ev3dev2.simulator.connection.test_ServerSocket import create_robot_sim
 
@@ -213,6 +216,38 @@ class MessageProcessorTest(unittest.TestCase):
 
         self.assertEqual(value, 10)
 
+    def test_process_data_request_lockstep(self):
+        robot_sim = create_robot_sim()
+        robot_sim.clock = SimClock(lockstep=True)
+        robot_sim.robot.values[(1, 'ev3-ports:in4')] = 10
+        robot_sim.evaluated_steps[(1, 'ev3-ports:in4')] = robot_sim.step  # already evaluated this frame
+
+        message_processor = MessageProcessor(1, robot_sim)
+        value = message_processor.process_data_request(DataRequest('ev3-ports:in4'))
+
+        self.assertEqual(value, 10)
+
+    def test_process_time_and_sleep_request(self):
+        robot_sim = create_robot_sim()
+        message_processor = MessageProcessor(0, robot_sim)
+        self.assertIsNone(message_processor.process_time_request(TimeRequest()))
+
+        robot_sim.clock = SimClock(lockstep=True, frame_time=0.5)
+        robot_sim.clock.connect()
+        self.assertEqual(message_processor.process_time_request(TimeRequest()), 0)
+
+        result = []
+        sleeper = threading.Thread(
+            target=lambda: result.append(message_processor.process_sleep_request(SleepRequest(1))))
+        sleeper.start()
+        for _ in range(2):
+            self.assertTrue(robot_sim.clock.wait_for_clients(1))
+            robot_sim.clock.advance()
+        sleeper.join(1)
+
+        self.assertEqual(result, [1.0])
+        self.assertEqual(message_processor.process_time_request(TimeRequest()), 1.0)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,33 @@
+import threading
+import unittest
+
+from ev3dev2simulator.connection.sensor_cache import SensorCache
+
+
+class TestSensorCache(unittest.TestCase):
+    def test_get_waits_for_value(self):
+        cache = SensorCache()
+        result = []
+        reader = threading.Thread(target=lambda: result.append(cache.get('ev3-ports:in1')))
+        reader.start()
+
+        cache.update({'ev3-ports:in2': 1})
+        cache.update({'ev3-ports:in1': 5})
+        reader.join(1)
+
+        self.assertEqual(result, [5])
+        cache.update({'ev3-ports:in1': 6})
+        self.assertEqual(cache.get('ev3-ports:in1'), 6)
+
+    def test_get_after_close(self):
+        cache = SensorCache()
+        cache.update({'ev3-ports:in1': 5})
+        cache.close()
+
+        self.assertEqual(cache.get('ev3-ports:in1'), 5)
+        with self.assertRaises(ConnectionError):
+            cache.get('ev3-ports:in2')
+
+
+if __name__ == '__main__':
+    unittest.main()
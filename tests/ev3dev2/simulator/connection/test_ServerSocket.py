@@ -1,12 +1,17 @@
-import json
+import asyncio
+import socket
 import threading
 import unittest
+from unittest.mock import MagicMock
 # based on scaling_multiplier: 0.60
 from typing import Any
 
 from ev3dev2simulator.config.config import get_simulation_settings, load_config
+from ev3dev2simulator.connection import wire_protocol
 from ev3dev2simulator.connection.client_socket_handler import ClientSocketHandler
+from ev3dev2simulator.connection.message.subscribe_request import SubscribeRequest
 from ev3dev2simulator.state.robot_simulator import RobotState, RobotSimulator
+from tests.ev3dev2.simulator.state import test_RobotState
 
 load_config(None)
 
@@ -139,6 +144,40 @@ class ServerSocketTest(unittest.TestCase):
 
         self.assertEqual(val, 10)
 
+    def test_push_subscribed_sensor_values(self):
+        state = RobotState(test_RobotState.TestRobotState.default_config())
+        state.setup_pymunk_shapes(1)
+        robot_sim = RobotSimulator(state)
+        robot_sim._sync_physics_sprites = MagicMock()
+        robot_sim.robot.sensors[(0, 'ev3-ports:in4')].get_latest_value = MagicMock(return_value=42)
+
+        handler = ClientSocketHandler(robot_sim, 0, 'left_brick')
+        client, server_end = socket.socketpair()
+        loop = asyncio.new_event_loop()
+
+        async def connect_and_subscribe():
+            reader, writer = await asyncio.open_connection(sock=server_end)
+            handling = asyncio.ensure_future(handler.handle(reader, writer, None))
+
+            client.sendall(wire_protocol.encode_message(SubscribeRequest(['ev3-ports:in4']).serialize()))
+            response = await loop.run_in_executor(None, wire_protocol.receive_frame, client)
+            robot_sim.update()
+            handler.push_sensor_values()
+            snapshot = await loop.run_in_executor(None, wire_protocol.receive_frame, client)
+
+            client.close()
+            await handling
+            return response, snapshot
+
+        response, snapshot = loop.run_until_complete(connect_and_subscribe())
+        loop.close()
+
+        self.assertTrue(wire_protocol.decode_response(response))
+        self.assertTrue(wire_protocol.is_snapshot(snapshot))
+        self.assertEqual(wire_protocol.decode_snapshot(snapshot), {'ev3-ports:in4': 42})
+        self.assertFalse(handler.is_connected)
+        self.assertEqual(robot_sim.subscribed_sensors, set())
+
     @staticmethod
     def _deserialize(data: bytes) -> Any:
         """
@@ -147,10 +186,7 @@ class ServerSocketTest(unittest.TestCase):
         :return: any type representing value inside the data.
         """
 
-        val = data.decode()
-        obj_dict = json.loads(val)
-
-        return obj_dict['value']
+        return wire_protocol.decode_response(data[wire_protocol.FRAME_HEADER.size:])
 
 
 if __name__ == '__main__':
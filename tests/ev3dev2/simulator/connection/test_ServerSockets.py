@@ -1,10 +1,66 @@
+import os
+import time
 import unittest
+from unittest.mock import MagicMock, patch
 
+from ev3dev2simulator.config.config import load_config
+from ev3dev2simulator.connection.client_socket import ClientSocket, PORT_ENVIRONMENT_VARIABLE, \
+    ROBOT_ENVIRONMENT_VARIABLE, BRICK_ENVIRONMENT_VARIABLE
+from ev3dev2simulator.connection.server_sockets import ServerSockets
+from ev3dev2simulator.state.robot_simulator import RobotSimulator
+from ev3dev2simulator.state.robot_state import RobotState
+from ev3dev2simulator.state.sim_clock import SimClock
+from tests.ev3dev2.simulator.state import test_RobotState
+
+
+def create_robot_sim(name, clock):
+    config = test_RobotState.TestRobotState.default_config()
+    config['name'] = name
+    return RobotSimulator(RobotState(config), clock)
+
+
+class ServerSocketsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        load_config(None)
 
-class ServerSockets(unittest.TestCase):
     def test_something(self):
         self.assertEqual(True, True)
 
+    def test_connect_bricks_by_handshake(self):
+        clock = SimClock()
+        robot_sims = [create_robot_sim('first', clock), create_robot_sim('second', clock)]
+        world_simulator = MagicMock(robot_simulators=robot_sims, clock=clock)
+        server = ServerSockets(world_simulator, 0)
+        server.setDaemon(True)
+        server.start()
+        server.listening.wait()
+        port = {PORT_ENVIRONMENT_VARIABLE: str(server.port)}
+
+        with patch.dict(os.environ, {**port, ROBOT_ENVIRONMENT_VARIABLE: 'second',
+                                     BRICK_ENVIRONMENT_VARIABLE: 'brick-left'}):
+            second = ClientSocket()
+            self.assertRaises(ConnectionError, ClientSocket)  # the brick is taken
+        with patch.dict(os.environ, {**port, ROBOT_ENVIRONMENT_VARIABLE: 'third'}):
+            self.assertRaises(ConnectionError, ClientSocket)
+        with patch.dict(os.environ, port):
+            first = ClientSocket()
+
+        self.assertEqual([handler.is_connected for handler in server.handlers.values()], [True, True])
+        self.assertEqual(clock.connected, 2)
+
+        first.client.close()
+        second.client.close()
+        for _ in range(100):
+            if world_simulator.request_reset.called:
+                break
+            time.sleep(0.01)
+        world_simulator.request_reset.assert_called_once()
+        self.assertEqual(clock.connected, 0)
+
+        server.stop()
+        server.join(1)
+        self.assertFalse(server.is_alive())
+
 
 if __name__ == '__main__':
     unittest.main()
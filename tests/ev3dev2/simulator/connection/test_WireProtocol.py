@@ -0,0 +1,85 @@
+import socket
+import threading
+import unittest
+
+from ev3dev2simulator.connection import wire_protocol
+from ev3dev2simulator.connection.message.config_request import ConfigRequest
+from ev3dev2simulator.connection.message.data_request import DataRequest
+from ev3dev2simulator.connection.message.led_command import LedCommand
+from ev3dev2simulator.connection.message.rotate_command import RotateCommand
+from ev3dev2simulator.connection.message.sleep_request import SleepRequest
+from ev3dev2simulator.connection.message.sound_command import SoundCommand
+from ev3dev2simulator.connection.message.stop_command import StopCommand
+from ev3dev2simulator.connection.message.subscribe_request import SubscribeRequest
+from ev3dev2simulator.connection.message.time_request import TimeRequest
+
+
+def body_of(data: bytes) -> bytes:
+    return data[wire_protocol.FRAME_HEADER.size:]
+
+
+class TestWireProtocol(unittest.TestCase):
+    def test_encode_decode_messages(self):
+        messages = [
+            RotateCommand('ev3-ports:outA', 500.0, 100.5, 'hold'),
+            StopCommand('ev3-ports:outB', -20.0, 'coast'),
+            RotateCommand('ev3-ports:outD', 100.0, 360.0, None),
+            SoundCommand('A long message ' * 40, 2.5, 'speak'),
+            LedCommand('led0:red:brick-status', 0.5),
+            DataRequest('ev3-ports:in1'),
+            ConfigRequest({'driver_name': ['lego-ev3-color'], 'address': None}, 'color-sensor'),
+            TimeRequest(),
+            SleepRequest(0.25),
+            SubscribeRequest(['ev3-ports:in1', 'ev3-ports:in2']),
+        ]
+        for message in messages:
+            data = wire_protocol.encode_message(message.serialize())
+            self.assertEqual(wire_protocol.FRAME_HEADER.unpack_from(data)[0], len(body_of(data)))
+            self.assertEqual(wire_protocol.decode_message(body_of(data)), message.serialize())
+
+    def test_encode_decode_responses(self):
+        for value in [None, True, False, 0, -12, 2550, 1.25, 'ev3-ports:in1', '', [1, 2, 3], {'a': 1}, 2 ** 70]:
+            data = wire_protocol.encode_response(value)
+            decoded = wire_protocol.decode_response(body_of(data))
+            self.assertEqual(decoded, value)
+            self.assertEqual(type(decoded), type(value))
+
+        self.assertEqual(wire_protocol.decode_response(body_of(wire_protocol.encode_response((1, 2)))), [1, 2])
+
+    def test_encode_decode_snapshot(self):
+        values = {'ev3-ports:in1': 5, 'ev3-ports:in2': 25.5, 'ev3-ports:in3': True, 'ev3-ports:in4': (1, 2, 3)}
+        body = body_of(wire_protocol.encode_snapshot(values))
+
+        self.assertTrue(wire_protocol.is_snapshot(body))
+        self.assertFalse(wire_protocol.is_snapshot(body_of(wire_protocol.encode_response(5))))
+        self.assertEqual(wire_protocol.decode_snapshot(body), {**values, 'ev3-ports:in4': [1, 2, 3]})
+
+    def test_receive_split_frames(self):
+        sender, receiver = socket.socketpair()
+        data = b''.join(wire_protocol.encode_response(value) for value in ['first', 42, 'x' * 1000])
+
+        def send_in_pieces():
+            for start in range(0, len(data), 3):
+                sender.sendall(data[start:start + 3])
+            sender.close()
+
+        thread = threading.Thread(target=send_in_pieces)
+        thread.start()
+        values = [wire_protocol.decode_response(wire_protocol.receive_frame(receiver)) for _ in range(3)]
+        self.assertIsNone(wire_protocol.receive_frame(receiver))
+        thread.join()
+        receiver.close()
+
+        self.assertEqual(values, ['first', 42, 'x' * 1000])
+
+    def test_receive_truncated_frame(self):
+        sender, receiver = socket.socketpair()
+        sender.sendall(wire_protocol.encode_response('truncated')[:-2])
+        sender.close()
+        with self.assertRaises(ConnectionError):
+            wire_protocol.receive_frame(receiver)
+        receiver.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
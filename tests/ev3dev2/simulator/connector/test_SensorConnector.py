@@ -27,6 +27,7 @@ class SensorConnectorTest(unittest.TestCase):
         self.get_device_client_socketMock.return_value = self.deviceClientSocketMock
 
         self.clientSocketMock = MagicMock()
+        self.clientSocketMock.subscribe_sensor.return_value = False  # requests values, as in lockstep mode
         self.get_client_socketMock.return_value = self.clientSocketMock
 
     def test_color_sensor(self):
@@ -36,14 +37,14 @@ class SensorConnectorTest(unittest.TestCase):
         sensor = ColorSensor(INPUT_2)
         val = sensor.color
         self.assertEqual(val, 3)
-        self.assertEqual(len(self.clientSocketMock.mock_calls), 1)
-        fn_name, args, kwargs = self.clientSocketMock.mock_calls[0]
+        self.assertEqual(len(self.clientSocketMock.mock_calls), 2)
+        fn_name, args, kwargs = self.clientSocketMock.mock_calls[1]
         self.assertEqual(fn_name, 'send_command')
         self.assertDictEqual(args[0].serialize(),
                              {'type': 'DataRequest', 'address': 'ev3-ports:in2'})
 
         val2 = sensor.value()
-        self.assertEqual(len(self.clientSocketMock.mock_calls), 1)
+        self.assertEqual(len(self.clientSocketMock.mock_calls), 2)
         self.assertEqual(val, val2)
 
         val = sensor.rgb
@@ -70,16 +71,29 @@ class SensorConnectorTest(unittest.TestCase):
         val = sensor.value()
         self.assertEqual(val, 1)
         self.assertTrue(isinstance(val, int))
-        self.assertEqual(len(self.clientSocketMock.mock_calls), 1)
-        fn_name, args, kwargs = self.clientSocketMock.mock_calls[0]
+        self.assertEqual(len(self.clientSocketMock.mock_calls), 2)
+        fn_name, args, kwargs = self.clientSocketMock.mock_calls[1]
         self.assertEqual(fn_name, 'send_command')
         self.assertDictEqual(args[0].serialize(),
                              {'type': 'DataRequest', 'address': 'ev3-ports:in1'})
 
         val2 = sensor.value()
-        self.assertEqual(len(self.clientSocketMock.mock_calls), 1)
+        self.assertEqual(len(self.clientSocketMock.mock_calls), 2)
         self.assertEqual(val, val2)
 
+    def test_subscribed_sensor(self):
+        self.deviceClientSocketMock.send_command.return_value = 'ev3-ports:in1'
+        self.clientSocketMock.subscribe_sensor.return_value = True
+        self.clientSocketMock.sensor_cache.get.return_value = True
+
+        sensor = TouchSensor(INPUT_1)
+        self.assertEqual(sensor.value(), 1)
+        self.assertEqual(sensor.value(), 1)
+
+        self.clientSocketMock.subscribe_sensor.assert_called_once_with('ev3-ports:in1')
+        self.clientSocketMock.send_command.assert_not_called()
+        self.clientSocketMock.sensor_cache.get.assert_called_with('ev3-ports:in1')
+
 
 if __name__ == '__main__':
     unittest.main()
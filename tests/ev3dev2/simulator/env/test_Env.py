@@ -0,0 +1,81 @@
+import unittest
+
+import numpy as np
+
+from ev3dev2simulator.env.env import Env
+
+
+class TestEnv(unittest.TestCase):
+    def test_reset(self):
+        env = Env()
+        observation = env.reset(0)
+
+        self.assertEqual(observation.dtype, np.float32)
+        self.assertEqual(len(observation), len(env.observation_names))
+        self.assertEqual(env.observation_names[-3:], ['x', 'y', 'angle'])
+        np.testing.assert_allclose(observation[-3:], [250, 322.5, 0], atol=1e-3)
+        self.assertIsNotNone(env.left_motor)
+        self.assertIsNotNone(env.right_motor)
+
+    def test_step_forward(self):
+        env = Env(frames_per_step=5)
+        start = env.reset(0)
+        observation, reward, done, info = env.step((300, 300))
+
+        self.assertGreater(observation[-2], start[-2])
+        self.assertAlmostEqual(observation[-3], start[-3], places=3)
+        self.assertEqual(reward, 0.0)
+        self.assertFalse(done)
+        self.assertAlmostEqual(info['time'], 5 * env.world_simulator.clock.frame_time)
+
+    def test_deterministic(self):
+        env = Env(start_noise=(10, 5))
+        observations = []
+        for _ in range(2):
+            env.reset(3)
+            for _ in range(50):
+                observation, _, _, _ = env.step((200, -100))
+            observations.append(observation)
+        np.testing.assert_array_equal(observations[0], observations[1])
+        self.assertFalse(np.array_equal(env.reset(4), env.reset(3)))
+
+    def test_done_when_falling(self):
+        env = Env(frames_per_step=10)
+        env.reset(0)
+        done = False
+        for _ in range(100):
+            _, _, done, _ = env.step((900, 900))
+            if done:
+                break
+        self.assertTrue(done)
+
+        observation = env.reset()
+        np.testing.assert_allclose(observation[-3:], [250, 322.5, 0], atol=1e-3)
+
+    def test_snapshot_and_restore(self):
+        env = Env()
+        env.reset(0)
+        for _ in range(20):
+            env.step((300, 100))
+        state = env.snapshot()
+
+        observations = []
+        for _ in range(2):
+            restored = env.restore(state)
+            self.assertEqual(env.steps, 20)
+            for _ in range(50):
+                observation, _, _, _ = env.step((-200, 300, 100))
+            observations.append(observation)
+        np.testing.assert_array_equal(observations[0], observations[1])
+        np.testing.assert_array_equal(env.restore(state), restored)
+
+    def test_reward_function(self):
+        env = Env(reward_function=lambda env: env.steps * 2.0)
+        env.reset(0)
+        env.step((0, 0))
+        _, reward, _, _ = env.step((0, 0))
+        self.assertEqual(reward, 4.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
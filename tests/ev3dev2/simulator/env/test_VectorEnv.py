@@ -0,0 +1,68 @@
+import unittest
+
+import numpy as np
+
+from ev3dev2simulator.env.env import Env
+from ev3dev2simulator.env.vector_env import VectorEnv
+
+
+class TestVectorEnv(unittest.TestCase):
+    def test_shared_lookups(self):
+        vector_env = VectorEnv(3)
+        first = vector_env.envs[0].world_state
+        for env in vector_env.envs[1:]:
+            self.assertIsNot(env.world_state.space, first.space)
+            self.assertIs(env.world_state.color_lookup, first.color_lookup)
+            self.assertIs(env.world_state.falling_lookup, first.falling_lookup)
+
+    def test_same_as_env(self):
+        vector_env = VectorEnv(3, start_noise=(10, 5))
+        envs = [Env(start_noise=(10, 5)) for _ in range(3)]
+        observations = vector_env.reset(7)
+        self.assertEqual(observations.shape, (3, len(vector_env.observation_names)))
+        np.testing.assert_array_equal(observations, [env.reset(7 + index) for index, env in enumerate(envs)])
+
+        actions = np.random.default_rng(0).uniform(-900, 900, (300, 3, 2))
+        for step_actions in actions:
+            observations, rewards, dones, infos = vector_env.step(step_actions)
+            for index, env in enumerate(envs):
+                observation, reward, done, info = env.step(step_actions[index])
+                self.assertEqual(dones[index], done)
+                self.assertEqual(rewards[index], reward)
+                self.assertAlmostEqual(infos[index]['time'], info['time'])
+                if done:
+                    np.testing.assert_allclose(infos[index]['terminal_observation'], observation, atol=1e-3)
+                    observation = env.reset()
+                np.testing.assert_allclose(observations[index], observation, atol=1e-3)
+
+    def test_reset_when_done(self):
+        vector_env = VectorEnv(2, frames_per_step=10)
+        start = vector_env.reset(0)
+        dones = np.zeros(2, dtype=bool)
+        for _ in range(100):
+            observations, _, dones, infos = vector_env.step([(900, 900), (0, 0)])
+            if dones.any():
+                break
+        np.testing.assert_array_equal(dones, [True, False])
+        self.assertIn('terminal_observation', infos[0])
+        self.assertNotIn('terminal_observation', infos[1])
+        np.testing.assert_allclose(observations[0], start[0], atol=1e-3)
+
+    def test_processes(self):
+        vector_env = VectorEnv(3, start_noise=(10, 5))
+        sharded_env = VectorEnv(3, start_noise=(10, 5), processes=2)
+        try:
+            self.assertEqual(len(sharded_env.workers), 2)
+            np.testing.assert_array_equal(sharded_env.reset(1), vector_env.reset(1))
+            for _ in range(20):
+                results = vector_env.step([(300, 100), (100, 300), (-200, 200)])
+                sharded_results = sharded_env.step([(300, 100), (100, 300), (-200, 200)])
+                for result, sharded_result in zip(results[:3], sharded_results[:3]):
+                    np.testing.assert_array_equal(result, sharded_result)
+        finally:
+            sharded_env.close()
+        self.assertEqual(sharded_env.workers, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,7 @@
 import unittest
 from unittest.mock import MagicMock
 
-from pymunk import Space
+from pymunk import Body, Space
 
 from ev3dev2simulator.config.config import load_config
 from ev3dev2simulator.robotpart.ultrasonic_sensor_top import UltrasonicSensor
@@ -21,9 +21,8 @@ class TestUltraSonicSensor(unittest.TestCase):
         }
         robot = MagicMock()
         us = UltrasonicSensor(config, robot)
-        us.setup_pymunk_shape(1, None)
-        us.sprite = MagicMock()
-        us.sprite.angle = 0
+        robot.scale = 1
+        us.setup_pymunk_shape(1, Body(1, 1))
         space = Space()
         val = us.distance(space)
         self.assertEqual(val, 2550)
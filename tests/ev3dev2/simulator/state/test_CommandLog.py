@@ -0,0 +1,83 @@
+import os
+import tempfile
+import unittest
+
+from ev3dev2simulator.config.config import load_config
+from ev3dev2simulator.connection.message.led_command import LedCommand
+from ev3dev2simulator.connection.message.rotate_command import RotateCommand
+from ev3dev2simulator.connection.message.stop_command import StopCommand
+from ev3dev2simulator.state.command_log import CommandLog
+from ev3dev2simulator.state.message_processor import MessageProcessor
+from ev3dev2simulator.state.trajectory_hash import TrajectoryHash
+from ev3dev2simulator.state.world_simulator import WorldSimulator
+from ev3dev2simulator.state.world_state import WorldState
+from tests.ev3dev2.simulator.state import test_WorldState
+
+load_config(None)
+
+
+def create_world_simulator() -> WorldSimulator:
+    world_state = WorldState(test_WorldState.TestWorldState().default_config())
+    world_state.setup_pymunk_shapes(1)
+    return WorldSimulator(world_state)
+
+
+class TestCommandLog(unittest.TestCase):
+    def test_record_and_replay(self):
+        world_simulator = create_world_simulator()
+        command_log = CommandLog()
+        world_simulator.set_command_log(command_log)
+        processor = MessageProcessor(0, world_simulator.robot_simulators[0])
+        trajectory_hash = TrajectoryHash(world_simulator.world_state)
+
+        commands = {0: [RotateCommand('ev3-ports:outA', 300, 500, 'hold')],
+                    10: [RotateCommand('ev3-ports:outD', 200, 200, 'coast'),
+                         LedCommand('led0:red:brick-status', 1)],
+                    20: [StopCommand('ev3-ports:outA', 300, 'coast')]}
+        for frame in range(40):
+            for command in commands.get(frame, []):
+                if isinstance(command, RotateCommand):
+                    processor.process_rotate_command(command)
+                elif isinstance(command, StopCommand):
+                    processor.process_stop_command(command)
+                else:
+                    processor.process_led_command(command)
+            world_simulator.update()
+            trajectory_hash.update()
+
+        self.assertEqual([entry[0] for entry in command_log.entries], [0, 10, 10, 20])
+        self.assertEqual(command_log.entries[1][1:3], ('test_bot', 0))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'run.commands.jsonl')
+            command_log.save(path, {'frames': 40})
+            header, loaded_log = CommandLog.load(path)
+        self.assertEqual(header, {'frames': 40})
+        self.assertEqual(loaded_log.entries, command_log.entries)
+
+        replay_simulator = create_world_simulator()
+        replay_hash = TrajectoryHash(replay_simulator.world_state)
+        for _ in range(40):
+            loaded_log.apply(replay_simulator)
+            replay_simulator.update()
+            replay_hash.update()
+        self.assertEqual(replay_hash.hexdigest(), trajectory_hash.hexdigest())
+        self.assertEqual(replay_simulator.world_state.robots[0].led_colors[(0, 'led0')], 2)
+
+    def test_trajectory_hash(self):
+        hashes = []
+        for distance in [500, 500, 501]:
+            world_simulator = create_world_simulator()
+            MessageProcessor(0, world_simulator.robot_simulators[0]).process_rotate_command(
+                RotateCommand('ev3-ports:outA', 300, distance, 'hold'))
+            trajectory_hash = TrajectoryHash(world_simulator.world_state)
+            for _ in range(30):
+                world_simulator.update()
+                trajectory_hash.update()
+            hashes.append(trajectory_hash.hexdigest())
+        self.assertEqual(hashes[0], hashes[1])
+        self.assertNotEqual(hashes[0], hashes[2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+from unittest.mock import MagicMock
+
+from ev3dev2simulator.config.config import load_config
+from ev3dev2simulator.state.headless_runner import HeadlessRunner
+from ev3dev2simulator.state.world_simulator import WorldSimulator
+from ev3dev2simulator.state.world_state import WorldState, WORLD_SCALE
+from tests.ev3dev2.simulator.state.test_WorldState import TestWorldState
+
+load_config(None)
+
+
+class TestHeadlessRunner(unittest.TestCase):
+    def test_setup_and_run(self):
+        world_simulator = MagicMock()
+        world_simulator.clock.lockstep = False
+        runner = HeadlessRunner(world_simulator)
+
+        world_simulator.world_state.setup_pymunk_shapes.assert_called_once_with(WORLD_SCALE)
+        world_simulator.world_state.setup_sensing.assert_called_once_with(WORLD_SCALE)
+        world_simulator.world_state.setup_visuals.assert_not_called()
+
+        runner.frame_time = 0
+        runner.run(5)
+        self.assertEqual(world_simulator.update.call_count, 5)
+        self.assertEqual(runner.frames, 5)
+        self.assertFalse(runner.running)
+
+    def test_run_world_without_sprites(self):
+        world_state = WorldState(TestWorldState().default_config())
+        runner = HeadlessRunner(WorldSimulator(world_state))
+        runner.frame_time = 0
+        runner.run(3)
+
+        robot = world_state.robots[0]
+        self.assertIsNone(robot.sprite_list)
+        self.assertIsNone(world_state.sprite_list)
+        self.assertIsNotNone(robot.last_pos)
+        self.assertTrue(robot.is_falling())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+
+from ev3dev2simulator.state.motion_profile import MotionProfile
+
+
+class TestMotionProfile(unittest.TestCase):
+    def test_constant_segment(self):
+        profile = MotionProfile(1.5, 3)
+        self.assertEqual(profile.duration, 3)
+        self.assertEqual([profile.job_at(frame) for frame in range(-1, 4)], [None, 1.5, 1.5, 1.5, None])
+
+    def test_coast_down(self):
+        profile = MotionProfile(1.0, 2, 4, 0.3)
+        jobs = [profile.job_at(frame) for frame in range(7)]
+        self.assertEqual(jobs[:2], [1.0, 1.0])
+        for job, expected in zip(jobs[2:6], [0.7, 0.4, 0.1, 0]):
+            self.assertAlmostEqual(job, expected)
+        self.assertIsNone(jobs[6])
+
+    def test_coast_down_negative(self):
+        profile = MotionProfile(-1.0, 0, 2, 0.6)
+        self.assertAlmostEqual(profile.job_at(0), -0.4)
+        self.assertEqual(profile.job_at(1), 0)
+
+    def test_message(self):
+        profile = MotionProfile('hello', 2)
+        self.assertEqual([profile.job_at(frame) for frame in range(3)], ['hello', 'hello', None])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+import numpy as np
+
+from ev3dev2simulator.config.config import load_config
+from ev3dev2simulator.obstacle.tile import Tile
+from ev3dev2simulator.state.obstacle_grid import ObstacleGrid
+from ev3dev2simulator.state.obstacle_raster import NO_OBSTACLE
+from ev3dev2simulator.state.world_state import WorldState
+from ev3dev2simulator.util.dimensions import Dimensions
+from ev3dev2simulator.util.point import Point
+from tests.ev3dev2.simulator.state.test_ObstacleRaster import first_collided
+from tests.ev3dev2.simulator.state.test_WorldState import TestWorldState
+
+load_config(None)
+
+
+class TestObstacleGrid(unittest.TestCase):
+    def test_same_obstacles_as_testing_in_order(self):
+        world_state = WorldState(TestWorldState().default_config())
+        world_state.setup_sensing(0.5)
+        for obstacles in [world_state.color_obstacles, world_state.falling_obstacles]:
+            grid = ObstacleGrid(obstacles, world_state.board_width, world_state.board_height, 0.5, 50)
+
+            for x in range(-20, 640, 3):
+                for y in range(-20, 640, 3):
+                    self.assertIs(grid.get_obstacle(x, y), first_collided(obstacles, x, y))
+
+    def test_cells_hold_overlapping_obstacles_in_order(self):
+        tiles = [Tile(Point(150, 50), Dimensions(20, 20), (58, 166, 221)),
+                 Tile(Point(100, 50), Dimensions(120, 20), (201, 45, 57))]
+        for tile in tiles:
+            tile.create_points(1)
+        grid = ObstacleGrid(tiles, 300, 100, 1, 100)
+
+        self.assertEqual(grid.cells, [(1,), (0, 1), ()])
+        self.assertIs(grid.get_obstacle(150, 50), tiles[0])
+        self.assertIs(grid.get_obstacle(100, 50), tiles[1])
+        self.assertIsNone(grid.get_obstacle(250, 50))
+
+    def test_get_obstacle_indices(self):
+        tile = Tile(Point(50, 50), Dimensions(20, 20), (58, 166, 221))
+        tile.create_points(2)
+        grid = ObstacleGrid([tile], 200, 200, 2, 100)
+
+        indices = grid.get_obstacle_indices(np.array([100.0, 10.0, -5.0]), np.array([100.0, 10.0, 100.0]))
+        self.assertEqual(list(indices), [0, NO_OBSTACLE, NO_OBSTACLE])
+
+    def test_large_board_uses_grid(self):
+        config = TestWorldState().default_config()
+        config['board_width'] = 8000
+        config['board_height'] = 6000
+        world_state = WorldState(config)
+        world_state.setup_sensing(1)
+
+        self.assertIsInstance(world_state.color_lookup, ObstacleGrid)
+        self.assertIsInstance(world_state.falling_lookup, ObstacleGrid)
+        self.assertIs(world_state.color_lookup.get_obstacle(4000, 3000), world_state.color_obstacles[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
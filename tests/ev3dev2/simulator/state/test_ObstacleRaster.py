@@ -0,0 +1,69 @@
+import unittest
+
+import numpy as np
+
+from ev3dev2simulator.config.config import load_config
+from ev3dev2simulator.obstacle.tile import Tile
+from ev3dev2simulator.state.obstacle_raster import ObstacleRaster, NO_OBSTACLE
+from ev3dev2simulator.state.world_state import WorldState
+from ev3dev2simulator.util.dimensions import Dimensions
+from ev3dev2simulator.util.point import Point
+from tests.ev3dev2.simulator.state.test_WorldState import TestWorldState
+
+load_config(None)
+
+
+def first_collided(obstacles, x, y):
+    for obstacle in obstacles:
+        if obstacle.collided_with(x, y):
+            return obstacle
+    return None
+
+
+class TestObstacleRaster(unittest.TestCase):
+    def test_same_obstacles_as_testing_in_order(self):
+        world_state = WorldState(TestWorldState().default_config())
+        world_state.setup_sensing(1)
+        raster = world_state.color_lookup
+
+        for x in range(0, world_state.board_width, 5):
+            for y in range(0, world_state.board_height, 5):
+                self.assertIs(raster.get_obstacle(x + 0.5, y + 0.5),
+                              first_collided(world_state.color_obstacles, x + 0.5, y + 0.5))
+
+    def test_first_obstacle_on_top(self):
+        tiles = [Tile(Point(10, 10), Dimensions(4, 4), (58, 166, 221)),
+                 Tile(Point(12, 10), Dimensions(8, 8), (201, 45, 57))]
+        for tile in tiles:
+            tile.create_points(1)
+        raster = ObstacleRaster(tiles, 20, 20, 1)
+
+        self.assertIs(raster.get_obstacle(10.5, 10.5), tiles[0])
+        self.assertIs(raster.get_obstacle(15.5, 10.5), tiles[1])
+        self.assertIsNone(raster.get_obstacle(2.5, 2.5))
+
+    def test_outside_raster_tests_obstacles(self):
+        tile = Tile(Point(0, 0), Dimensions(10, 10), (58, 166, 221))
+        tile.create_points(1)
+        raster = ObstacleRaster([tile], 20, 20, 1)
+
+        self.assertIs(raster.get_obstacle(-2, -2), tile)
+        self.assertIsNone(raster.get_obstacle(-20, -20))
+
+    def test_get_obstacle_indices(self):
+        world_state = WorldState(TestWorldState().default_config())
+        world_state.setup_sensing(1)
+        raster = world_state.falling_lookup
+
+        x_coords = np.array([-30.0, 5.5, 397.5, 600.5, 1300.0])
+        y_coords = np.array([-30.0, 600.5, 232.5, 600.5, 600.0])
+        indices = raster.get_obstacle_indices(x_coords, y_coords)
+
+        expected = [first_collided(raster.obstacles, x, y) for x, y in zip(x_coords, y_coords)]
+        self.assertEqual([None if index == NO_OBSTACLE else raster.obstacles[index] for index in indices], expected)
+        self.assertEqual([type(obstacle).__name__ if obstacle else None for obstacle in expected],
+                         [None, 'Edge', 'Hole', 'Board', None])
+
+
+if __name__ == '__main__':
+    unittest.main()
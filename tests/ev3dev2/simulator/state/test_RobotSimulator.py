@@ -1,8 +1,12 @@
+import threading
+import time
 import unittest
 from unittest.mock import MagicMock
 
+from ev3dev2simulator.state.motion_profile import MotionProfile
 from ev3dev2simulator.state.robot_simulator import RobotSimulator
 from ev3dev2simulator.state.robot_state import RobotState
+from ev3dev2simulator.state.sim_clock import SimClock
 from tests.ev3dev2.simulator.state.test_RobotState import TestRobotState
 
 
@@ -34,12 +38,100 @@ class TestRobotSimulator(unittest.TestCase):
             arm.rotate_y = 0  # this is set in setup visuals
         sim = RobotSimulator(state)
         sim._sync_physics_sprites = MagicMock()
-        val = sim.get_value((0, 'ev3-ports:in4'))
-        self.assertEqual(val, 2550)
+        sim.robot.sensors[(0, 'ev3-ports:in4')].get_latest_value = MagicMock(return_value=2550)
+
+        result = []
+        reader = threading.Thread(target=lambda: result.append(sim.get_value((0, 'ev3-ports:in4'))))
+        reader.start()
+        while (0, 'ev3-ports:in4') not in sim.requested_sensors:
+            time.sleep(0.001)
+        self.assertEqual(result, [])  # the value is only evaluated in the next update
+
+        sim.update()
+        reader.join(1)
+        self.assertEqual(result, [2550])
         self.assertEqual(sim.locks[(0, 'ev3-ports:in4')].locked(), True)
         sim.update()
+        self.assertEqual(sim.locks[(0, 'ev3-ports:in4')].locked(), True)  # not requested again
+        sim.requested_sensors.add((0, 'ev3-ports:in4'))
+        sim.update()
         self.assertEqual(sim.locks[(0, 'ev3-ports:in4')].locked(), False)
 
+    def test_sensors_evaluated_on_request(self):
+        conf = TestRobotState.default_config()
+        state = RobotState(conf)
+        state.setup_pymunk_shapes(1)
+        sim = RobotSimulator(state)
+        sim._sync_physics_sprites = MagicMock()
+        for sensor in sim.robot.sensors.values():
+            sensor.get_latest_value = MagicMock(return_value=1)
+
+        sim.update()
+        for sensor in sim.robot.sensors.values():
+            sensor.get_latest_value.assert_not_called()
+
+        sim.requested_sensors.add((0, 'ev3-ports:in4'))
+        sim.update()
+        self.assertEqual(sim.evaluate_sensor((0, 'ev3-ports:in4')), 1)
+        sim.robot.sensors[(0, 'ev3-ports:in4')].get_latest_value.assert_called_once()  # memoised within the step
+
+        sim.evaluate_all_sensors = True
+        sim.update()
+        for sensor in sim.robot.sensors.values():
+            sensor.get_latest_value.assert_called()
+
+    def test_subscribe_sensors(self):
+        conf = TestRobotState.default_config()
+        state = RobotState(conf)
+        state.setup_pymunk_shapes(1)
+        sim = RobotSimulator(state)
+        sim._sync_physics_sprites = MagicMock()
+        sensor = sim.robot.sensors[(0, 'ev3-ports:in4')]
+        sensor.get_latest_value = MagicMock(return_value=7)
+
+        self.assertFalse(sim.subscribe_sensors([(0, 'ev3-ports:in9')]))
+        self.assertTrue(sim.subscribe_sensors([(0, 'ev3-ports:in4')]))
+        listener = MagicMock()
+        sim.update_listeners.append(listener)
+
+        sim.update()
+        sim.update()
+        self.assertEqual(sensor.get_latest_value.call_count, 2)
+        self.assertEqual(listener.call_count, 2)
+        self.assertEqual(sim.get_subscribed_values(0), {'ev3-ports:in4': 7})
+        self.assertEqual(sim.get_subscribed_values(1), {})
+
+        sim.unsubscribe_sensors_of_brick(0)
+        sim.update()
+        self.assertEqual(sensor.get_latest_value.call_count, 2)
+
+        sim.clock = SimClock(lockstep=True)
+        self.assertFalse(sim.subscribe_sensors([(0, 'ev3-ports:in4')]))
+
+    def test_actuator_profiles(self):
+        conf = TestRobotState.default_config()
+        state = RobotState(conf)
+        state.setup_pymunk_shapes(1)
+        sim = RobotSimulator(state)
+        motor = next(address for address, actuator in sim.actuator_info.items() if actuator.ev3type == 'motor')
+
+        def next_job(address):
+            return dict(sim.next_actuator_jobs())[address]
+
+        sim.set_actuator_profile(motor, MotionProfile(2, 10))
+        self.assertEqual(next_job(motor), 2)
+        sim.set_actuator_profile(motor, MotionProfile(3, 1))  # replaces the running profile
+        self.assertEqual(next_job(motor), 3)
+        self.assertIsNone(next_job(motor))
+
+        sim.add_actuator_profile(motor, MotionProfile(4, 1))
+        sim.add_actuator_profile(motor, MotionProfile(5, 2))  # starts after the previous profile
+        self.assertEqual([next_job(motor) for _ in range(4)], [4, 5, 5, None])
+
+        sim.set_actuator_profile(motor, MotionProfile(6, 100))
+        sim.clear_actuator_jobs_of_brick(motor[0])
+        self.assertIsNone(next_job(motor))
+
     def test_determine_port(self):
         conf = TestRobotState.default_config()
         state = RobotState(conf)
@@ -121,6 +121,13 @@ class TestRobotState(unittest.TestCase):
         self.assertEqual(state.body.position, Vec2d(x, y))
         self.assertEqual(state.body.velocity, Vec2d(0, 0))
 
+        state.body.center_of_gravity = (0, 10)
+        state.body.angle += 1
+        state.reset()
+        self.assertAlmostEqual(state.body.position.x, x)
+        self.assertAlmostEqual(state.body.position.y, y)
+        self.assertAlmostEqual(state.body.angle, pi)
+
     def test_execute_movement(self):
         state = RobotState(self.default_config())
         state.setup_pymunk_shapes(1)
@@ -132,6 +139,32 @@ class TestRobotState(unittest.TestCase):
         self.assertAlmostEqual(tuple(state.body.velocity)[1], -5.0 * 30, 3)  # -150 y distance per second
         self.assertEqual(state.body.angle, pi)
 
+    def test_snapshot_and_restore(self):
+        config = self.default_config()
+        config['parts'].append({
+            'name': 'measurement-probe',
+            'type': 'arm',
+            'x_offset': 15,
+            'y_offset': 102,
+            'brick': 0,
+            'port': 'ev3-ports:outB'
+        })
+        state = RobotState(config)
+        state.setup_pymunk_shapes(1)
+        state.execute_arm_movement((0, 'ev3-ports:outB'), 15)
+        state.body.velocity = (3, 4)
+        state.values[(0, 'ev3-ports:in4')] = 7
+        snapshot = state.snapshot()
+
+        state.execute_arm_movement((0, 'ev3-ports:outB'), 10)
+        state.reset()
+        state.restore(snapshot)
+
+        self.assertEqual(state.actuators[(0, 'ev3-ports:outB')].side_bar_arm.angle, 15)
+        self.assertEqual(state.body.velocity, Vec2d(3, 4))
+        self.assertEqual(state.body.angle, pi)
+        self.assertEqual(state.values, {(0, 'ev3-ports:in4'): 7})
+
     def test_arm_movement(self):
         config = self.default_config().copy()
         config['parts'].append({
@@ -151,8 +184,8 @@ class TestRobotState(unittest.TestCase):
             state.execute_arm_movement((0, 'ev3-ports:outB'), 15)
             state.actuators[(0, 'ev3-ports:outB')].side_bar_arm.degrees = 15
 
-            self.assertEqual(len(arm_instance.mock_calls), 3)  # first two have to do with a sprite list
-            fn_name, args, kwargs = arm_instance.mock_calls[2]
+            self.assertEqual(len(arm_instance.mock_calls), 1)
+            fn_name, args, kwargs = arm_instance.mock_calls[0]
             self.assertEqual(fn_name, 'rotate')
             self.assertEqual(args, (15,))
 
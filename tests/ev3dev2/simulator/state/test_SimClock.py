@@ -0,0 +1,76 @@
+import threading
+import unittest
+
+from ev3dev2simulator.config.config import load_config
+from ev3dev2simulator.state.sim_clock import SimClock
+
+load_config(None)
+
+
+class TestSimClock(unittest.TestCase):
+    def test_time(self):
+        clock = SimClock(frame_time=0.5)
+        self.assertEqual(clock.time, 0)
+        clock.advance()
+        clock.advance()
+        self.assertEqual(clock.frame, 2)
+        self.assertEqual(clock.time, 1.0)
+
+    def test_default_frame_time(self):
+        clock = SimClock()
+        self.assertAlmostEqual(clock.frame_time, 1 / 30)
+        self.assertFalse(clock.lockstep)
+
+    def test_wait_for_clients(self):
+        clock = SimClock(True, 0.5)
+        self.assertFalse(clock.wait_for_clients(0))
+
+        clock.connect()
+        self.assertFalse(clock.wait_for_clients(0))
+
+        result = []
+        sleeper = threading.Thread(target=lambda: result.append(clock.sleep(1.0)))
+        sleeper.start()
+
+        self.assertTrue(clock.wait_for_clients(1))
+        clock.advance()
+        self.assertTrue(clock.wait_for_clients(1))
+        clock.advance()
+        sleeper.join(1)
+
+        self.assertEqual(result, [1.0])
+        self.assertFalse(clock.wait_for_clients(0))
+
+        clock.disconnect()
+        self.assertEqual(clock.connected, 0)
+
+    def test_stop_wakes_up_sleeping_clients(self):
+        clock = SimClock(True, 0.5)
+        clock.connect()
+
+        result = []
+        sleeper = threading.Thread(target=lambda: result.append(clock.sleep(10)))
+        sleeper.start()
+        self.assertTrue(clock.wait_for_clients(1))
+
+        clock.stop()
+        sleeper.join(1)
+        self.assertEqual(result, [0])
+        self.assertEqual(clock.sleep(10), 0)
+
+    def test_short_sleep_takes_a_frame(self):
+        clock = SimClock(True, 0.5)
+        clock.connect()
+
+        sleeper = threading.Thread(target=clock.sleep, args=(0.1,))
+        sleeper.start()
+
+        self.assertTrue(clock.wait_for_clients(1))
+        clock.advance()
+        sleeper.join(1)
+        self.assertFalse(sleeper.is_alive())
+        self.assertFalse(clock.wait_for_clients(0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+
+from ev3dev2simulator.config.config import load_config
+from ev3dev2simulator.connection.message.rotate_command import RotateCommand
+from ev3dev2simulator.state.message_processor import MessageProcessor
+from ev3dev2simulator.state.telemetry_player import TelemetryPlayer
+from ev3dev2simulator.state.telemetry_recorder import TelemetryRecorder
+from ev3dev2simulator.state.world_simulator import WorldSimulator
+from ev3dev2simulator.state.world_state import WorldState
+from tests.ev3dev2.simulator.state import test_WorldState
+
+load_config(None)
+
+
+def create_world_state() -> WorldState:
+    world_state = WorldState(test_WorldState.TestWorldState().default_config())
+    world_state.setup_pymunk_shapes(1)
+    world_state.setup_sensing(1)
+    return world_state
+
+
+class TestTelemetryPlayer(unittest.TestCase):
+    def test_play(self):
+        world_simulator = WorldSimulator(create_world_state())
+        MessageProcessor(0, world_simulator.robot_simulators[0]).process_rotate_command(
+            RotateCommand('ev3-ports:outA', 300, 500, 'hold'))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'run.npy')
+            recorder = TelemetryRecorder(world_simulator, path)
+            world_simulator.set_telemetry_recorder(recorder)
+            poses = []
+            for _ in range(20):
+                world_simulator.update()
+                body = world_simulator.world_state.robots[0].body
+                poses.append((tuple(body.position), body.angle))
+            recorder.close()
+            recorded_robot = world_simulator.world_state.robots[0]
+
+            world_state = create_world_state()
+            player = TelemetryPlayer(world_state, path)
+            self.assertEqual(player.frames, 20)
+            robot = world_state.robots[0]
+
+            player.seek(10)
+            self.assertAlmostEqual(robot.body.position.x, poses[10][0][0])
+            self.assertAlmostEqual(robot.body.position.y, poses[10][0][1])
+            self.assertAlmostEqual(robot.body.angle, poses[10][1])
+
+            player.change_speed(4)
+            player.update()
+            self.assertEqual(player.frame_index, 14)
+            player.update()
+            player.update()
+            self.assertEqual(player.frame_index, 19)
+            self.assertTrue(player.paused)
+            self.assertEqual(robot.values, recorded_robot.values)
+            self.assertAlmostEqual(robot.body.position.x, poses[19][0][0])
+
+            player.toggle_pause()
+            self.assertEqual(player.frame_index, 0)
+            self.assertFalse(player.paused)
+            del player
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import math
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from ev3dev2simulator.config.config import load_config
+from ev3dev2simulator.connection.message.rotate_command import RotateCommand
+from ev3dev2simulator.state.message_processor import MessageProcessor
+from ev3dev2simulator.state.telemetry_recorder import TelemetryRecorder
+from ev3dev2simulator.state.world_simulator import WorldSimulator
+from ev3dev2simulator.state.world_state import WorldState
+from tests.ev3dev2.simulator.state import test_WorldState
+
+load_config(None)
+
+
+class TestTelemetryRecorder(unittest.TestCase):
+    def test_record(self):
+        world_state = WorldState(test_WorldState.TestWorldState().default_config())
+        world_state.setup_pymunk_shapes(1)
+        world_state.setup_sensing(1)
+        world_simulator = WorldSimulator(world_state)
+        MessageProcessor(0, world_simulator.robot_simulators[0]).process_rotate_command(
+            RotateCommand('ev3-ports:outA', 300, 500, 'hold'))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'run.npy')
+            recorder = TelemetryRecorder(world_simulator, path, chunk_frames=16)
+            world_simulator.set_telemetry_recorder(recorder)
+            for _ in range(40):
+                world_simulator.update()
+            recorder.close()
+
+            records = np.load(path, mmap_mode='r')
+            self.assertEqual(records.shape, (40,))
+            self.assertEqual(list(records['frame']), list(range(1, 41)))
+            self.assertAlmostEqual(records['time'][-1], world_simulator.clock.time)
+
+            robot = world_state.robots[0]
+            robot_records = records['robots']['test_bot']
+            self.assertEqual(robot_records['x'][-1], robot.body.position.x)
+            self.assertEqual(robot_records['angle'][-1], math.degrees(robot.body.angle))
+            self.assertGreater(robot_records['left_speed'][0], 0)
+            self.assertEqual(robot_records['right_speed'][0], 0)
+            for brick, address in robot.sensors:
+                self.assertEqual(robot_records[f'{brick}:{address}'][-1], robot.values[(brick, address)])
+            self.assertEqual(robot_records['falling'][-1], robot.is_falling())
+            self.assertEqual(records['obstacles'].shape, (40, len(world_state.obstacles), 3))
+            del records, robot_records
+
+
+if __name__ == '__main__':
+    unittest.main()
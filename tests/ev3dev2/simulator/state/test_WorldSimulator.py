@@ -1,8 +1,12 @@
+import pickle
 import unittest
 from unittest.mock import MagicMock
 
 from ev3dev2simulator.config.config import load_config
+from ev3dev2simulator.state.motion_profile import MotionProfile
 from ev3dev2simulator.state.world_simulator import WorldSimulator
+from ev3dev2simulator.state.world_state import WorldState
+from tests.ev3dev2.simulator.state import test_WorldState
 
 load_config(None)
 
@@ -21,6 +25,48 @@ class TestWorldSimulator(unittest.TestCase):
         world_simulator.update()
         self.assertEqual(world_simulator.robot_simulators[0].update.call_count, 1)
 
+    def test_update_substeps(self):
+        world_state_mock = MagicMock()
+        world_state_mock.robots = []
+        world_simulator = WorldSimulator(world_state_mock)
+        world_simulator.space_substeps = 4
+        world_simulator.space_step_size = 120.0
+        world_simulator.update()
+        self.assertEqual(world_state_mock.space.step.call_count, 4)
+        world_state_mock.space.step.assert_called_with(1 / 120)
+        self.assertEqual(world_simulator.clock.frame, 1)
+
+    def test_snapshot_and_restore(self):
+        world_state = WorldState(test_WorldState.TestWorldState().default_config())
+        world_state.setup_pymunk_shapes(1)
+        world_simulator = WorldSimulator(world_state)
+        robot_sim = world_simulator.robot_simulators[0]
+        robot = robot_sim.robot
+        rock = world_state.obstacles[0]
+        rock.body.velocity = (10, 0)
+        robot_sim.set_actuator_profile((0, 'ev3-ports:outA'), MotionProfile(2, 20))
+        robot_sim.set_led_color(0, 'led0', 3)
+        for _ in range(5):
+            world_simulator.update()
+
+        state = pickle.loads(pickle.dumps(world_simulator.snapshot()))
+        position = robot.body.position
+        rock_position = rock.body.position
+        rock_velocity = rock.body.velocity
+        for _ in range(5):
+            world_simulator.update()
+        robot_sim.clear_actuator_jobs((0, 'ev3-ports:outA'))
+        robot_sim.set_led_color(0, 'led0', 1)
+
+        world_simulator.restore(state)
+        self.assertEqual(world_simulator.clock.frame, 5)
+        self.assertEqual(robot.body.position, position)
+        self.assertEqual(rock.body.position, rock_position)
+        self.assertEqual(rock.body.velocity, rock_velocity)
+        self.assertEqual(robot.led_colors[(0, 'led0')], 3)
+        self.assertEqual(len(robot_sim.actuator_profiles[(0, 'ev3-ports:outA')]), 1)
+        self.assertEqual(robot_sim.actuator_frame, 5)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import Mock, patch
 
 from ev3dev2simulator.config.config import load_config
 from ev3dev2simulator.state.world_state import WorldState
@@ -116,6 +117,37 @@ class TestWorldState(unittest.TestCase):
         world_state.set_object_at_position_as_selected((25000, 25000))  # this should not exist
         self.assertEqual(world_state.selected_object, None)
 
+    def test_get_falling_robots(self):
+        world_state = WorldState(self.default_config())
+        world_state.setup_pymunk_shapes(1)
+        world_state.setup_sensing(1)
+        robot = world_state.robots[0]
+        self.assertEqual(world_state.get_falling_robots(), [robot])  # starts in the corner
+
+        robot.body.position = (600, 600)
+        self.assertEqual(world_state.get_falling_robots(), [])
+        self.assertFalse(robot.is_falling())
+
+        robot.body.position = (457, 232)  # one wheel in the hole of the lake
+        self.assertEqual(world_state.get_falling_robots(), [robot])
+        self.assertTrue(robot.is_falling())
+
+    def test_batch_static_shapes(self):
+        world_state = WorldState(self.default_config())
+        board, edge, lake = world_state.static_obstacles
+        tiles = [Mock(get_shapes=Mock(return_value=[Mock(mode=4, line_width=1)])) for _ in range(3)]
+        world_state.static_obstacles.extend(tiles)
+        board.get_shapes = Mock(return_value=[Mock(mode=4, line_width=1)])
+        lake.get_shapes = Mock(return_value=[Mock(mode=6, line_width=1), Mock(mode=6, line_width=3)])
+
+        with patch('arcade.ShapeElementList', list):
+            shape_lists = world_state._batch_static_shapes()
+
+        # consecutive shapes of the same mode share a list, so the lake stays between the board and the tiles
+        self.assertEqual(shape_lists, [board.get_shapes(), lake.get_shapes()[:1],
+                                       [tile.get_shapes()[0] for tile in tiles]])
+        self.assertEqual(edge.get_shapes(), [])
+
 
 
 
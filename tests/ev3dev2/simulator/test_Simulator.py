@@ -27,7 +27,12 @@ class TestSimulator(unittest.TestCase):
                               'simulation_file': 'config_small',
                               'show_on_second_monitor': False,
                               'fullscreen': False,
-                              'maximized': False
+                              'maximized': False,
+                              'headless': False,
+                              'lockstep': False,
+                              'replay': None,
+                              'profile': False,
+                              'profile_csv': None
                               })
 
     def test_single_dash_parsing(self):
@@ -37,7 +42,12 @@ class TestSimulator(unittest.TestCase):
                               'simulation_file': 'config_test',
                               'show_on_second_monitor': True,
                               'fullscreen': True,
-                              'maximized': True
+                              'maximized': True,
+                              'headless': False,
+                              'lockstep': False,
+                              'replay': None,
+                              'profile': False,
+                              'profile_csv': None
                               })
 
     def test_double_dash_parsing(self):
@@ -48,7 +58,12 @@ class TestSimulator(unittest.TestCase):
                               'simulation_file': 'config_test',
                               'show_on_second_monitor': True,
                               'fullscreen': True,
-                              'maximized': True
+                              'maximized': True,
+                              'headless': False,
+                              'lockstep': False,
+                              'replay': None,
+                              'profile': False,
+                              'profile_csv': None
                               })
 
     def test_main_print_version(self):
@@ -63,7 +78,7 @@ class TestSimulator(unittest.TestCase):
     def test_main(self):
         testargs = ['name']
         with patch.object(sys, 'argv', testargs):
-            with patch('ev3dev2simulator.simulator.Visualiser') as VisualiserMock:
+            with patch('ev3dev2simulator.visualisation.visualiser.Visualiser') as VisualiserMock:
                 with patch('ev3dev2simulator.simulator.ServerSockets') as serverSocketsMock:
                     sockets_instance = serverSocketsMock.return_value
                     main(None)
@@ -71,7 +86,7 @@ class TestSimulator(unittest.TestCase):
                     self.assertEqual(len(VisualiserMock.mock_calls), 2)
                     fn_name, args, kwargs = VisualiserMock.mock_calls[0]
                     self.assertEqual(fn_name, '')
-                    self.assertEqual(args[2:], (False, False, False))  # the first two are functions
+                    self.assertEqual(args[2:], (False, False, False, None))  # the first two are functions
 
                     self.assertEqual(len(sockets_instance.mock_calls), 2)
 
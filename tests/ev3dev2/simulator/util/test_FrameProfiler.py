@@ -0,0 +1,51 @@
+import csv
+import os
+import tempfile
+import unittest
+
+from ev3dev2simulator.env.env import Env
+from ev3dev2simulator.util.frame_profiler import FrameProfiler
+
+
+class TestFrameProfiler(unittest.TestCase):
+    def test_instrument_world(self):
+        env = Env()
+        env.reset()
+        world_simulator = env.world_simulator
+        robot_sim = env.robot_sim
+        robot_sim.evaluate_all_sensors = True
+
+        profiler = FrameProfiler()
+        profiler.instrument_world(world_simulator)
+        for _ in range(10):
+            env.step((200, 100))
+
+        self.assertEqual(profiler.frames, 10)
+        results = {stage: (calls, total, mean, maximum) for stage, calls, total, mean, maximum
+                   in profiler.get_results()}
+        self.assertEqual(profiler.get_results()[0][0], 'frame')
+        for stage in ['space.step', 'obstacle sprites', 'next_actuator_jobs', 'execute_movement', 'robot sprites']:
+            self.assertEqual(results[stage][0], 10)
+        sensor_stages = [stage for stage in results if stage.startswith('sensor ')]
+        self.assertIn('sensor ColorSensor', sensor_stages)
+        # evaluated in every update and requested again, from the cache, for the observation of every step
+        self.assertEqual(sum(results[stage][0] for stage in sensor_stages), 20 * len(robot_sim.robot.sensors))
+        self.assertLessEqual(results['space.step'][1], results['frame'][1])
+        self.assertEqual(len(profiler.get_lines()), len(results))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'profile.csv')
+            profiler.write_csv(path)
+            with open(path) as stream:
+                rows = list(csv.reader(stream))
+        self.assertEqual(rows[0], ['stage', 'calls', 'total_ms', 'mean_ms_per_frame', 'max_ms'])
+        self.assertEqual(rows[1][:2], ['frame', '10'])
+
+        profiler.remove()
+        env.step((200, 100))
+        self.assertEqual(profiler.frames, 10)
+        self.assertNotIn('update', vars(world_simulator))
+
+
+if __name__ == '__main__':
+    unittest.main()
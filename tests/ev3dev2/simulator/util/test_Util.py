@@ -1,7 +1,12 @@
 import unittest
 from math import hypot
 
-from ev3dev2simulator.util.util import get_circle_points, calc_differential_steering_angle_x_y
+import numpy as np
+import pymunk
+
+from ev3dev2simulator.util.util import get_circle_points, calc_differential_steering_angle_x_y, \
+    get_rectangle_points, is_point_in_polygon, are_points_in_polygon, get_bounding_box, get_body_state, \
+    set_body_state
 
 
 class UtilTest(unittest.TestCase):
@@ -16,6 +21,27 @@ class UtilTest(unittest.TestCase):
 
         self.assertEqual(len(points), 66)
 
+    def test_get_rectangle_points(self):
+        points = get_rectangle_points(10, 20, 4, 6)
+
+        self.assertEqual(points, [(8, 17), (8, 23), (12, 23), (12, 17)])
+
+    def test_get_rectangle_points_tilted(self):
+        points = get_rectangle_points(0, 0, 4, 2, 90)
+
+        for (x, y), (expected_x, expected_y) in zip(points, [(1, -2), (-1, -2), (-1, 2), (1, 2)]):
+            self.assertAlmostEqual(x, expected_x)
+            self.assertAlmostEqual(y, expected_y)
+
+    def test_is_point_in_polygon(self):
+        points = get_rectangle_points(10, 20, 4, 6)
+
+        self.assertTrue(is_point_in_polygon(10, 20, points))
+        self.assertTrue(is_point_in_polygon(11.9, 22.9, points))
+        self.assertFalse(is_point_in_polygon(12.1, 20, points))
+        self.assertFalse(is_point_in_polygon(10, 16.9, points))
+        self.assertFalse(is_point_in_polygon(10, 20, []))
+
     def test_pythagoras(self):
         result = hypot(2, 3)
         self.assertAlmostEqual(result, 3.606, 3)
@@ -29,5 +55,25 @@ class UtilTest(unittest.TestCase):
         self.assertAlmostEqual(diff_y, 1.199, 3)
 
 
+    def test_are_points_in_polygon(self):
+        points = get_circle_points(3, 4, 10) + get_rectangle_points(0, 0, 6, 4, 30)
+        xs, ys = np.meshgrid(np.linspace(-10, 15, 51), np.linspace(-8, 16, 49))
+        inside = are_points_in_polygon(xs, ys, points)
+        for x, y, expected in zip(xs.flat, ys.flat, inside.flat):
+            self.assertEqual(is_point_in_polygon(x, y, points), expected)
+
+    def test_get_bounding_box(self):
+        self.assertEqual(get_bounding_box(get_rectangle_points(10, 20, 4, 6)), (8, 17, 12, 23))
+        self.assertIsNone(get_bounding_box([]))
+
+    def test_body_state(self):
+        body = pymunk.Body(1, 1)
+        body.center_of_gravity = (0, 10)
+        state = (5, 6, 0.5, 1, 2, 0.1)
+        set_body_state(body, state)
+        for value, expected in zip(get_body_state(body), state):
+            self.assertAlmostEqual(value, expected)
+
+
 if __name__ == '__main__':
     unittest.main()
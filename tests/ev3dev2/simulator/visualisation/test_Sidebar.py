@@ -1,10 +1,12 @@
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
+
+from PIL import Image
 
 from ev3dev2simulator.state.robot_state import RobotState
 from ev3dev2simulator.util.dimensions import Dimensions
 from ev3dev2simulator.util.point import Point
-from ev3dev2simulator.visualisation.sidebar import Sidebar
+from ev3dev2simulator.visualisation.sidebar import Sidebar, MAX_STALE_TEXTURES
 from tests.ev3dev2.simulator.state.test_RobotState import TestRobotState
 
 class MyTestCase(unittest.TestCase):
@@ -32,6 +34,55 @@ class MyTestCase(unittest.TestCase):
         self.assertEqual(sidebar.robot_info[state.name][(0, 'ev3-ports:in4')]['value'], 5)
         self.assertEqual(sidebar.robot_info[state.name][(0, 'speaker')]['value'], 'test_sound')
 
+    def test_draw_cached_lines(self):
+        conf = TestRobotState.default_config()
+        state = RobotState(conf)
+
+        sidebar = Sidebar(Point(100, 150), Dimensions(200, 300))
+        sidebar.init_robot(state.name, state.sensors, state.bricks, [])
+        sidebar.text_sprites = MagicMock()
+        key = (state.name, (0, 'ev3-ports:in4'))
+
+        with patch('arcade.get_text_image', side_effect=lambda text, *_: Image.new('RGBA', (len(text), 10))):
+            sidebar.add_robot_info(state.name, {(0, 'ev3-ports:in4'): 5}, {})
+            sidebar.draw()
+            sprite = sidebar.text_lines[key][1]
+            texture = sprite.texture
+            sidebar.draw()
+            self.assertIs(sprite.texture, texture)
+
+            sidebar.add_robot_info(state.name, {(0, 'ev3-ports:in4'): 6}, {})
+            sidebar.draw()
+            self.assertIsNot(sprite.texture, texture)
+            self.assertTrue(sidebar.text_lines[key][0].endswith(': 6'))
+
+            sidebar.next_refresh = float('inf')
+            sidebar.add_robot_info(state.name, {(0, 'ev3-ports:in4'): 7.5}, {})
+            sidebar.draw()
+            self.assertTrue(sidebar.text_lines[key][0].endswith(': 6'))
+            sidebar.next_refresh = 0
+            sidebar.draw()
+            self.assertTrue(sidebar.text_lines[key][0].endswith(': 7.50'))
+
+    def test_draw_bounded_textures(self):
+        conf = TestRobotState.default_config()
+        state = RobotState(conf)
+
+        sidebar = Sidebar(Point(100, 150), Dimensions(200, 300))
+        sidebar.init_robot(state.name, state.sensors, state.bricks, [])
+        sidebar.text_sprites = MagicMock()
+
+        with patch('arcade.get_text_image', side_effect=lambda text, *_: Image.new('RGBA', (len(text), 10))), \
+                patch('arcade.SpriteList', side_effect=MagicMock) as sprite_list_mock:
+            for step in range(10 * MAX_STALE_TEXTURES):
+                sidebar.next_refresh = 0
+                sidebar.add_robot_info(state.name, {(0, 'ev3-ports:in4'): step / 10}, {})
+                sidebar.set_profile_lines([f'frame: {step / 100:.2f} ms'])
+                sidebar.draw()
+                self.assertLessEqual(len(sidebar.text_textures), len(sidebar.text_lines) + MAX_STALE_TEXTURES)
+
+        self.assertGreaterEqual(sprite_list_mock.call_count, 9)
+
 
 if __name__ == '__main__':
     unittest.main()
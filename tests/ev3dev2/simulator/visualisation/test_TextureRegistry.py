@@ -0,0 +1,32 @@
+import os
+import unittest
+
+from ev3dev2simulator.visualisation.texture_registry import get_texture, clear_textures
+
+IMAGE_DIR = os.path.join(os.path.dirname(__file__), '..', '..', '..', '..', 'ev3dev2simulator', 'assets', 'images')
+
+
+class TestTextureRegistry(unittest.TestCase):
+
+    def tearDown(self):
+        clear_textures()
+
+    def test_get_texture_shared(self):
+        path = os.path.join(IMAGE_DIR, 'wheel.png')
+        texture = get_texture(path)
+
+        self.assertGreater(texture.width, 0)
+        self.assertIs(get_texture(path), texture)
+        self.assertIs(get_texture(os.path.join(IMAGE_DIR, '..', 'images', 'wheel.png')), texture)
+        self.assertIsNot(get_texture(os.path.join(IMAGE_DIR, 'arm.png')), texture)
+
+    def test_clear_textures(self):
+        path = os.path.join(IMAGE_DIR, 'wheel.png')
+        texture = get_texture(path)
+        clear_textures()
+
+        self.assertIsNot(get_texture(path), texture)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -39,6 +39,30 @@ class TestVisualiser(unittest.TestCase):
         vis.update_current_screen()  # only checking if it does not crash at the moment
         vis.on_draw()
 
+    def test_update_fixed_frames(self):
+        vis = MagicMock()
+        vis.frame_time = 0.1
+        vis.max_catch_up_frames = 5
+        vis.time_behind = 0.0
+
+        Visualiser.update(vis, 0.05)
+        self.assertEqual(vis.update_callback.call_count, 0)
+        Visualiser.update(vis, 0.26)
+        self.assertEqual(vis.update_callback.call_count, 3)
+        self.assertAlmostEqual(vis.time_behind, 0.01)
+
+        Visualiser.update(vis, 2.0)
+        self.assertEqual(vis.update_callback.call_count, 8)
+        self.assertAlmostEqual(vis.time_behind, 0.0)
+
+    def test_draw_minimized(self):
+        vis = MagicMock()
+        Visualiser.on_hide(vis)
+        Visualiser.on_draw(vis)
+        vis.draw_sprites.assert_not_called()
+        Visualiser.on_show(vis)
+        self.assertFalse(vis.minimized)
+
 
 if __name__ == '__main__':
     unittest.main()